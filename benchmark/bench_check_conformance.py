@@ -0,0 +1,61 @@
+"""
+批量一致性检查微基准：check_conformance / filter_conforming vs 逐个 isinstance。
+
+运行：uv run python benchmark/bench_check_conformance.py
+"""
+
+import timeit
+from types import new_class
+from typing import Any, Callable, Protocol
+
+from protocolx.check_conformance import check_conformance, filter_conforming
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+
+REPEAT = 5
+MEMBERS = 4
+
+
+def _make_protocols() -> list[type]:
+    def body(index: int) -> Callable[[dict[str, Any]], None]:
+        def exec_body(ns: dict[str, Any]) -> None:
+            ns[f"m{index}"] = lambda self: None
+
+        return exec_body
+
+    return [new_class(f"P{i}", (Protocol,), exec_body=body(i)) for i in range(MEMBERS)]
+
+
+def _make_objects(count: int, kinds: int) -> list[object]:
+    # 一半类型实现全部成员，另一半缺一个成员
+    types = []
+    for k in range(kinds):
+        implemented = MEMBERS if k % 2 == 0 else MEMBERS - 1
+        members = {f"m{i}": (lambda self: None) for i in range(implemented)}
+        types.append(type(f"Impl{k}", (), members))
+    return [types[i % kinds]() for i in range(count)]
+
+
+def _best_ms(stmt: Callable[[], object]) -> float:
+    return min(timeit.repeat(stmt, number=1, repeat=REPEAT)) * 1e3
+
+
+def main() -> None:
+    for runtime in (True, "compiled"):
+        proto = compose_protocol(ProtocolSequence(_make_protocols()), runtime=runtime)
+        for count in (10_000, 100_000):
+            objects = _make_objects(count, kinds=8)
+            loop = _best_ms(lambda: [isinstance(obj, proto) for obj in objects])
+            batch = _best_ms(lambda: check_conformance(objects, proto))
+            subset = _best_ms(lambda: filter_conforming(objects, proto))
+            print(
+                f"runtime={runtime!s:<9} n={count:>7}  "
+                f"isinstance loop {loop:8.2f} ms  "
+                f"check_conformance {batch:7.2f} ms  "
+                f"filter_conforming {subset:7.2f} ms  "
+                f"speedup {loop / batch:5.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
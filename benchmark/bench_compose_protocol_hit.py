@@ -0,0 +1,47 @@
+"""
+compose_protocol 缓存命中延迟微基准：一级直接键缓存 vs 虚拟模块注册表。
+
+运行：uv run python benchmark/bench_compose_protocol_hit.py
+"""
+
+import importlib
+import timeit
+from types import new_class
+from typing import Callable, Protocol
+
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+
+compose_protocol_module = importlib.import_module("protocolx.compose_protocol")
+
+NUMBER = 200_000
+REPEAT = 5
+
+
+def _make_protocols(count: int) -> list[type]:
+    return [new_class(f"P{i}", (Protocol,)) for i in range(count)]
+
+
+def _best_ns(stmt: Callable[[], object]) -> float:
+    timer = timeit.Timer(stmt)
+    return min(timer.repeat(repeat=REPEAT, number=NUMBER)) / NUMBER * 1e9
+
+
+def main() -> None:
+    for size in (1, 4, 16):
+        protocols = _make_protocols(size)
+        bases = ProtocolSequence(protocols)
+        compose_protocol(bases, runtime=True)
+
+        primary = _best_ns(lambda: compose_protocol(bases, runtime=True))
+        registry = _best_ns(
+            lambda: compose_protocol_module._compose_via_registry(bases, True)
+        )
+        print(
+            f"size={size:>3}  primary hit: {primary:8.1f} ns  "
+            f"registry hit: {registry:8.1f} ns  speedup: {registry / primary:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
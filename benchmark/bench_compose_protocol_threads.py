@@ -0,0 +1,57 @@
+"""
+compose_protocol 并发压力基准：1 / 8 / 32 线程下的吞吐量。
+
+每轮先清空缓存，所有线程在同一组组合上混合冷启动与热命中，
+同时校验每个组合在所有线程中得到的都是同一个类对象。
+
+运行：uv run python benchmark/bench_compose_protocol_threads.py
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import combinations
+from types import new_class
+from typing import Protocol
+
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_cache import clear_protocol_cache
+
+CALLS_PER_THREAD = 20_000
+PROTOCOLS = [new_class(f"P{i}", (Protocol,)) for i in range(8)]
+SEQUENCES = [ProtocolSequence(c) for c in combinations(PROTOCOLS, 3)]
+
+
+def _run(thread_count: int) -> float:
+    clear_protocol_cache()
+    barrier = threading.Barrier(thread_count)
+
+    def worker(offset: int) -> list[type]:
+        barrier.wait()
+        seen: list[type] = []
+        for i in range(CALLS_PER_THREAD):
+            seq = SEQUENCES[(i + offset) % len(SEQUENCES)]
+            seen.append(compose_protocol(seq, runtime=True))
+        return seen[: len(SEQUENCES)]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(thread_count) as pool:
+        results = list(pool.map(worker, range(thread_count)))
+    elapsed = time.perf_counter() - start
+
+    for offset, seen in enumerate(results):
+        for i, cls in enumerate(seen):
+            seq = SEQUENCES[(i + offset) % len(SEQUENCES)]
+            assert cls is compose_protocol(seq, runtime=True)
+    return thread_count * CALLS_PER_THREAD / elapsed
+
+
+def main() -> None:
+    for thread_count in (1, 8, 32):
+        throughput = _run(thread_count)
+        print(f"threads={thread_count:>2}  throughput: {throughput:12,.0f} calls/s")
+
+
+if __name__ == "__main__":
+    main()
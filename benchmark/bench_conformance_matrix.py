@@ -0,0 +1,81 @@
+"""
+类型 × 协议一致性矩阵微基准：conformance_matrix（numpy / python 位集）
+vs 逐对 issubclass。
+
+运行：uv run python benchmark/bench_conformance_matrix.py
+"""
+
+import random
+import timeit
+from types import new_class
+from typing import Any, Callable, Protocol
+
+from protocolx.checker.conformance_cache import invalidate_conformance_cache
+from protocolx.compose_protocol import compose_protocol
+from protocolx.conformance_matrix import conformance_matrix, np
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_cache import clear_protocol_cache
+
+MEMBERS = 64
+PROTOCOLS_PER_CONTRACT = 4
+REPEAT = 3
+
+
+def _make_protocols() -> list[type]:
+    def body(index: int) -> Callable[[dict[str, Any]], None]:
+        def exec_body(ns: dict[str, Any]) -> None:
+            ns[f"m{index}"] = lambda self: None
+
+        return exec_body
+
+    return [new_class(f"P{i}", (Protocol,), exec_body=body(i)) for i in range(MEMBERS)]
+
+
+def _best_ms(stmt: Callable[[], object]) -> float:
+    return min(timeit.repeat(stmt, number=1, repeat=REPEAT)) * 1e3
+
+
+def main() -> None:
+    rng = random.Random(0)
+    protocols = _make_protocols()
+    for n_types, n_contracts in ((100, 50), (1000, 200)):
+        clear_protocol_cache()
+        contracts = [
+            compose_protocol(
+                ProtocolSequence(rng.sample(protocols, PROTOCOLS_PER_CONTRACT)),
+                runtime=True,
+            )
+            for _ in range(n_contracts)
+        ]
+        types = [
+            type(
+                f"Plugin{i}",
+                (),
+                {f"m{k}": (lambda self: None) for k in rng.sample(range(MEMBERS), 24)},
+            )
+            for i in range(n_types)
+        ]
+
+        # 逐对判定（清空一致性缓存以模拟启动时的首次判定）
+        def naive_matrix() -> list[list[bool]]:
+            invalidate_conformance_cache()
+            return [[issubclass(tp, c) for c in contracts] for tp in types]
+
+        naive = _best_ms(naive_matrix)
+        python = _best_ms(
+            lambda: conformance_matrix(types, contracts, backend="python")
+        )
+        line = (
+            f"types={n_types:>5} contracts={n_contracts:>4}  "
+            f"issubclass {naive:9.2f} ms  python {python:8.2f} ms"
+        )
+        if np is not None:
+            numpy = _best_ms(
+                lambda: conformance_matrix(types, contracts, backend="numpy")
+            )
+            line += f"  numpy {numpy:8.2f} ms"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+冷启动组合耗时：动态创建 vs 导入预组合模块。
+
+在全新子进程中分别测量：
+- dynamic：逐个 compose_protocol 动态创建；
+- precomposed：导入 protocolx.precompose 生成的模块后再逐个 compose_protocol（全部命中）。
+协议定义在临时目录下的模块中，两种方式都计入协议模块的导入耗时。
+
+运行：uv run python benchmark/bench_precompose.py
+"""
+
+import random
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.precompose import write_precomposed_module
+
+PROTOCOLS = 64
+COMBINATIONS = 2000
+RUNTIME = "compiled"
+
+_WORKER = """
+import time
+start = time.perf_counter()
+import bench_protocols as p
+{preload}
+from protocolx import ProtocolSequence, compose_protocol
+for idx in p.COMBOS:
+    compose_protocol(ProtocolSequence([p.PROTOCOLS[j] for j in idx]), runtime={runtime!r})
+print(time.perf_counter() - start)
+"""
+
+
+def _combinations() -> list[tuple[int, ...]]:
+    # 协议数 2～4 的不同组合（固定种子）
+    rng = random.Random(0)
+    combos: dict[tuple[int, ...], None] = {}
+    while len(combos) < COMBINATIONS:
+        combos[tuple(sorted(rng.sample(range(PROTOCOLS), rng.randint(2, 4))))] = None
+    return list(combos)
+
+
+def _protocol_module(combos: list[tuple[int, ...]]) -> str:
+    lines = ["from typing import Protocol", ""]
+    lines += [
+        f"class P{i}(Protocol):\n    def m{i}(self) -> None: ...\n"
+        for i in range(PROTOCOLS)
+    ]
+    lines.append(f"PROTOCOLS = [{', '.join(f'P{i}' for i in range(PROTOCOLS))}]")
+    lines.append(f"COMBOS = {combos!r}")
+    return "\n".join(lines) + "\n"
+
+
+def _run(directory: Path, preload: str) -> float:
+    out = subprocess.run(
+        [sys.executable, "-c", _WORKER.format(preload=preload, runtime=RUNTIME)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={"PYTHONPATH": ":".join([str(directory), *sys.path])},
+    )
+    return float(out.stdout)
+
+
+def main() -> None:
+    combos = _combinations()
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        (directory / "bench_protocols.py").write_text(_protocol_module(combos))
+        sys.path.insert(0, tmp)
+        import bench_protocols
+
+        declarations = [
+            ProtocolSequence([bench_protocols.PROTOCOLS[j] for j in idx])
+            for idx in combos
+        ]
+        write_precomposed_module(
+            directory / "bench_precomposed.py", declarations, runtime=RUNTIME
+        )
+        # 先导入一次生成 .pyc，与部署后的模块一致
+        _run(directory, "import bench_precomposed")
+        for label, preload in (
+            ("dynamic", ""),
+            ("precomposed", "import bench_precomposed"),
+        ):
+            seconds = min(_run(directory, preload) for _ in range(3))
+            print(f"{label:<12} {seconds * 1e3:8.1f} ms ({len(combos)} combos)")
+
+
+if __name__ == "__main__":
+    main()
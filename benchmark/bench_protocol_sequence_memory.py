@@ -0,0 +1,50 @@
+"""
+ProtocolSequence 单实例内存占用（tracemalloc）。
+
+分别测量仅构造、以及完成规范化（排序 + names + hash，即作为字典键使用后）的实例，
+输出每个实例的平均字节数。
+
+运行：uv run python benchmark/bench_protocol_sequence_memory.py
+"""
+
+import gc
+import tracemalloc
+from types import new_class
+from typing import Callable, Protocol
+
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+
+INSTANCES = 100_000
+PROTOCOLS = [new_class(f"P{i}", (Protocol,)) for i in range(8)]
+
+
+def _per_instance_bytes(build: Callable[[int], ProtocolSequence]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    keep = [build(i) for i in range(INSTANCES)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(s.size_diff for s in after.compare_to(before, "filename"))
+    del keep
+    return total / INSTANCES
+
+
+def _construct(i: int) -> ProtocolSequence:
+    size = 2 + i % 5
+    return ProtocolSequence(PROTOCOLS[i % 3 : i % 3 + size][::-1])
+
+
+def _canonical(i: int) -> ProtocolSequence:
+    seq = _construct(i)
+    hash(seq)
+    return seq
+
+
+def main() -> None:
+    for label, build in (("constructed", _construct), ("canonical", _canonical)):
+        print(f"{label:<12} {_per_instance_bytes(build):8.1f} bytes/instance")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+进程池 worker 延迟：冷启动 vs 按快照重建（init_protocol_worker）。
+
+spawn 进程池中每个 worker 执行一次任务：按稳定态组合集合逐个 compose_protocol。
+- cold：worker 缓存为空，任务中按需创建；
+- rehydrated：initializer 已按快照批量重建，任务中全部命中。
+分别输出首个任务的耗时（任务内测量）与从创建进程池到全部首个任务完成的总耗时。
+
+运行：uv run python benchmark/bench_protocol_worker.py
+"""
+
+import multiprocessing
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Optional
+
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.protocol_cache_snapshot import (
+    init_protocol_worker,
+    snapshot_protocol_cache,
+)
+
+PROTOCOLS = 64
+COMBINATIONS = 1000
+WORKERS = 4
+RUNTIME = "compiled"
+
+
+def _protocol_module() -> str:
+    lines = ["from typing import Protocol", ""]
+    lines += [
+        f"class P{i}(Protocol):\n    def m{i}(self) -> None: ...\n"
+        for i in range(PROTOCOLS)
+    ]
+    lines.append(f"PROTOCOLS = [{', '.join(f'P{i}' for i in range(PROTOCOLS))}]")
+    return "\n".join(lines) + "\n"
+
+
+def _combinations() -> list[tuple[int, ...]]:
+    rng = random.Random(0)
+    combos: dict[tuple[int, ...], None] = {}
+    while len(combos) < COMBINATIONS:
+        combos[tuple(sorted(rng.sample(range(PROTOCOLS), rng.randint(2, 4))))] = None
+    return list(combos)
+
+
+def _task(combos: list[tuple[int, ...]]) -> float:
+    import bench_worker_protocols as p
+
+    start = time.perf_counter()
+    for idx in combos:
+        compose_protocol(
+            ProtocolSequence([p.PROTOCOLS[j] for j in idx]), runtime=RUNTIME
+        )
+    # 占住 worker，保证每个 worker 恰好执行一个首个任务
+    time.sleep(0.2)
+    return time.perf_counter() - start - 0.2
+
+
+def _run(combos: list[tuple[int, ...]], snapshot: Optional[Any]) -> tuple[float, float]:
+    kwargs: dict[str, Any] = {}
+    if snapshot is not None:
+        kwargs = {"initializer": init_protocol_worker, "initargs": (snapshot,)}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=WORKERS, mp_context=multiprocessing.get_context("spawn"), **kwargs
+    ) as pool:
+        latencies = list(pool.map(_task, [combos] * WORKERS))
+    return max(latencies), time.perf_counter() - start
+
+
+def main() -> None:
+    combos = _combinations()
+    with tempfile.TemporaryDirectory() as tmp:
+        (Path(tmp) / "bench_worker_protocols.py").write_text(_protocol_module())
+        sys.path.insert(0, tmp)
+        import bench_worker_protocols as p
+
+        for idx in combos:
+            compose_protocol(
+                ProtocolSequence([p.PROTOCOLS[j] for j in idx]), runtime=RUNTIME
+            )
+        snapshot = snapshot_protocol_cache()
+        for label, snap in (("cold", None), ("rehydrated", snapshot)):
+            task, total = min(_run(combos, snap) for _ in range(3))
+            print(
+                f"{label:<11} first task {task * 1e3:8.2f} ms"
+                f"   pool ready + first task {total * 1e3:8.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+ProtocolSequence 与 compose_protocol 的可复现基准套件。
+
+覆盖 ProtocolSequence 的构造、校验排序、哈希、相等比较，
+compose_protocol 的冷 / 热路径与增量扩展，组合类的 runtime isinstance，以及 pickle 往返；
+按协议数量 1 → 1000 扫描，结果写成 JSON，便于跨版本 diff 与回归检查。
+
+运行：
+    uv run python benchmark/bench_suite.py --output bench.json
+    uv run python benchmark/bench_suite.py --compare bench.json --threshold 1.2
+"""
+
+import argparse
+import json
+import pickle
+import platform
+import sys
+import time
+import timeit
+from importlib import metadata
+from types import new_class
+from typing import Any, Callable, Protocol
+
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_cache import clear_protocol_cache
+
+DEFAULT_SIZES = (1, 10, 100, 1000)
+REPEAT = 5
+
+# 基准用例：接收协议列表，返回 (待计时语句, 每次计时前的准备函数或 None)
+Case = Callable[[list[type]], tuple[Callable[[], object], Callable[[], None] | None]]
+
+
+def make_protocols(count: int) -> list[type]:
+    """生成 count 个各带一个方法成员的 Protocol。"""
+
+    def body(index: int) -> Callable[[dict[str, Any]], None]:
+        def exec_body(ns: dict[str, Any]) -> None:
+            ns[f"m{index}"] = lambda self: None
+
+        return exec_body
+
+    return [
+        new_class(f"P{i:04d}", (Protocol,), exec_body=body(i)) for i in range(count)
+    ]
+
+
+def make_impl(protocols: list[type]) -> object:
+    """构造一个实现了全部协议成员的实例。"""
+    members = {f"m{i}": (lambda self: None) for i in range(len(protocols))}
+    return type("Impl", (), members)()
+
+
+def case_construct(protocols: list[type]) -> Any:
+    items = list(reversed(protocols))
+    return (lambda: ProtocolSequence(items)), None
+
+
+def case_validate_sort(protocols: list[type]) -> Any:
+    # 迭代强制校验并排序为规范形式；len 只需位掩码，不能衡量排序开销
+    items = list(reversed(protocols))
+    return (lambda: list(ProtocolSequence(items))), None
+
+
+def case_hash_fresh(protocols: list[type]) -> Any:
+    items = list(reversed(protocols))
+    return (lambda: hash(ProtocolSequence(items))), None
+
+
+def case_hash_cached(protocols: list[type]) -> Any:
+    seq = ProtocolSequence(protocols)
+    hash(seq)
+    return (lambda: hash(seq)), None
+
+
+def case_eq_fresh(protocols: list[type]) -> Any:
+    items = list(reversed(protocols))
+    return (lambda: ProtocolSequence(items) == ProtocolSequence(protocols)), None
+
+
+def case_eq_cached(protocols: list[type]) -> Any:
+    left, right = ProtocolSequence(protocols), ProtocolSequence(protocols[::-1])
+    _ = left == right
+    return (lambda: left == right), None
+
+
+def case_compose_cold(protocols: list[type]) -> Any:
+    seq = ProtocolSequence(protocols)
+    return (lambda: compose_protocol(seq, runtime=True)), clear_protocol_cache
+
+
+def case_compose_warm(protocols: list[type]) -> Any:
+    seq = ProtocolSequence(protocols)
+    compose_protocol(seq, runtime=True)
+    return (lambda: compose_protocol(seq, runtime=True)), None
+
+
+def _widen(protocols: list[type], incremental: bool) -> Any:
+    # 已缓存除最后一个协议外的组合，再组合全部协议（扩展插件契约的典型场景）
+    parent, seq = ProtocolSequence(protocols[:-1]), ProtocolSequence(protocols)
+
+    def setup() -> None:
+        clear_protocol_cache()
+        compose_protocol(parent, runtime="compiled")
+
+    return (
+        lambda: compose_protocol(seq, runtime="compiled", incremental=incremental)
+    ), setup
+
+
+def case_compose_widen(protocols: list[type]) -> Any:
+    return _widen(protocols, incremental=False)
+
+
+def case_compose_widen_incremental(protocols: list[type]) -> Any:
+    return _widen(protocols, incremental=True)
+
+
+def case_isinstance(protocols: list[type]) -> Any:
+    composed = compose_protocol(ProtocolSequence(protocols), runtime=True)
+    impl = make_impl(protocols)
+    return (lambda: isinstance(impl, composed)), None
+
+
+def case_isinstance_compiled(protocols: list[type]) -> Any:
+    composed = compose_protocol(ProtocolSequence(protocols), runtime="compiled")
+    impl = make_impl(protocols)
+    return (lambda: isinstance(impl, composed)), None
+
+
+def case_pickle_roundtrip(protocols: list[type]) -> Any:
+    composed = compose_protocol(ProtocolSequence(protocols), runtime=True)
+    return (lambda: pickle.loads(pickle.dumps(composed))), None
+
+
+CASES: dict[str, Case] = {
+    "sequence.construct": case_construct,
+    "sequence.validate_sort": case_validate_sort,
+    "sequence.hash_fresh": case_hash_fresh,
+    "sequence.hash_cached": case_hash_cached,
+    "sequence.eq_fresh": case_eq_fresh,
+    "sequence.eq_cached": case_eq_cached,
+    "compose.cold": case_compose_cold,
+    "compose.warm": case_compose_warm,
+    "compose.widen": case_compose_widen,
+    "compose.widen_incremental": case_compose_widen_incremental,
+    "runtime.isinstance": case_isinstance,
+    "runtime.isinstance_compiled": case_isinstance_compiled,
+    "pickle.roundtrip": case_pickle_roundtrip,
+}
+
+
+def measure(stmt: Callable[[], object], setup: Callable[[], None] | None) -> float:
+    """返回单次调用耗时的最优值（纳秒）。"""
+    if setup is not None:
+        # 冷路径：每次调用前重置状态，逐次计时
+        samples = []
+        for _ in range(REPEAT * 3):
+            setup()
+            start = time.perf_counter()
+            stmt()
+            samples.append(time.perf_counter() - start)
+        return min(samples) * 1e9
+    timer = timeit.Timer(stmt)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=REPEAT, number=number)) / number * 1e9
+
+
+def run(sizes: tuple[int, ...], cases: list[str]) -> dict[str, Any]:
+    results: dict[str, dict[str, float]] = {}
+    for name in cases:
+        results[name] = {}
+        for size in sizes:
+            clear_protocol_cache()
+            stmt, setup = CASES[name](make_protocols(size))
+            ns = measure(stmt, setup)
+            results[name][str(size)] = round(ns, 1)
+            print(f"{name:<30} size={size:>5}  {ns:14,.1f} ns/op", flush=True)
+    clear_protocol_cache()
+    try:
+        version = metadata.version("protocolx")
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+    return {
+        "meta": {
+            "protocolx": version,
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> int:
+    """逐项对比当前结果与基线，返回超过阈值的回归项数量。"""
+    regressions = 0
+    for name, by_size in current["results"].items():
+        for size, ns in by_size.items():
+            base = baseline["results"].get(name, {}).get(size)
+            if not base:
+                continue
+            ratio = ns / base
+            flag = "REGRESSION" if ratio > threshold else ""
+            regressions += bool(flag)
+            print(f"{name:<30} size={size:>5}  {ratio:6.2f}x  {flag}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    parser.add_argument("--cases", default=",".join(CASES))
+    parser.add_argument("--output", help="结果 JSON 输出路径")
+    parser.add_argument("--compare", help="用于对比的基线 JSON")
+    parser.add_argument("--threshold", type=float, default=1.2)
+    args = parser.parse_args()
+
+    sizes = tuple(int(s) for s in args.sizes.split(","))
+    report = run(sizes, args.cases.split(","))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        return 1 if compare(report, baseline, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
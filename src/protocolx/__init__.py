@@ -1,4 +1,76 @@
+from protocolx.check_conformance import check_conformance, filter_conforming
+from protocolx.checker.conformance_cache import (
+    invalidate_conformance_cache,
+    set_conformance_cache,
+)
 from protocolx.compose_protocol import compose_protocol
+from protocolx.conformance_matrix import conformance_matrix
+from protocolx.definition.type.conformance_matrix import ConformanceMatrix
+from protocolx.find_satisfied_protocols import find_satisfied_protocols
+from protocolx.protocol_dispatch import ProtocolDispatcher, protocol_dispatch
+from protocolx.precompose import generate_precomposed_source, write_precomposed_module
+from protocolx.definition.type.protocol_cache_snapshot import ProtocolCacheSnapshot
+from protocolx.protocol_cache_snapshot import (
+    init_protocol_worker,
+    restore_protocol_cache,
+    snapshot_protocol_cache,
+)
+from protocolx.warmup_manifest import (
+    preload_warmup_manifest,
+    start_composition_recording,
+    stop_composition_recording,
+    write_warmup_manifest,
+)
+from protocolx.definition.type.eviction_policy import EvictionPolicy
 from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_cache import (
+    invalidate_protocol,
+    pin_protocol,
+    set_cache_mode,
+    set_eviction_policy,
+    unpin_protocol,
+)
+from protocolx.global_var.protocol_cache_memory import (
+    ProtocolCacheMemory,
+    get_protocol_cache_memory,
+)
+from protocolx.global_var.protocol_cache_stats import (
+    ProtocolCacheStats,
+    get_protocol_cache_stats,
+    reset_protocol_cache_stats,
+)
 
-__all__ = ["compose_protocol", "ProtocolSequence"]
+__all__ = [
+    "compose_protocol",
+    "ProtocolSequence",
+    "check_conformance",
+    "filter_conforming",
+    "conformance_matrix",
+    "ConformanceMatrix",
+    "find_satisfied_protocols",
+    "protocol_dispatch",
+    "ProtocolDispatcher",
+    "generate_precomposed_source",
+    "write_precomposed_module",
+    "start_composition_recording",
+    "stop_composition_recording",
+    "write_warmup_manifest",
+    "preload_warmup_manifest",
+    "ProtocolCacheSnapshot",
+    "snapshot_protocol_cache",
+    "restore_protocol_cache",
+    "init_protocol_worker",
+    "invalidate_conformance_cache",
+    "set_conformance_cache",
+    "invalidate_protocol",
+    "EvictionPolicy",
+    "set_eviction_policy",
+    "set_cache_mode",
+    "pin_protocol",
+    "unpin_protocol",
+    "ProtocolCacheStats",
+    "get_protocol_cache_stats",
+    "reset_protocol_cache_stats",
+    "ProtocolCacheMemory",
+    "get_protocol_cache_memory",
+]
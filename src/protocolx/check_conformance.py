@@ -0,0 +1,77 @@
+from abc import ABCMeta
+from itertools import compress
+from operator import attrgetter
+from typing import Iterable, Optional, TypeVar
+from weakref import WeakKeyDictionary
+
+from protocolx.checker.conformance_cache import CONFORMANCE_ATTR, ConformanceCache
+from protocolx.checker.member_index import get_member_index
+
+T = TypeVar("T")
+
+# 非组合的 runtime_checkable 协议按需建立的一致性缓存，弱引用键为协议类。
+_ADHOC: "WeakKeyDictionary[type, ConformanceCache]" = WeakKeyDictionary()
+
+# isinstance 结果只取决于 type(obj) 与 obj.__class__ 的元类实现
+_TYPE_ONLY_CHECKS = (type.__instancecheck__, ABCMeta.__instancecheck__)
+
+# 代理对象（如 weakref.proxy）的 __class__ 与 type(obj) 不同，名义检查两者都看
+_class_of = attrgetter("__class__")
+
+
+def _get_conformance(proto: type) -> Optional[ConformanceCache]:
+    conformance = proto.__dict__.get(CONFORMANCE_ATTR)
+    if conformance is None and getattr(proto, "_is_runtime_protocol", False):
+        conformance = _ADHOC.get(proto)
+        if conformance is None:
+            conformance = _ADHOC[proto] = ConformanceCache(*get_member_index(proto))
+    return conformance
+
+
+def _judge_type(proto: type, tp: type, sample: object) -> Optional[bool]:
+    """
+    判定 type(obj) 为 tp、obj.__class__ 与 sample 相同的所有对象是否满足 proto；
+    None 表示需逐实例检查。sample 只在其结果对整组成立时复用。
+    """
+    conformance = _get_conformance(proto)
+    if conformance is not None:
+        # 每次调用重新判定，不依赖（默认关闭的）按类型缓存，类修改后结果不会过期
+        result = conformance.classify(tp)
+        if result is False and CONFORMANCE_ATTR not in proto.__dict__:
+            # classify 只在实例无法自行提供成员时给出 False，此时 isinstance 为真
+            # 只可能来自显式继承或 register，属于类型层面的结论
+            return isinstance(sample, proto)
+        return result
+    if type(proto).__instancecheck__ in _TYPE_ONLY_CHECKS:
+        # 普通类与 ABC：结果只取决于类型
+        return isinstance(sample, proto)
+    # 自定义 __instancecheck__（含非 runtime 协议，逐实例时由 isinstance 抛出 TypeError）
+    return None
+
+
+def check_conformance(objects: Iterable[object], proto: type) -> list[bool]:
+    """
+    批量判定 isinstance(obj, proto)，返回与输入等长的布尔掩码。
+    输入按 (type(obj), obj.__class__) 分组，每组只判定一次；
+    只有无法在类型层面判定的类型（成员可能由实例提供、含槽位或描述符、
+    自定义了属性查找）才逐实例检查。
+    结果与逐个调用 isinstance 一致。
+    """
+    items = objects if isinstance(objects, (list, tuple)) else list(objects)
+    kinds = list(zip(map(type, items), map(_class_of, items)))
+    samples = dict(zip(kinds, items))
+    verdicts = {
+        kind: _judge_type(proto, kind[0], sample) for kind, sample in samples.items()
+    }
+    if None not in verdicts.values():
+        return list(map(verdicts.__getitem__, kinds))  # type: ignore[arg-type]
+    return [
+        isinstance(obj, proto) if verdict is None else verdict
+        for obj, verdict in zip(items, map(verdicts.__getitem__, kinds))
+    ]
+
+
+def filter_conforming(objects: Iterable[T], proto: type) -> list[T]:
+    """批量筛选满足 proto 的对象，保持输入顺序；分组判定规则同 check_conformance。"""
+    items = objects if isinstance(objects, (list, tuple)) else list(objects)
+    return list(compress(items, check_conformance(items, proto)))
@@ -0,0 +1,113 @@
+import sys
+from typing import Any, Callable, Optional
+
+from protocolx.checker.member_index import MemberIndex, get_member_index
+
+# 检查函数存放在类 __dict__ 中；使用 _abc_ 前缀是因为 typing 收集协议成员时
+# 会跳过该前缀，避免检查函数被当作协议成员继承给后续组合。
+INSTANCECHECK_ATTR = "_abc_protocolx_instancecheck"
+SUBCLASSCHECK_ATTR = "_abc_protocolx_subclasscheck"
+
+# 实例成员查找与 typing 保持一致：3.12 起 runtime_checkable 改用 inspect.getattr_static，
+# 不触发 __getattr__ / __getattribute__ 与 property，未赋值的槽位也视为存在。
+if sys.version_info >= (3, 12):
+    from inspect import getattr_static as instance_getattr
+
+    def instance_hasattr(obj: object, name: str) -> bool:
+        try:
+            instance_getattr(obj, name)
+        except AttributeError:
+            return False
+        return True
+
+else:
+    instance_getattr = getattr
+    instance_hasattr = hasattr
+
+
+def get_protocol_members(proto: type) -> MemberIndex:
+    """
+    返回协议要求的全部成员名（含 MRO 上所有协议基类），
+    即 (可调用成员, 数据成员) 二元组；结果按协议类缓存。
+    """
+    return get_member_index(proto)
+
+
+def class_has_member(other: type, name: str) -> bool:
+    """沿 MRO 查找成员，找到且不为 None 即视为实现（与 typing 语义一致）。"""
+    for base in other.__mro__:
+        if name in base.__dict__:
+            return base.__dict__[name] is not None
+    return False
+
+
+def class_namespace(tp: type) -> tuple[dict[str, Any], set[str]]:
+    """
+    合并 MRO 上各类的 __dict__（子类覆盖基类），并收集各类注解过的属性名。
+    用于一次性判定一个类型提供了哪些成员。
+    """
+    namespace: dict[str, Any] = {}
+    annotated: set[str] = set()
+    for base in reversed(tp.__mro__):
+        namespace.update(base.__dict__)
+        annotated.update(base.__dict__.get("__annotations__", ()))
+    return namespace, annotated
+
+
+def instance_check_source(
+    callables: frozenset[str], data: frozenset[str], name: str = "instance_check"
+) -> str:
+    """
+    isinstance 检查函数的源码：逐个成员做一次属性查找，无循环、无 MRO 遍历。
+    查找函数取自所在命名空间的 instance_getattr / instance_hasattr。
+    """
+    terms = [f"getattr(obj, {m!r}, None) is not None" for m in sorted(callables)]
+    terms += [f"hasattr(obj, {m!r})" for m in sorted(data)]
+    body = " and ".join(terms) or "True"
+    return (
+        f"def {name}(obj, getattr=instance_getattr, hasattr=instance_hasattr):\n"
+        f"    return {body}\n"
+    )
+
+
+def subclass_check_source(
+    callables: frozenset[str], name: str = "subclass_check"
+) -> str:
+    """issubclass 检查函数的源码，仅适用于只含方法成员的协议；has 为 class_has_member。"""
+    terms = [f"has(other, {m!r})" for m in sorted(callables)]
+    body = " and ".join(terms) or "True"
+    return f"def {name}(other, has=has):\n    return {body}\n"
+
+
+def compile_instance_check(
+    callables: frozenset[str], data: frozenset[str]
+) -> Callable[[object], bool]:
+    """生成专用 isinstance 检查函数。"""
+    namespace: dict[str, Any] = {
+        "instance_getattr": instance_getattr,
+        "instance_hasattr": instance_hasattr,
+    }
+    exec(instance_check_source(callables, data), namespace)
+    return namespace["instance_check"]
+
+
+def compile_subclass_check(callables: frozenset[str]) -> Callable[[type], bool]:
+    """生成专用 issubclass 检查函数，仅适用于只含方法成员的协议。"""
+    namespace: dict[str, Any] = {"has": class_has_member}
+    exec(subclass_check_source(callables), namespace)
+    return namespace["subclass_check"]
+
+
+def install_compiled_checker(
+    proto_cls: type,
+    members: Optional[MemberIndex] = None,
+) -> None:
+    """
+    为协议类预计算成员集合并挂载编译后的检查函数。
+    members 为已知的成员索引时直接使用。
+    含数据成员的协议不挂载 issubclass 快速路径，交由 typing 抛出 TypeError。
+    """
+    callables, data = members or get_protocol_members(proto_cls)
+    setattr(proto_cls, INSTANCECHECK_ATTR, compile_instance_check(callables, data))
+    if not data:
+        setattr(proto_cls, SUBCLASSCHECK_ATTR, compile_subclass_check(callables))
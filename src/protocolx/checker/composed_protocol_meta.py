@@ -0,0 +1,59 @@
+import sys
+from _abc import _abc_subclasscheck
+from abc import ABCMeta
+from typing import Any, Protocol
+
+from protocolx.checker.compiled_checker import INSTANCECHECK_ATTR, SUBCLASSCHECK_ATTR
+from protocolx.checker.conformance_cache import CONFORMANCE_ATTR
+
+_ProtocolMeta: type = type(Protocol)
+
+
+def _called_from_abc() -> bool:
+    # 与 typing 的 _allow_reckless_class_checks 相同：abc / functools 会对整条 MRO
+    # 调用 issubclass，typing 对这类调用放行数据成员协议
+    caller = sys._getframe(2).f_globals.get("__name__")
+    return caller in ("abc", "functools", None)
+
+
+class ComposedProtocolMeta(_ProtocolMeta):  # type: ignore[misc, valid-type]
+    """
+    runtime 组合协议的元类。
+    只读取类自身 __dict__ 中挂载的检查设施（子类不继承），依次尝试：
+    按具体类型的一致性缓存 → 编译检查函数 → 逐实例结构检查；
+    结构检查未通过时再做 ABC 的名义检查（显式继承、register、__class__ 代理），
+    与 typing 的判定一致；未挂载任何设施时回退到 typing 的原始实现。
+    """
+
+    def __instancecheck__(cls, instance: Any) -> bool:
+        conformance = cls.__dict__.get(CONFORMANCE_ATTR)
+        check = cls.__dict__.get(INSTANCECHECK_ATTR)
+        if conformance is not None:
+            result = conformance.lookup(type(instance))
+            if result is None:
+                result = (check or conformance.check_instance)(instance)
+        elif check is not None:
+            result = check(instance)
+        else:
+            return super().__instancecheck__(instance)
+        # 经 abc 模块的 ABCMeta.__instancecheck__ 调用，typing 才会放行数据成员协议
+        return result or ABCMeta.__instancecheck__(cls, instance)
+
+    def __subclasscheck__(cls, other: Any) -> bool:
+        if _called_from_abc():
+            # ABCMeta.__instancecheck__ 等内部调用：直接交给 ABC 判定，
+            # 多出的本帧不应改变 typing 对调用方的判断
+            return _abc_subclasscheck(cls, other)
+        conformance = cls.__dict__.get(CONFORMANCE_ATTR)
+        if conformance is not None and not conformance.data:
+            if not isinstance(other, type):
+                raise TypeError("issubclass() arg 1 must be a class")
+            if conformance.lookup(other):
+                return True
+        check = cls.__dict__.get(SUBCLASSCHECK_ATTR)
+        if check is not None:
+            if not isinstance(other, type):
+                raise TypeError("issubclass() arg 1 must be a class")
+            if check(other):
+                return True
+        return super().__subclasscheck__(other)
@@ -0,0 +1,173 @@
+import sys
+from typing import Any, Optional
+from weakref import WeakKeyDictionary, WeakSet
+
+from protocolx.checker.compiled_checker import (
+    class_has_member,
+    get_protocol_members,
+    instance_getattr,
+    instance_hasattr,
+)
+from protocolx.checker.member_index import MemberIndex
+
+# 与检查函数相同，借 _abc_ 前缀避开 typing 的协议成员收集。
+CONFORMANCE_ATTR = "_abc_protocolx_conformance"
+
+# 所有存活的按类型缓存（一致性缓存及其他按类型缓存结果的索引），
+# 供 invalidate_conformance_cache 统一失效；成员需提供 discard(tp) 与 clear()。
+_ALL_CACHES: "WeakSet[Any]" = WeakSet()
+
+# 按类型缓存一致性结果的开关；默认关闭，开启后类在运行期增删属性需调用
+# invalidate_conformance_cache，否则缓存结果可能过期。
+_ENABLED = False
+
+
+def is_data_descriptor(value: Any) -> bool:
+    """槽位、property 等数据描述符：实例上的取值可能缺失或与类上不同。"""
+    tp = type(value)
+    return hasattr(tp, "__set__") or hasattr(tp, "__delete__")
+
+
+def has_custom_attribute_lookup(tp: type) -> bool:
+    """tp（不含 object）是否自定义了 __getattr__ / __getattribute__，成员无法从类上枚举。"""
+    return any(
+        "__getattr__" in base.__dict__ or "__getattribute__" in base.__dict__
+        for base in tp.__mro__[:-1]
+    )
+
+
+class ConformanceCache:
+    """
+    组合协议的按具体类型一致性缓存，弱引用键为 type(obj)；
+    须经 set_conformance_cache(True) 开启，关闭时 lookup 恒返回 None。
+    结果在类型层面判定：True / False 直接命中；
+    None 表示无法仅凭类型判定（实例有 __dict__ 可增删或遮蔽成员，
+    成员由槽位或描述符提供，或类型自定义了属性查找），
+    调用方应回退到 check_instance 逐实例检查。
+    """
+
+    __slots__ = ("callables", "data", "_results", "__weakref__")
+
+    def __init__(self, callables: frozenset[str], data: frozenset[str]) -> None:
+        self.callables = callables
+        self.data = data
+        self._results: WeakKeyDictionary[type, Optional[bool]] = WeakKeyDictionary()
+        _ALL_CACHES.add(self)
+
+    def classify(self, tp: type) -> Optional[bool]:
+        """
+        仅凭类型判定 tp 的全部实例是否满足协议，不缓存；None 表示需逐实例检查。
+        只对没有实例字典的类型给出结论：有 __dict__ 的实例可以自行提供缺失成员，
+        也可以把方法遮蔽为 None。
+        """
+        if tp.__dictoffset__ or has_custom_attribute_lookup(tp):
+            return None
+        mro = tp.__mro__
+        for name in self.callables:
+            if not class_has_member(tp, name):
+                return False
+        for name in self.callables | self.data:
+            for base in mro:
+                if name in base.__dict__:
+                    if is_data_descriptor(base.__dict__[name]):
+                        return None
+                    break
+            else:
+                return False
+        return True
+
+    def lookup(self, tp: type) -> Optional[bool]:
+        """查询类型一致性，未命中时判定一次并缓存（含否定结果）；未开启缓存时返回 None。"""
+        if not _ENABLED:
+            return None
+        try:
+            return self._results[tp]
+        except KeyError:
+            result = self._results[tp] = self.classify(tp)
+            return result
+
+    def check_instance(self, obj: object) -> bool:
+        """逐实例结构检查（成员查找方式与 typing 的 isinstance 一致），不缓存。"""
+        for name in self.callables:
+            if instance_getattr(obj, name, None) is None:
+                return False
+        for name in self.data:
+            if not instance_hasattr(obj, name):
+                return False
+        return True
+
+    def discard(self, tp: type) -> None:
+        self._results.pop(tp, None)
+
+    def clear(self) -> None:
+        self._results.clear()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __sizeof__(self) -> int:
+        # 计入结果表及其弱引用键；成员名集合与组合类共享，不计入
+        data = self._results.data
+        return (
+            object.__sizeof__(self)
+            + sys.getsizeof(data)
+            + sum(map(sys.getsizeof, list(data)))
+        )
+
+
+def set_conformance_cache(enabled: bool) -> None:
+    """
+    开启 / 关闭组合协议的按类型一致性缓存（默认关闭），切换时清空已有结果。
+    开启后同一具体类型的重复 isinstance 只需一次字典查找；
+    类（或其基类）在运行期新增 / 删除属性后须调用 invalidate_conformance_cache。
+    """
+    global _ENABLED
+    for cache in list(_ALL_CACHES):
+        if isinstance(cache, ConformanceCache):
+            cache.clear()
+    _ENABLED = bool(enabled)
+
+
+def register_type_cache(cache: Any) -> None:
+    """登记按具体类型缓存结果的对象，使其随 invalidate_conformance_cache 失效。"""
+    _ALL_CACHES.add(cache)
+
+
+def install_conformance_cache(
+    proto_cls: type,
+    members: Optional[MemberIndex] = None,
+) -> None:
+    """
+    为组合协议类挂载按具体类型的一致性缓存。
+    members 为已知的成员索引时直接使用。
+    """
+    callables, data = members or get_protocol_members(proto_cls)
+    setattr(proto_cls, CONFORMANCE_ATTR, ConformanceCache(callables, data))
+
+
+def _iter_subclasses(tp: type) -> set[type]:
+    seen = {tp}
+    stack = [tp]
+    while stack:
+        for sub in type.__subclasses__(stack.pop()):
+            if sub not in seen:
+                seen.add(sub)
+                stack.append(sub)
+    return seen
+
+
+def invalidate_conformance_cache(tp: Optional[type] = None) -> None:
+    """
+    使一致性缓存失效。
+    类（或其基类）在运行期新增 / 删除属性后应调用本函数，
+    传入该类时同时失效其全部子类；不传参数则清空所有缓存。
+    """
+    caches = list(_ALL_CACHES)
+    if tp is None:
+        for cache in caches:
+            cache.clear()
+        return
+    targets = _iter_subclasses(tp)
+    for cache in caches:
+        for target in targets:
+            cache.discard(target)
@@ -0,0 +1,86 @@
+import inspect
+import typing
+from typing import Iterable, NamedTuple, Optional
+from weakref import WeakKeyDictionary
+
+
+class MemberIndex(NamedTuple):
+    """
+    协议要求的成员索引（含 MRO 上所有协议基类）。
+    - callables：方法成员，实现方需提供非 None 的同名属性；
+    - data：数据成员，实现方只需具备同名属性。
+    """
+
+    callables: frozenset[str]
+    data: frozenset[str]
+
+    @property
+    def names(self) -> frozenset[str]:
+        return self.callables | self.data
+
+
+# 协议类 → 成员索引；弱引用键，协议类被回收后索引随之释放。
+_INDEX: "WeakKeyDictionary[type, MemberIndex]" = WeakKeyDictionary()
+
+# 协议类 → 方法成员签名，按需计算。
+_SIGNATURES: "WeakKeyDictionary[type, dict[str, inspect.Signature]]" = (
+    WeakKeyDictionary()
+)
+
+
+def collect_member_index(proto: type) -> MemberIndex:
+    """不经缓存，沿协议的 MRO 收集成员并按取值分类。"""
+    attrs = getattr(proto, "__protocol_attrs__", None)
+    if attrs is None:
+        attrs = typing._get_protocol_attrs(proto)  # type: ignore[attr-defined]
+    names = frozenset(attrs)
+    callables = frozenset(
+        name for name in names if callable(getattr(proto, name, None))
+    )
+    return MemberIndex(callables, names - callables)
+
+
+def get_member_index(proto: type) -> MemberIndex:
+    """返回协议的成员索引，每个协议类只收集一次。"""
+    index = _INDEX.get(proto)
+    if index is None:
+        index = _INDEX[proto] = collect_member_index(proto)
+    return index
+
+
+def peek_member_index(proto: type) -> Optional[MemberIndex]:
+    """返回已缓存的成员索引，尚未收集时返回 None，不触发收集。"""
+    return _INDEX.get(proto)
+
+
+def register_member_index(proto: type, index: MemberIndex) -> None:
+    """登记已知的成员索引（如组合类由基类索引合并而来），跳过收集。"""
+    _INDEX[proto] = index
+
+
+def union_member_index(protos: Iterable[type]) -> MemberIndex:
+    """
+    合并多个协议的成员索引，得到其组合的成员索引。
+    同一成员在某个基类中为方法时按方法要求。
+    """
+    callables: set[str] = set()
+    data: set[str] = set()
+    for proto in protos:
+        index = get_member_index(proto)
+        callables.update(index.callables)
+        data.update(index.data)
+    return MemberIndex(frozenset(callables), frozenset(data - callables))
+
+
+def get_member_signatures(proto: type) -> dict[str, inspect.Signature]:
+    """返回协议方法成员的签名（无法取得签名的成员略过），按协议类缓存。"""
+    signatures = _SIGNATURES.get(proto)
+    if signatures is None:
+        signatures = {}
+        for name in sorted(get_member_index(proto).callables):
+            try:
+                signatures[name] = inspect.signature(getattr(proto, name))
+            except (TypeError, ValueError):
+                continue
+        _SIGNATURES[proto] = signatures
+    return signatures
@@ -0,0 +1,263 @@
+import threading
+from typing import Iterable, Optional, Union
+from weakref import WeakKeyDictionary, ref
+
+from protocolx.checker.compiled_checker import (
+    class_namespace,
+    instance_getattr,
+    instance_hasattr,
+)
+from protocolx.checker.conformance_cache import (
+    has_custom_attribute_lookup,
+    is_data_descriptor,
+    register_type_cache,
+)
+from protocolx.checker.member_index import MemberIndex, get_member_index
+
+# 按类型缓存的匹配结果（判定规则同 ConformanceCache.classify）：
+# - tuple：类型层面已判定，即满足的协议槽位（升序）；
+# - frozenset：类上提供的相关成员名，需连同实例字典逐实例确认（实例有 __dict__，
+#   或成员为槽位、property 等数据描述符）；
+# - None：类型自定义了属性查找，逐实例检查全部协议。
+TypeMatch = Union[tuple[int, ...], frozenset[str], None]
+
+# 槽位过半空闲（且超过该数量）时重新编号，避免频繁增删后倒排表与槽位表持续膨胀
+_COMPACT_MIN_SLOTS = 64
+
+
+def _instance_satisfies(obj: object, index: MemberIndex) -> bool:
+    return all(
+        instance_getattr(obj, name, None) is not None for name in index.callables
+    ) and all(instance_hasattr(obj, name) for name in index.data)
+
+
+class MemberPostingIndex:
+    """
+    成员名 → 要求该成员的协议（倒排表）。
+    查找一个对象满足的全部协议时，只遍历其提供的成员对应的倒排表并计数，
+    某协议的命中数等于其要求的成员数即满足；耗时与对象成员数成正比，而非协议总数。
+    协议增删时只更新其成员对应的倒排表，不整体重建；新协议的成员索引推迟到下次查找时计算，
+    组合路径不承担额外开销。
+    结果按具体类型缓存（弱引用键），随 invalidate_conformance_cache 或协议增删失效。
+    索引只弱引用协议，不延长（弱引用模式缓存中）组合类的生命周期。
+    """
+
+    __slots__ = (
+        "_slots",
+        "_indexes",
+        "_required",
+        "_slot_of",
+        "_callable_postings",
+        "_data_postings",
+        "_always",
+        "_pending",
+        "_dead",
+        "_results",
+        "_lock",
+        "__weakref__",
+    )
+
+    def __init__(self, protocols: Iterable[type] = ()) -> None:
+        self._reset()
+        # 待计算成员索引的槽位；已被回收、待移出的协议弱引用（GC 回调中只登记不处理）
+        self._pending: list[int] = []
+        self._dead: list[ref[type]] = []
+        self._results: WeakKeyDictionary[type, TypeMatch] = WeakKeyDictionary()
+        self._lock = threading.RLock()
+        register_type_cache(self)
+        for proto in protocols:
+            self.add_protocol(proto)
+
+    def _reset(self) -> None:
+        # 槽位按加入顺序分配，移除后留空；倒排表的值为升序槽位元组。
+        # 各结构整体替换而非原地清空，无锁读取的查找线程不会看到半成品
+        self._slots: list[Optional[ref[type]]] = []
+        self._indexes: list[Optional[MemberIndex]] = []
+        self._required: list[int] = []
+        self._slot_of: dict[ref[type], int] = {}
+        self._callable_postings: dict[str, tuple[int, ...]] = {}
+        self._data_postings: dict[str, tuple[int, ...]] = {}
+        self._always: tuple[int, ...] = ()
+
+    @property
+    def protocols(self) -> tuple[type, ...]:
+        refs = (r() for r in self._slots if r is not None)
+        return tuple(p for p in refs if p is not None)
+
+    # ===== 增量维护 =====
+
+    def add_protocol(self, proto: type) -> None:
+        """加入协议（排在已有协议之后）；已在索引中时不做任何事。"""
+        with self._lock:
+            if ref(proto) in self._slot_of:
+                return
+            slot = len(self._slots)
+            key = ref(proto, self._dead.append)
+            self._slot_of[key] = slot
+            self._slots.append(key)
+            self._indexes.append(None)
+            self._required.append(0)
+            self._pending.append(slot)
+            self._results.clear()
+
+    def remove_protocol(self, proto: type) -> None:
+        """移出协议；不在索引中时不做任何事。"""
+        with self._lock:
+            slot = self._slot_of.pop(ref(proto), None)
+            if slot is not None:
+                self._drop(slot)
+
+    def clear_protocols(self) -> None:
+        """移出全部协议。"""
+        with self._lock:
+            self._reset()
+            self._pending.clear()
+            self._dead.clear()
+            self._results.clear()
+
+    def _sync(self) -> None:
+        """处理已回收的协议，并为新加入的协议计算成员索引、写入倒排表。"""
+        with self._lock:
+            while self._dead:
+                slot = self._slot_of.pop(self._dead.pop(), None)
+                if slot is not None:
+                    self._drop(slot)
+            for slot in self._pending:
+                key = self._slots[slot]
+                proto = key() if key is not None else None
+                if proto is not None:
+                    index = self._indexes[slot] = get_member_index(proto)
+                    self._required[slot] = len(index.callables) + len(index.data)
+                    self._post(slot, index)
+            self._pending.clear()
+            size = len(self._slots)
+            if size > _COMPACT_MIN_SLOTS and len(self._slot_of) * 2 < size:
+                self._compact()
+
+    def _post(self, slot: int, index: MemberIndex) -> None:
+        for postings, names in (
+            (self._callable_postings, index.callables),
+            (self._data_postings, index.data),
+        ):
+            for name in names:
+                postings[name] = postings.get(name, ()) + (slot,)
+        if not index.callables and not index.data:
+            self._always += (slot,)
+
+    def _drop(self, slot: int) -> None:
+        index = self._indexes[slot]
+        self._slots[slot] = None
+        self._indexes[slot] = None
+        if index is not None:
+            for postings, names in (
+                (self._callable_postings, index.callables),
+                (self._data_postings, index.data),
+            ):
+                for name in names:
+                    rest = tuple(i for i in postings.get(name, ()) if i != slot)
+                    if rest:
+                        postings[name] = rest
+                    else:
+                        postings.pop(name, None)
+            if not index.callables and not index.data:
+                self._always = tuple(i for i in self._always if i != slot)
+        self._results.clear()
+
+    def _compact(self) -> None:
+        # 只在没有待处理槽位时调用：按原顺序重新编号存活的协议
+        live = [
+            (key, self._indexes[slot])
+            for slot, key in enumerate(self._slots)
+            if key is not None
+        ]
+        self._reset()
+        for slot, (key, index) in enumerate(live):
+            assert index is not None
+            self._slot_of[key] = slot
+            self._slots.append(key)
+            self._indexes.append(index)
+            self._required.append(len(index.callables) + len(index.data))
+            self._post(slot, index)
+        self._results.clear()
+
+    # ===== 查找 =====
+
+    def _match_type(self, tp: type) -> TypeMatch:
+        if has_custom_attribute_lookup(tp):
+            return None
+        namespace, _ = class_namespace(tp)
+        callable_postings, data_postings = self._callable_postings, self._data_postings
+        names = [n for n in namespace if n in callable_postings or n in data_postings]
+        if tp.__dictoffset__ or any(is_data_descriptor(namespace[n]) for n in names):
+            return frozenset(names)
+        hits: dict[int, int] = {}
+        for name in names:
+            slots = data_postings.get(name, ())
+            if namespace[name] is not None:
+                slots += callable_postings.get(name, ())
+            for i in slots:
+                hits[i] = hits.get(i, 0) + 1
+        required = self._required
+        return tuple(
+            sorted((*(i for i, n in hits.items() if n == required[i]), *self._always))
+        )
+
+    def _match_instance(self, obj: object, names: frozenset[str]) -> list[int]:
+        callable_postings, data_postings = self._callable_postings, self._data_postings
+        candidates: Iterable[str] = names
+        instance_dict = getattr(obj, "__dict__", None)
+        if type(instance_dict) is dict and instance_dict:
+            candidates = names.union(
+                n for n in instance_dict if n in callable_postings or n in data_postings
+            )
+        hits: dict[int, int] = {}
+        for name in candidates:
+            slots: tuple[int, ...] = ()
+            callables = callable_postings.get(name)
+            if callables and instance_getattr(obj, name, None) is not None:
+                slots = callables
+            data = data_postings.get(name)
+            if data and instance_hasattr(obj, name):
+                slots += data
+            for i in slots:
+                hits[i] = hits.get(i, 0) + 1
+        required = self._required
+        return sorted(
+            (*(i for i, n in hits.items() if n == required[i]), *self._always)
+        )
+
+    def lookup_type(self, tp: type) -> TypeMatch:
+        """按类型匹配并缓存，结果含义见 TypeMatch。"""
+        if self._pending or self._dead:
+            self._sync()
+        try:
+            return self._results[tp]
+        except KeyError:
+            result = self._results[tp] = self._match_type(tp)
+            return result
+
+    def match(self, obj: object) -> list[type]:
+        """返回 obj 满足的全部协议，按加入索引的顺序。"""
+        result = self.lookup_type(type(obj))
+        if type(result) is tuple:
+            matched: Iterable[int] = result
+        elif result is None:
+            matched = [
+                i
+                for i, index in enumerate(self._indexes)
+                if index is not None and _instance_satisfies(obj, index)
+            ]
+        else:
+            matched = self._match_instance(obj, result)
+        slots = self._slots
+        refs = (slots[i] for i in matched)
+        return [p for p in (r() for r in refs if r is not None) if p is not None]
+
+    def discard(self, tp: type) -> None:
+        self._results.pop(tp, None)
+
+    def clear(self) -> None:
+        self._results.clear()
+
+    def __len__(self) -> int:
+        return len(self._results)
@@ -1,69 +1,251 @@
+import copyreg
 import sys
-import types
+import time
+from hashlib import blake2b
 from types import new_class
-from typing import Protocol
+from typing import Any, Optional, Protocol
 
+from protocolx.checker.compiled_checker import install_compiled_checker
+from protocolx.checker.composed_protocol_meta import ComposedProtocolMeta
+from protocolx.checker.conformance_cache import install_conformance_cache
+from protocolx.checker.member_index import register_member_index, union_member_index
 from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.definition.type.runtime_mode import RuntimeMode
+from protocolx.global_var.composition_lock import single_flight
+from protocolx.global_var.composition_recorder import get_composition_recorder
+from protocolx.global_var.protocol_cache_stats import get_cache_counters
 from protocolx.global_var.protocol_cache import (
-    get_protocol,
-    get_protocol_cache,
-    set_protocol,
+    claim_protocol_name,
+    expire_protocols,
+    find_closest_composition,
+    get_anon_protocol_module,
+    get_composition_cache,
+    get_eviction_tracker,
+    get_precomposed,
+    get_weak_composition_cache,
+    peek_protocol,
+    publish_protocol,
 )
 
+# 组合类的配方 (ProtocolSequence, runtime) 存放在类自身 __dict__ 中；
+# _abc_ 前缀使 typing 收集协议成员时跳过该属性。
+RECIPE_ATTR = "_abc_protocolx_recipe"
+
+_composed = get_composition_cache()
+_weak_composed = get_weak_composition_cache()
+_eviction = get_eviction_tracker()
+_counters = get_cache_counters()
+_recorder = get_composition_recorder()
+
+
+def compose_from_recipe(bases: tuple[type, ...], runtime: RuntimeMode) -> type:
+    """
+    pickle 的重建入口：按配方组合，已缓存时直接复用。
+    配方只引用各协议类的完全限定名，反序列化不依赖目标进程预先组合过该类。
+    """
+    return compose_protocol(ProtocolSequence(bases), runtime=runtime)
+
+
+def get_import_path(proto: type) -> Optional[tuple[str, str]]:
+    """
+    协议类能按 module.qualname 找回同一对象时返回 (模块名, 限定名)，否则返回 None
+    （定义在函数内、types.new_class 创建或被同名对象遮蔽的通常不能）。
+    """
+    target: Any = sys.modules.get(proto.__module__)
+    for part in proto.__qualname__.split("."):
+        target = getattr(target, part, None)
+    if target is not proto:
+        return None
+    return proto.__module__, proto.__qualname__
+
+
+def _reduce_protocol_class(cls: type) -> Any:
+    """
+    协议类元类的 pickle 归约：组合类归约为配方；
+    配方中有协议无法按名称导入时，与其余协议类一样返回限定名，
+    按原有方式以全局名称（组合类经虚拟模块）序列化，仅限进程内往返。
+    """
+    recipe = cls.__dict__.get(RECIPE_ATTR)
+    if recipe is None:
+        return cls.__qualname__
+    bases, runtime = recipe
+    if any(get_import_path(b) is None for b in bases):
+        return cls.__qualname__
+    return compose_from_recipe, (tuple(bases), runtime)
+
+
+# pickle 对类对象优先查 copyreg.dispatch_table（按元类），再退回按名称序列化
+copyreg.pickle(ComposedProtocolMeta, _reduce_protocol_class)
+copyreg.pickle(type(Protocol), _reduce_protocol_class)
+
 
 def _ensure_anon_module() -> None:
     """确保虚拟模块 __anon_protocol__ 已注册到 sys.modules。"""
-    if "__anon_protocol__" not in sys.modules:
-        sys.modules["__anon_protocol__"] = types.ModuleType("__anon_protocol__")
+    get_anon_protocol_module()
+
+
+def _get_protocol_digest(bases: ProtocolSequence, runtime: RuntimeMode) -> str:
+    """
+    对协议的完全限定名（module.qualname）与 runtime 标志做内容摘要。
+    不依赖 hash()，因此与 PYTHONHASHSEED 无关，跨进程稳定。
+    """
+    identities = sorted(f"{b.__module__}.{b.__qualname__}" for b in bases)
+    payload = "\n".join([*identities, repr(runtime)]).encode()
+    return blake2b(payload, digest_size=8).hexdigest()
 
 
-def _get_anon_protocol_class_name(bases: ProtocolSequence, runtime: bool) -> str:
+def get_composition_name(bases: ProtocolSequence, runtime: RuntimeMode) -> str:
     """
-    根据协议组合与 runtime 标志生成唯一 class 名称。
+    返回 compose_protocol 为该组合使用的类名（基于摘要，跨进程稳定）。
+    名称经碰撞检测索引登记：摘要相同但协议类不同时自动追加序号后缀。
     """
-    key = (hash(bases), runtime)
-    # 只保留32位，避免过长
-    return f"_AnonProtocol_{abs(hash(key)) & 0xFFFF_FFFF:08x}"
+    return claim_protocol_name(
+        name=f"_AnonProtocol_{_get_protocol_digest(bases, runtime)}",
+        identity=(frozenset(bases), runtime),
+    )
 
 
 def _create_anon_protocol_class(
-    class_name: str, bases: ProtocolSequence, runtime: bool
+    class_name: str,
+    bases: ProtocolSequence,
+    runtime: RuntimeMode,
+    parent: Optional[tuple[ProtocolSequence, type]] = None,
 ) -> type:
     """
     动态创建 Protocol 匿名组合类，并根据 runtime 标志可选 runtime_checkable。
+    runtime 为真时挂载按具体类型的一致性缓存；
+    runtime="compiled" 时额外挂载预编译的 isinstance / issubclass 快速路径。
+    parent 为已缓存的子集组合 (协议集合, 组合类) 时，以该组合类为基类，
+    只追加其余协议。
     """
+    kwds: dict[str, Any] = {"metaclass": ComposedProtocolMeta} if runtime else {}
+    if parent is None:
+        class_bases = tuple(bases)
+    else:
+        class_bases = (parent[1], *bases.difference(parent[0]))
     proto_cls = new_class(
-        class_name, tuple(bases) + (Protocol,), exec_body=lambda ns: None
+        class_name, class_bases + (Protocol,), kwds, exec_body=lambda ns: None
     )
+    members = None
     if runtime:
         from typing import runtime_checkable
 
         proto_cls = runtime_checkable(proto_cls)
+        # 组合的成员索引由各直接基类（父组合与追加协议）的缓存索引合并而来
+        members = union_member_index(class_bases)
+        register_member_index(proto_cls, members)
+        install_conformance_cache(proto_cls, members)
+    if runtime == "compiled":
+        install_compiled_checker(proto_cls, members)
+    setattr(proto_cls, RECIPE_ATTR, (bases, runtime))
     proto_cls.__module__ = "__anon_protocol__"
     return proto_cls
 
 
-def _attach_class_to_anon_module(class_name: str, cls: type) -> None:
+def as_protocol_sequence(proto: type | ProtocolSequence) -> ProtocolSequence:
     """
-    将匿名协议类挂载到虚拟模块 __anon_protocol__，便于 pickle/import 兼容。
+    组合类还原为其组合的协议集合；ProtocolSequence 原样返回，
+    其他协议类视为只含自身的集合。
     """
-    setattr(sys.modules["__anon_protocol__"], class_name, cls)
+    if isinstance(proto, ProtocolSequence):
+        return proto
+    recipe = proto.__dict__.get(RECIPE_ATTR)
+    if recipe is not None:
+        return recipe[0]
+    return ProtocolSequence([proto])
+
+
+def _has_mro_conflict(class_bases: tuple[type, ...]) -> bool:
+    """按 C3 线性化判断这些基类能否构成一致的 MRO。"""
+    sequences = [list(base.__mro__) for base in class_bases] + [list(class_bases)]
+    while True:
+        sequences = [seq for seq in sequences if seq]
+        if not sequences:
+            return False
+        for seq in sequences:
+            head = seq[0]
+            if not any(head in other[1:] for other in sequences):
+                break
+        else:
+            return True
+        for seq in sequences:
+            if seq[0] is head:
+                del seq[0]
+
+
+def _create_incremental(
+    class_name: str, bases: ProtocolSequence, runtime: RuntimeMode
+) -> type:
+    """以最接近的已缓存子集组合为基类创建；无可复用组合或 MRO 冲突时整体创建。"""
+    parent = find_closest_composition(bases, runtime)
+    if parent is not None:
+        try:
+            return _create_anon_protocol_class(class_name, bases, runtime, parent)
+        except TypeError:
+            # 只在父类 MRO 与追加的协议无法线性化时退回整体创建，其余错误照常抛出
+            class_bases = (parent[1], *bases.difference(parent[0]), Protocol)
+            if not _has_mro_conflict(class_bases):
+                raise
+    return _create_anon_protocol_class(class_name, bases, runtime)
 
 
-def compose_protocol(bases: ProtocolSequence, *, runtime: bool = False) -> type:
+def _compose_via_registry(
+    bases: ProtocolSequence, runtime: RuntimeMode, incremental: bool = False
+) -> type:
     """
-    动态组合匿名 Protocol，具备可选的 runtime_checkable 能力。
-    始终保证结果挂载在虚拟模块 __anon_protocol__ 下，
-    以便 pickle / import 能正确解析。
+    二级路径：按类名查找虚拟模块 __anon_protocol__ 与预组合模块，未命中则创建；
+    结果挂载到虚拟模块（便于 pickle/import 兼容）并回填一级缓存。
+    同名组合单飞：只由一个线程创建，其余线程等待后复用同一个类对象。
     """
     _ensure_anon_module()
-    class_name = _get_anon_protocol_class_name(bases, runtime)
-    # 已经存在直接复用
-    if class_name in get_protocol_cache():
-        protocol_class = get_protocol(name=class_name)
-        assert protocol_class is not None
-        return protocol_class
-    cls = _create_anon_protocol_class(class_name, bases, runtime)
-    _attach_class_to_anon_module(class_name, cls)
-    set_protocol(name=class_name, cls=cls)
+    class_name = get_composition_name(bases, runtime)
+    with single_flight(class_name):
+        # 已经存在（或由预组合模块提供）直接复用
+        cls = peek_protocol(name=class_name) or get_precomposed(name=class_name)
+        if cls is None:
+            start = time.perf_counter()
+            if incremental:
+                cls = _create_incremental(class_name, bases, runtime)
+            else:
+                cls = _create_anon_protocol_class(class_name, bases, runtime)
+            _counters.record_creation(time.perf_counter() - start)
+        publish_protocol(name=class_name, key=(bases, runtime), cls=cls)
+    if _recorder.active:
+        _recorder.record((bases, runtime))
     return cls
+
+
+def compose_protocol(
+    bases: ProtocolSequence,
+    *,
+    runtime: RuntimeMode = False,
+    incremental: bool = False,
+) -> type:
+    """
+    动态组合匿名 Protocol，具备可选的 runtime_checkable 能力。
+    runtime="compiled" 时在组合阶段预计算成员集合并生成专用检查函数，
+    isinstance / issubclass 不再经过 typing 的 MRO 遍历。
+    incremental=True 时，新组合以一级缓存中最大的子集组合为基类创建，
+    复用其 MRO 与成员集合；结果与整体创建的组合在语义上等价、缓存键相同。
+    始终保证结果挂载在虚拟模块 __anon_protocol__ 下，以便按名称 import 能正确解析；
+    pickle 时组合类归约为配方 (协议类, runtime)，反序列化按需重建或复用缓存。
+    线程安全：缓存命中无锁，未命中时同一组合只创建一次。
+    """
+    # 一级缓存命中：一次字典查找直接返回
+    cls = _composed.get((bases, runtime))
+    if cls is not None:
+        _counters.hits += 1
+        if _eviction.policy is not None and _eviction.touch(cls.__name__):
+            expire_protocols()
+        return cls
+    if _weak_composed:
+        # 弱引用模式：再查弱引用缓存（淘汰策略不作用于弱引用持有的组合）
+        ref = _weak_composed.get((bases, runtime))
+        cls = ref() if ref is not None else None
+        if cls is not None:
+            _counters.hits += 1
+            return cls
+    _counters.misses += 1
+    if not isinstance(bases, ProtocolSequence):
+        raise TypeError(f"{bases!r} is not a ProtocolSequence")
+    return _compose_via_registry(bases, runtime, incremental)
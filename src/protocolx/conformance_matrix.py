@@ -0,0 +1,135 @@
+from itertools import chain
+from typing import Any, Iterable, Literal
+
+from protocolx.checker.compiled_checker import class_namespace
+from protocolx.checker.member_index import (
+    MemberIndex,
+    get_member_index,
+    union_member_index,
+)
+from protocolx.definition.type.conformance_matrix import ConformanceMatrix
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 为可选依赖，缺失时使用纯 Python 位集实现
+    np = None  # type: ignore[assignment]
+
+MatrixBackend = Literal["auto", "numpy", "python"]
+
+# backend="auto" 时使用 NumPy 的最小表格规模（类型数 × 协议数）；更小的表 NumPy 的固定开销占主导
+_NUMPY_MIN_CELLS = 256
+
+
+def _required_members(proto: type | ProtocolSequence) -> MemberIndex:
+    if isinstance(proto, ProtocolSequence):
+        return union_member_index(proto)
+    return get_member_index(proto)
+
+
+def _type_members(tp: type, columns: dict[str, int]) -> tuple[list[int], list[int]]:
+    """
+    返回类型在成员列上的存在情况：(非 None 定义的列, 已定义或已注解的列)。
+    方法成员要求前者，数据成员只要求后者。
+    """
+    namespace, annotated = class_namespace(tp)
+    present = columns.keys() & namespace.keys()
+    non_none = [columns[name] for name in present if namespace[name] is not None]
+    defined = [columns[name] for name in present | (columns.keys() & annotated)]
+    return non_none, defined
+
+
+def _to_bits(cols: Iterable[int]) -> int:
+    bits = 0
+    for col in cols:
+        bits |= 1 << col
+    return bits
+
+
+def _solve_python(
+    presence: list[tuple[list[int], list[int]]],
+    required: list[tuple[list[int], list[int]]],
+) -> tuple[int, ...]:
+    reqs = [(_to_bits(c), _to_bits(d)) for c, d in required]
+    rows = []
+    for non_none_cols, defined_cols in presence:
+        non_none, defined = _to_bits(non_none_cols), _to_bits(defined_cols)
+        row = 0
+        for j, (callables, data) in enumerate(reqs):
+            if not callables & ~non_none and not data & ~defined:
+                row |= 1 << j
+        rows.append(row)
+    return tuple(rows)
+
+
+def _solve_numpy(
+    presence: list[tuple[list[int], list[int]]],
+    required: list[tuple[list[int], list[int]]],
+    width: int,
+) -> tuple[int, ...]:
+    def fill(rows: list[list[int]]) -> Any:
+        # 一次花式索引写入全部 (行, 列)，不逐行赋值
+        matrix = np.zeros((len(rows), width), dtype=np.float32)
+        lengths = np.fromiter(map(len, rows), dtype=np.intp, count=len(rows))
+        cols = np.fromiter(
+            chain.from_iterable(rows), dtype=np.intp, count=lengths.sum()
+        )
+        matrix[np.repeat(np.arange(len(rows)), lengths), cols] = 1
+        return matrix
+
+    non_none = fill([p[0] for p in presence])
+    defined = fill([p[1] for p in presence])
+    callables = fill([r[0] for r in required])
+    data = fill([r[1] for r in required])
+    # 缺失成员计数：要求的列中类型未提供的数量，为 0 即满足；
+    # float32 走 BLAS 矩阵乘法，计数不超过成员数，精确无误差
+    missing = (1 - non_none) @ callables.T + (1 - defined) @ data.T
+    packed = np.packbits(missing == 0, axis=1, bitorder="little")
+    stride = packed.shape[1]
+    if not stride:
+        return (0,) * len(presence)
+    raw = packed.tobytes()
+    return tuple(
+        int.from_bytes(raw[start : start + stride], "little")
+        for start in range(0, len(raw), stride)
+    )
+
+
+def conformance_matrix(
+    types: Iterable[type],
+    protocols: Iterable[type | ProtocolSequence],
+    *,
+    backend: MatrixBackend = "auto",
+) -> ConformanceMatrix:
+    """
+    一次性求出类型 × 协议的一致性表（协议可为 ProtocolSequence 或协议类）。
+    先建立类型 × 成员的存在矩阵，每个 (类型, 成员) 只判定一次，
+    再以批量运算求出全部结果：backend="numpy" 用矩阵乘法，"python" 用整数位集，
+    "auto" 在安装了 NumPy 且表格不小于 _NUMPY_MIN_CELLS 时使用前者。
+    判定在类型层面进行：方法成员须在 MRO 上定义且不为 None，
+    数据成员在 MRO 上定义或注解即可；不考虑 __getattr__ 与实例属性。
+    """
+    types = tuple(types)
+    protocols = tuple(protocols)
+    if backend not in ("auto", "numpy", "python"):
+        raise ValueError(f"unknown backend {backend!r}")
+    if backend == "numpy" and np is None:
+        raise ImportError("backend='numpy' requires NumPy to be installed")
+    indexes = [_required_members(p) for p in protocols]
+    names: set[str] = set()
+    for index in indexes:
+        names |= index.names
+    columns = {name: col for col, name in enumerate(sorted(names))}
+    required = [
+        ([columns[n] for n in index.callables], [columns[n] for n in index.data])
+        for index in indexes
+    ]
+    presence = [_type_members(tp, columns) for tp in types]
+    if backend == "auto":
+        large = len(types) * len(protocols) >= _NUMPY_MIN_CELLS
+        backend = "numpy" if np is not None and large else "python"
+    if backend == "numpy":
+        rows = _solve_numpy(presence, required, len(columns))
+    else:
+        rows = _solve_python(presence, required)
+    return ConformanceMatrix(types, protocols, rows)
@@ -0,0 +1,9 @@
+from typing import Literal, TypeAlias
+
+CacheMode: TypeAlias = Literal["strong", "weak"]
+"""
+组合缓存对组合类的持有方式：
+- "strong"：缓存强引用组合类（默认），组合类与其协议在清空或淘汰之前一直存活；
+- "weak"：缓存只弱引用组合类，外部不再引用时组合类连同只被它引用的协议一起被回收，
+  缓存条目随之移除，适合反复创建临时协议的长期运行进程。
+"""
@@ -0,0 +1,33 @@
+from typing import NamedTuple
+
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+
+
+class ConformanceMatrix(NamedTuple):
+    """
+    类型 × 协议一致性表。
+    - types / protocols：行与列的顺序即输入顺序；
+    - rows：每个类型一行，第 j 位为 1 表示该类型满足 protocols[j]。
+    """
+
+    types: tuple[type, ...]
+    protocols: tuple[type | ProtocolSequence, ...]
+    rows: tuple[int, ...]
+
+    def conforms(self, tp: type, proto: type | ProtocolSequence) -> bool:
+        row = self.rows[self.types.index(tp)]
+        return bool(row >> self.protocols.index(proto) & 1)
+
+    def protocols_for(self, tp: type) -> list[type | ProtocolSequence]:
+        """tp 满足的全部协议，按输入顺序。"""
+        row = self.rows[self.types.index(tp)]
+        return [p for j, p in enumerate(self.protocols) if row >> j & 1]
+
+    def types_for(self, proto: type | ProtocolSequence) -> list[type]:
+        """满足 proto 的全部类型，按输入顺序。"""
+        j = self.protocols.index(proto)
+        return [tp for tp, row in zip(self.types, self.rows) if row >> j & 1]
+
+    def to_lists(self) -> list[list[bool]]:
+        width = len(self.protocols)
+        return [[bool(row >> j & 1) for j in range(width)] for row in self.rows]
@@ -0,0 +1,15 @@
+from typing import Literal, NamedTuple, Optional
+
+
+class EvictionPolicy(NamedTuple):
+    """
+    全局协议缓存的淘汰策略。
+    - max_entries：最多保留的组合类数量，None 表示不限；
+    - strategy：超出上限时按最近最少使用（lru）或最不经常使用（lfu）淘汰；
+    - ttl：闲置超过该秒数的组合类被淘汰，None 表示不过期。
+    被固定（pin）的组合类永不淘汰。
+    """
+
+    max_entries: Optional[int] = None
+    strategy: Literal["lru", "lfu"] = "lru"
+    ttl: Optional[float] = None
@@ -0,0 +1,14 @@
+from typing import NamedTuple
+
+from protocolx.definition.type.runtime_mode import RuntimeMode
+
+
+class ProtocolCacheSnapshot(NamedTuple):
+    """
+    协议缓存快照：紧凑的组合配方列表，可 pickle，也可直接写成 JSON。
+    - protocols：协议类引用 module:qualname，每个协议只出现一次；
+    - compositions：每个组合为 (protocols 中的下标, runtime)。
+    """
+
+    protocols: tuple[str, ...]
+    compositions: tuple[tuple[tuple[int, ...], RuntimeMode], ...]
@@ -1,4 +1,9 @@
+import sys
+from bisect import bisect_right
+from heapq import merge
+from operator import attrgetter
 from typing import (
+    Iterable,
     Iterator,
     Optional,
     Sequence,
@@ -7,40 +12,109 @@ from typing import (
     overload,
 )
 
+from protocolx.global_var.protocol_cache_stats import get_cache_counters
+from protocolx.global_var.protocol_registry import get_protocol_id, peek_protocol_id
+
+_counters = get_cache_counters()
+
+
+_name_of = attrgetter("__name__")
+
+
+def _canonical_key(cls: type) -> tuple[str, str, str]:
+    # 同名协议（来自不同模块）以完全限定名决定次序，保证规范形式稳定
+    return (cls.__name__, cls.__module__, cls.__qualname__)
+
+
+def _canonical_sorted(protocols: Iterable[type]) -> list[type]:
+    """按 _canonical_key 排序；先只按类名排序，出现同名协议时才按完整键重排。"""
+    items = sorted(protocols, key=_name_of)
+    if len(dict.fromkeys(map(_name_of, items))) < len(items):
+        items.sort(key=_canonical_key)
+    return items
+
 
 class ProtocolSequence(Sequence[type]):
     """
     专属的 Protocol 类型有序集合，只允许 Protocol 子类项。
     排序、名字和哈希全部惰性计算，真正需要时才会执行。
+    每个协议类在注册表中有唯一整数编号，集合以编号位掩码为规范身份：
+    去重、哈希、相等与子集判断都是整数运算，不需要排序。
+    使用 __slots__ 布局；规范形式算出后即释放原始输入元组，名称字符串统一驻留。
+    集合运算（union / intersection / difference / add）复用操作数的位掩码与
+    已排好的规范形式，只校验新增的协议类，不重新排序。
     """
 
+    __slots__ = ("_original_items", "_mask", "_items", "_names", "_hash")
+
     def __init__(self, items: Sequence[type]) -> None:
-        self._original_items: tuple[type, ...] = tuple(items)
+        self._original_items: Optional[tuple[type, ...]] = tuple(items)
+        self._mask: Optional[int] = None
         self._items: Optional[tuple[type, ...]] = None
         self._names: Optional[tuple[str, ...]] = None
         self._hash: Optional[int] = None
 
+    @classmethod
+    def _derive(
+        cls,
+        mask: int,
+        *,
+        items: Optional[tuple[type, ...]] = None,
+        source: Optional[tuple[type, ...]] = None,
+    ) -> "ProtocolSequence":
+        """
+        由集合运算构造结果：位掩码已知，items 为已排好的规范形式；
+        否则 source 为尚未排序（可含重复）的协议类，排序推迟到首次访问。
+        """
+        seq = cls.__new__(cls)
+        seq._original_items = source
+        seq._mask = mask
+        seq._items = items
+        seq._names = None
+        seq._hash = None
+        return seq
+
+    def _source(self) -> tuple[type, ...]:
+        """返回规范形式，尚未排序时返回原始输入。"""
+        # 先读原始元组：为 None 说明排序已完成（先写 _items 再释放原始元组）
+        source = self._original_items
+        if source is None:
+            source = self._items
+        assert source is not None
+        return source
+
+    def _ensure_mask(self) -> None:
+        if self._mask is None:
+            source = self._source()
+            _counters.validations += 1
+            mask = 0
+            for b in source:
+                # 首次遇到的协议类在注册时校验，非法项抛出 TypeError
+                mask |= 1 << get_protocol_id(b)
+            self._mask = mask
+
     def _ensure_sorted(self) -> None:
         if self._items is None:
-            for b in self._original_items:
-                if not isinstance(b, type):
-                    raise TypeError(f"{b} is not a type")
-                if not getattr(b, "_is_protocol", False):
-                    raise TypeError(f"{b} is not a subclass of Protocol")
-            self._items = tuple(
-                sorted(set(self._original_items), key=lambda cls: cls.__name__)
-            )
+            self._ensure_mask()
+            original = self._original_items
+            if original is None:
+                # 其他线程已完成规范化
+                return
+            items = tuple(_canonical_sorted(set(original)))
+            # 输入本身已是规范形式时直接复用，不再额外持有一份元组
+            self._items = original if items == original else items
+            self._original_items = None
 
     def _ensure_names(self) -> None:
         if self._names is None:
             self._ensure_sorted()
             assert self._items is not None
-            self._names = tuple(cls.__name__ for cls in self._items)
+            self._names = tuple(sys.intern(cls.__name__) for cls in self._items)
 
     def _ensure_hash(self) -> None:
         if self._hash is None:
-            self._ensure_names()
-            self._hash = hash(self._names)
+            self._ensure_mask()
+            self._hash = hash(self._mask)
 
     def __iter__(self) -> Iterator[type]:
         self._ensure_sorted()
@@ -48,9 +122,11 @@ class ProtocolSequence(Sequence[type]):
         return iter(self._items)
 
     def __len__(self) -> int:
-        self._ensure_sorted()
-        assert self._items is not None
-        return len(self._items)
+        return self.mask.bit_count()
+
+    def __contains__(self, value: object) -> bool:
+        pid = peek_protocol_id(value)
+        return pid is not None and bool(self.mask >> pid & 1)
 
     @overload
     def __getitem__(self, index: SupportsIndex) -> type: ...
@@ -73,18 +149,95 @@ class ProtocolSequence(Sequence[type]):
         names = ", ".join(self._names)
         return f"ProtocolSequence({names})"
 
+    def __reduce__(self) -> tuple[type, tuple[tuple[type, ...]]]:
+        # 编号只在本进程有效：按协议类序列化，加载时重新登记编号
+        return (type(self), (self._source(),))
+
     def __hash__(self) -> int:
         self._ensure_hash()
         assert self._hash is not None
         return self._hash
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, ProtocolSequence):
             return False
-        return self.names == other.names
+        # 双方哈希都已缓存时先比哈希：哈希不同必不相等
+        if (
+            self._hash is not None
+            and other._hash is not None
+            and self._hash != other._hash
+        ):
+            return False
+        # 按编号位掩码比较：同名但不同模块的协议编号不同，不会相等
+        return self.mask == other.mask
 
     @property
     def names(self) -> tuple[str, ...]:
         self._ensure_names()
         assert self._names is not None
         return self._names
+
+    @property
+    def mask(self) -> int:
+        """协议编号位掩码，第 i 位为 1 表示包含编号为 i 的协议。"""
+        self._ensure_mask()
+        assert self._mask is not None
+        return self._mask
+
+    def _filter(self, mask: int) -> "ProtocolSequence":
+        """保留编号在 mask 中的协议；已排序的规范形式过滤后仍然有序。"""
+        items = self._items
+        source = self._source() if items is None else items
+        kept = tuple(p for p in source if mask >> get_protocol_id(p) & 1)
+        if items is None:
+            return self._derive(mask, source=kept)
+        return self._derive(mask, items=kept)
+
+    def add(self, proto: type) -> "ProtocolSequence":
+        """返回加入 proto 后的新集合；已包含时返回自身。只校验 proto。"""
+        bit = 1 << get_protocol_id(proto)
+        mask = self.mask
+        if mask & bit:
+            return self
+        items = self._items
+        if items is None:
+            return self._derive(mask | bit, source=self._source() + (proto,))
+        i = bisect_right(items, _canonical_key(proto), key=_canonical_key)
+        return self._derive(mask | bit, items=items[:i] + (proto,) + items[i:])
+
+    def union(self, other: "ProtocolSequence") -> "ProtocolSequence":
+        mask = self.mask | other.mask
+        if mask == self._mask:
+            return self
+        if mask == other._mask:
+            return other
+        a, b = self._items, other._items
+        if a is None or b is None:
+            return self._derive(mask, source=self._source() + other._source())
+        # 两个规范形式归并后按身份去重，O(n + m)
+        return self._derive(
+            mask, items=tuple(dict.fromkeys(merge(a, b, key=_canonical_key)))
+        )
+
+    def intersection(self, other: "ProtocolSequence") -> "ProtocolSequence":
+        mask = self.mask & other.mask
+        if mask == self._mask:
+            return self
+        if mask == other._mask:
+            return other
+        return self._filter(mask)
+
+    def difference(self, other: "ProtocolSequence") -> "ProtocolSequence":
+        mask = self.mask & ~other.mask
+        if mask == self._mask:
+            return self
+        return self._filter(mask)
+
+    def issubset(self, other: "ProtocolSequence") -> bool:
+        mask = self.mask
+        return mask & other.mask == mask
+
+    def issuperset(self, other: "ProtocolSequence") -> bool:
+        return other.issubset(self)
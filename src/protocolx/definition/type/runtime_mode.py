@@ -0,0 +1,9 @@
+from typing import Literal, TypeAlias
+
+RuntimeMode: TypeAlias = bool | Literal["compiled"]
+"""
+compose_protocol 的运行时检查模式：
+- False：纯静态协议，不支持 isinstance / issubclass；
+- True：typing.runtime_checkable，由 typing 完成结构检查；
+- "compiled"：在 runtime_checkable 基础上，组合时预计算成员集合并生成专用检查函数。
+"""
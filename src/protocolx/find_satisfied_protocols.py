@@ -0,0 +1,31 @@
+import threading
+from typing import Optional
+
+from protocolx.checker.member_posting_index import MemberPostingIndex
+from protocolx.global_var.protocol_cache import register_composition_listener
+
+# 覆盖缓存中全部组合协议的倒排索引；首次查找时建立，之后随组合缓存增量更新
+_INDEX: Optional[MemberPostingIndex] = None
+_LOCK = threading.Lock()
+
+
+def get_member_posting_index() -> MemberPostingIndex:
+    """返回覆盖缓存中全部组合协议的倒排索引，组合加入或移出缓存时增量更新。"""
+    global _INDEX
+    index = _INDEX
+    if index is not None:
+        return index
+    with _LOCK:
+        if _INDEX is None:
+            index = MemberPostingIndex()
+            register_composition_listener(index)
+            _INDEX = index
+    return _INDEX
+
+
+def find_satisfied_protocols(obj: object) -> list[type]:
+    """
+    返回 obj 满足的全部已组合协议（结构检查，不要求 runtime_checkable），
+    顺序同组合先后。借助成员名倒排索引，耗时与 obj 的成员数成正比，结果按具体类型缓存。
+    """
+    return get_member_posting_index().match(obj)
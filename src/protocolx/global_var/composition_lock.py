@@ -0,0 +1,42 @@
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class _KeyLock:
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        # 可重入：创建过程中按名称重建被淘汰的同名类不会自锁
+        self.lock = threading.RLock()
+        self.users = 0
+
+
+_GUARD = threading.Lock()
+_KEY_LOCKS: dict[str, _KeyLock] = {}
+
+
+@contextmanager
+def single_flight(name: str) -> Iterator[None]:
+    """
+    按组合类名加锁，保证同一组合只由一个线程创建，其余线程等待后复用结果。
+    锁按引用计数回收，不随组合数量增长。
+    """
+    with _GUARD:
+        entry = _KEY_LOCKS.get(name)
+        if entry is None:
+            entry = _KEY_LOCKS[name] = _KeyLock()
+        entry.users += 1
+    try:
+        with entry.lock:
+            yield
+    finally:
+        with _GUARD:
+            entry.users -= 1
+            if entry.users == 0:
+                del _KEY_LOCKS[name]
+
+
+def get_pending_lock_count() -> int:
+    """当前持有或等待中的组合锁数量（用于诊断）。"""
+    return len(_KEY_LOCKS)
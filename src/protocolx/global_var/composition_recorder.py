@@ -0,0 +1,44 @@
+import threading
+from typing import Hashable, Iterable
+
+
+class _CompositionRecorder:
+    """
+    组合使用记录器：按首次解析顺序记录不同的 (ProtocolSequence, runtime)。
+    只在 compose_protocol 的未命中路径埋点，关闭时命中路径没有任何额外开销。
+    """
+
+    __slots__ = ("active", "_seen", "lock")
+
+    def __init__(self) -> None:
+        self.active = False
+        self._seen: dict[Hashable, None] = {}
+        self.lock = threading.Lock()
+
+    def start(self, seed: Iterable[Hashable] = ()) -> None:
+        with self.lock:
+            self._seen = dict.fromkeys(seed)
+            self.active = True
+
+    def stop(self) -> list[Hashable]:
+        with self.lock:
+            self.active = False
+            return list(self._seen)
+
+    def record(self, key: Hashable) -> None:
+        if key not in self._seen:
+            with self.lock:
+                if self.active:
+                    self._seen.setdefault(key, None)
+
+    def snapshot(self) -> list[Hashable]:
+        with self.lock:
+            return list(self._seen)
+
+
+_RECORDER = _CompositionRecorder()
+
+
+def get_composition_recorder() -> _CompositionRecorder:
+    """返回全局组合记录器；对象在进程内始终是同一个。"""
+    return _RECORDER
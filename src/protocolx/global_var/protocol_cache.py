@@ -1,11 +1,148 @@
 import sys
+import threading
 import types
-from typing import MutableMapping
+import weakref
+from typing import Any, Hashable, MutableMapping, Optional
+from weakref import WeakSet
+
+from protocolx.definition.type.cache_mode import CacheMode
+from protocolx.definition.type.eviction_policy import EvictionPolicy
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.definition.type.runtime_mode import RuntimeMode
+from protocolx.global_var.protocol_cache_stats import get_cache_counters
+from protocolx.global_var.protocol_eviction import EvictionTracker
+
+# 碰撞检测索引：类名 → 该名称所代表的组合身份（协议类集合与 runtime 标志）。
+_NAME_INDEX: dict[str, Hashable] = {}
+
+# 一级组合缓存：(ProtocolSequence, runtime) → 组合类，命中只需一次字典查找。
+# 虚拟模块 __anon_protocol__ 作为二级注册表，负责 pickle / import 解析。
+_COMPOSED: dict[Hashable, type] = {}
+
+# 淘汰策略生效时：类名 → (ProtocolSequence, runtime) 重建配方。
+# 被淘汰的类仍保留配方，按名称访问（含 pickle）时按需重建。
+_RECIPES: dict[str, Hashable] = {}
+
+_EVICTION = EvictionTracker()
+
+# 预组合模块（protocolx.precompose 生成）中的组合类：类名 → 类。
+# 不随缓存清空而失效，缓存未命中时据此解析，保持与模块中类对象的身份一致。
+_PRECOMPOSED: dict[str, type] = {}
+
+# 反向索引：协议的完全限定名（module.qualname）→ 依赖它的组合类名 → 缓存键。
+# 含被淘汰但保留配方的组合；按名称而非类对象索引，重新加载后的同名协议也能命中。
+_DEPENDENTS: dict[str, dict[str, Hashable]] = {}
+
+# 子集查找索引：组合中编号最小的协议的位序号 → 组合类名 → 缓存键，与反向索引同步维护。
+# bases 的子集组合，其编号最小的协议必在 bases 中，查找时只需查看 bases 各协议对应的条目。
+_BY_LOWEST_PROTOCOL: dict[int, dict[str, Hashable]] = {}
+
+# 弱引用模式下的组合缓存：缓存键 → 组合类弱引用，类名 → (弱引用, 缓存键)。
+# 组合类被回收时由弱引用回调移除条目与名称索引，释放对协议类的引用。
+_CACHE_MODE: CacheMode = "strong"
+_WEAK_COMPOSED: dict[Hashable, "weakref.ref[type]"] = {}
+_WEAK_NAMES: dict[str, tuple["weakref.ref[type]", Hashable]] = {}
+
+# 组合缓存的监听者（如成员倒排索引）：组合类进出缓存时同步更新，无需整体重建。
+# 成员需提供 add_protocol(cls)、remove_protocol(cls) 与 clear_protocols()，在注册表锁内调用；
+# 弱引用持有的组合类被回收时不通知，监听者自行弱引用组合类。
+_LISTENERS: "WeakSet[Any]" = WeakSet()
+
+# 注册表锁：保护虚拟模块、一级缓存、配方与淘汰簿记之间的一致性。
+# 一级缓存命中路径不取此锁。
+_REGISTRY_LOCK = threading.RLock()
+
+
+def _getattr_evicted(name: str) -> type:
+    """虚拟模块的 __getattr__：弱引用持有的组合类直接返回，被淘汰的组合类按配方重建。"""
+    entry = _WEAK_NAMES.get(name)
+    if entry is not None:
+        cls = entry[0]()
+        if cls is not None:
+            return cls
+    recipe = _RECIPES.get(name)
+    if recipe is None:
+        raise AttributeError(f"module '__anon_protocol__' has no attribute {name!r}")
+    from protocolx.compose_protocol import compose_protocol
+
+    bases, runtime = recipe  # type: ignore[misc]
+    return compose_protocol(bases, runtime=runtime)
+
+
+def _notify_added(cls: type) -> None:
+    for listener in list(_LISTENERS):
+        listener.add_protocol(cls)
+
+
+def _notify_removed(cls: type) -> None:
+    for listener in list(_LISTENERS):
+        listener.remove_protocol(cls)
+
+
+def _notify_cleared() -> None:
+    for listener in list(_LISTENERS):
+        listener.clear_protocols()
+
+
+def register_composition_listener(listener: Any) -> None:
+    """
+    登记组合缓存的监听者：先按当前缓存中的全部组合类调用 add_protocol，
+    之后组合类进出缓存时收到 add_protocol / remove_protocol / clear_protocols。
+    """
+    with _REGISTRY_LOCK:
+        for _, cls in get_cached_compositions():
+            listener.add_protocol(cls)
+        _LISTENERS.add(listener)
+
+
+def _qualified_name(proto: type) -> str:
+    return f"{proto.__module__}.{proto.__qualname__}"
+
+
+def _lowest_protocol(bases: ProtocolSequence) -> int:
+    mask = bases.mask
+    return (mask & -mask).bit_length()
+
+
+def _index_dependents(name: str, key: Hashable) -> None:
+    bases, _ = key  # type: ignore[misc]
+    for base in bases:
+        _DEPENDENTS.setdefault(_qualified_name(base), {})[name] = key
+    _BY_LOWEST_PROTOCOL.setdefault(_lowest_protocol(bases), {})[name] = key
+
+
+def _unindex_dependents(name: str, key: Hashable) -> None:
+    bases, _ = key  # type: ignore[misc]
+    lowest = _lowest_protocol(bases)
+    siblings = _BY_LOWEST_PROTOCOL.get(lowest)
+    if siblings is not None and siblings.get(name) == key:
+        del siblings[name]
+        if not siblings:
+            del _BY_LOWEST_PROTOCOL[lowest]
+    for base in bases:
+        qualified = _qualified_name(base)
+        dependents = _DEPENDENTS.get(qualified)
+        if dependents is not None:
+            dependents.pop(name, None)
+            if not dependents:
+                del _DEPENDENTS[qualified]
 
 
 def get_anon_protocol_module() -> types.ModuleType:
     if "__anon_protocol__" not in sys.modules:
-        sys.modules["__anon_protocol__"] = types.ModuleType("__anon_protocol__")
+        module = types.ModuleType("__anon_protocol__")
+        module.__getattr__ = _getattr_evicted  # type: ignore[method-assign]
+        sys.modules["__anon_protocol__"] = module
+        # 新模块中没有任何组合类，依附旧模块的一级缓存与名称索引随之作废
+        _COMPOSED.clear()
+        _NAME_INDEX.clear()
+        _RECIPES.clear()
+        _DEPENDENTS.clear()
+        _BY_LOWEST_PROTOCOL.clear()
+        _WEAK_COMPOSED.clear()
+        _WEAK_NAMES.clear()
+        _EVICTION.clear()
+        _notify_cleared()
     return sys.modules["__anon_protocol__"]
 
 
@@ -16,14 +153,83 @@ def get_protocol_cache() -> MutableMapping[str, type]:
 
 def clear_protocol_cache() -> None:
     """清空虚拟模块 __anon_protocol__ 中的所有协议类。"""
-    module = get_anon_protocol_module()
-    to_del = [k for k in vars(module) if k.startswith("_AnonProtocol_")]
-    for k in to_del:
-        delattr(module, k)
+    with _REGISTRY_LOCK:
+        module = get_anon_protocol_module()
+        to_del = [k for k in vars(module) if k.startswith("_AnonProtocol_")]
+        for k in to_del:
+            delattr(module, k)
+        _NAME_INDEX.clear()
+        _COMPOSED.clear()
+        _RECIPES.clear()
+        _DEPENDENTS.clear()
+        _BY_LOWEST_PROTOCOL.clear()
+        _WEAK_COMPOSED.clear()
+        _WEAK_NAMES.clear()
+        _EVICTION.clear()
+        _notify_cleared()
+
+
+def get_composition_cache() -> MutableMapping[Hashable, type]:
+    """
+    返回一级组合缓存，键为 (ProtocolSequence, runtime)。
+    返回对象在进程内始终是同一个 dict，调用方可长期持有引用。
+    """
+    return _COMPOSED
+
+
+def get_weak_composition_cache() -> MutableMapping[Hashable, "weakref.ref[type]"]:
+    """
+    返回弱引用模式下的组合缓存，键同一级缓存，值为组合类的弱引用。
+    返回对象在进程内始终是同一个 dict，调用方可长期持有引用。
+    """
+    return _WEAK_COMPOSED
+
+
+def get_registry_memory() -> int:
+    """注册表簿记结构（名称索引、一级缓存、配方、反向索引、弱引用缓存等）自身占用的字节数。"""
+    with _REGISTRY_LOCK:
+        containers: list[object] = [
+            _NAME_INDEX,
+            _COMPOSED,
+            _RECIPES,
+            _PRECOMPOSED,
+            _DEPENDENTS,
+            _BY_LOWEST_PROTOCOL,
+            _WEAK_COMPOSED,
+            _WEAK_NAMES,
+            vars(get_anon_protocol_module()),
+        ]
+        containers += _DEPENDENTS.values()
+        containers += _BY_LOWEST_PROTOCOL.values()
+        containers += _WEAK_COMPOSED.values()
+        containers += _WEAK_NAMES.values()
+        return sum(map(sys.getsizeof, containers))
+
+
+def get_cached_compositions() -> list[tuple[Hashable, type]]:
+    """返回当前缓存的全部 (缓存键, 组合类)，含弱引用持有且仍存活的组合。"""
+    with _REGISTRY_LOCK:
+        items = list(_COMPOSED.items())
+        weak = list(_WEAK_COMPOSED.items())
+    for key, ref in weak:
+        cls = ref()
+        if cls is not None:
+            items.append((key, cls))
+    return items
+
+
+def peek_protocol(*, name: str) -> Optional[type]:
+    """按名称查找缓存中存活的组合类，不触发按配方重建；不存在返回 None。"""
+    cls = get_protocol_cache().get(name)
+    if cls is None:
+        entry = _WEAK_NAMES.get(name)
+        if entry is not None:
+            cls = entry[0]()
+    return cls
 
 
 def get_protocol(*, name: str) -> type | None:
-    """按名称获取协议类对象，不存在返回 None。"""
+    """按名称获取协议类对象，不存在返回 None。被淘汰的组合类会按需重建。"""
     module = get_anon_protocol_module()
     return getattr(module, name, None)
 
@@ -34,7 +240,269 @@ def set_protocol(*, name: str, cls: type) -> None:
 
 
 def del_protocol(*, name: str) -> None:
-    """按名称删除缓存的协议类对象。"""
-    module = get_anon_protocol_module()
-    if hasattr(module, name):
-        delattr(module, name)
+    """按名称删除缓存的协议类对象（不会再按需重建）。"""
+    with _REGISTRY_LOCK:
+        namespace = get_protocol_cache()
+        cls = namespace.pop(name, None)
+        _NAME_INDEX.pop(name, None)
+        recipe = _RECIPES.pop(name, None)
+        if recipe is not None:
+            _unindex_dependents(name, recipe)
+        _EVICTION.forget(name)
+        entry = _WEAK_NAMES.pop(name, None)
+        if entry is not None:
+            _WEAK_COMPOSED.pop(entry[1], None)
+            _unindex_dependents(name, entry[1])
+            weak_cls = entry[0]()
+            if weak_cls is not None:
+                _notify_removed(weak_cls)
+        if cls is not None:
+            for key in [k for k, v in _COMPOSED.items() if v is cls]:
+                del _COMPOSED[key]
+                _unindex_dependents(name, key)
+            _notify_removed(cls)
+
+
+def publish_protocol(*, name: str, key: Hashable, cls: type) -> None:
+    """
+    原子地发布组合类：挂载到虚拟模块、写入一级缓存，并登记淘汰簿记。
+    """
+    with _REGISTRY_LOCK:
+        if _CACHE_MODE == "weak":
+            _publish_weak(name, key, cls)
+            return
+        setattr(get_anon_protocol_module(), name, cls)
+        if _COMPOSED.get(key) is not cls:
+            _COMPOSED[key] = cls
+            _index_dependents(name, key)
+            _notify_added(cls)
+        admit_protocol(name=name, key=key)
+
+
+def _publish_weak(name: str, key: Hashable, cls: type) -> None:
+    entry = _WEAK_NAMES.get(name)
+    if entry is not None and entry[0]() is cls:
+        return
+
+    def release(ref: "weakref.ref[type]") -> None:
+        # 组合类被回收：只清理仍指向该弱引用的条目（期间可能已被重新发布）
+        if _WEAK_COMPOSED.get(key) is ref:
+            del _WEAK_COMPOSED[key]
+        current = _WEAK_NAMES.get(name)
+        if current is not None and current[0] is ref:
+            del _WEAK_NAMES[name]
+            _NAME_INDEX.pop(name, None)
+            _unindex_dependents(name, key)
+
+    ref = weakref.ref(cls, release)
+    _WEAK_COMPOSED[key] = ref
+    _WEAK_NAMES[name] = (ref, key)
+    _index_dependents(name, key)
+    _notify_added(cls)
+
+
+def get_cache_mode() -> CacheMode:
+    return _CACHE_MODE
+
+
+def set_cache_mode(mode: CacheMode) -> None:
+    """
+    设置组合缓存对组合类的持有方式（默认 "strong"），并迁移缓存中已有的组合类。
+    "weak" 模式下组合类只被弱引用，外部不再引用即被回收；淘汰策略只作用于强引用的组合。
+    """
+    global _CACHE_MODE
+    if mode not in ("strong", "weak"):
+        raise ValueError(f"unknown cache mode {mode!r}")
+    with _REGISTRY_LOCK:
+        if mode == _CACHE_MODE:
+            return
+        entries = get_cached_compositions()
+        namespace = get_protocol_cache()
+        for key, cls in entries:
+            namespace.pop(cls.__name__, None)
+            _RECIPES.pop(cls.__name__, None)
+            _EVICTION.forget(cls.__name__)
+        _COMPOSED.clear()
+        _WEAK_COMPOSED.clear()
+        _WEAK_NAMES.clear()
+        _CACHE_MODE = mode
+        for key, cls in entries:
+            publish_protocol(name=cls.__name__, key=key, cls=cls)
+
+
+def invalidate_protocol(proto: type) -> int:
+    """
+    使依赖 proto 的全部组合失效：移出一级缓存与虚拟模块，并丢弃重建配方与预组合登记，
+    之后再组合时按当前的协议类重新创建。返回失效的组合数。
+    按完全限定名匹配，因此传入重新加载后的同名协议即可清除由旧协议类组成的组合；
+    耗时与受影响的组合数成正比，其余组合不受影响。
+    """
+    with _REGISTRY_LOCK:
+        dependents = _DEPENDENTS.pop(_qualified_name(proto), None)
+        if not dependents:
+            return 0
+        namespace = get_protocol_cache()
+        for name, key in dependents.items():
+            _unindex_dependents(name, key)
+            namespace.pop(name, None)
+            _NAME_INDEX.pop(name, None)
+            _RECIPES.pop(name, None)
+            _PRECOMPOSED.pop(name, None)
+            _EVICTION.forget(name)
+            cls = _COMPOSED.pop(key, None)
+            _WEAK_NAMES.pop(name, None)
+            ref = _WEAK_COMPOSED.pop(key, None)
+            if cls is None and ref is not None:
+                cls = ref()
+            if cls is not None:
+                _notify_removed(cls)
+        return len(dependents)
+
+
+def find_closest_composition(
+    bases: ProtocolSequence, runtime: RuntimeMode
+) -> Optional[tuple[ProtocolSequence, type]]:
+    """
+    在缓存中查找 bases 的最大真子集组合（runtime 相同、至少两个协议），
+    返回 (子集协议集合, 组合类)；没有可复用的组合时返回 None。
+    只查看编号最小的协议属于 bases 的组合，耗时与缓存总量无关。
+    """
+    mask = bases.mask
+    best: Optional[tuple[ProtocolSequence, type]] = None
+    best_size = 1
+    with _REGISTRY_LOCK:
+        remaining = mask
+        while remaining:
+            bit = remaining & -remaining
+            remaining ^= bit
+            for key in _BY_LOWEST_PROTOCOL.get(bit.bit_length(), {}).values():
+                seq, seq_runtime = key  # type: ignore[misc]
+                sub = seq.mask
+                if seq_runtime != runtime or sub & ~mask or sub == mask:
+                    continue
+                size = sub.bit_count()
+                if size <= best_size:
+                    continue
+                # 索引含被淘汰但保留配方的组合，只复用仍在缓存中的
+                cls = _COMPOSED.get(key)
+                if cls is None:
+                    ref = _WEAK_COMPOSED.get(key)
+                    cls = ref() if ref is not None else None
+                if cls is not None:
+                    best, best_size = (seq, cls), size
+    return best
+
+
+def register_precomposed(*, name: str, cls: type) -> None:
+    """登记预组合模块中的组合类。"""
+    _PRECOMPOSED[name] = cls
+
+
+def get_precomposed(*, name: str) -> Optional[type]:
+    """按类名获取预组合的组合类，不存在返回 None。"""
+    return _PRECOMPOSED.get(name)
+
+
+def claim_protocol_name(*, name: str, identity: Hashable) -> str:
+    """
+    在碰撞检测索引中为组合身份登记类名。
+    名称未被占用或已属于同一身份时原样返回；
+    被其他身份占用（摘要碰撞）时依次尝试 name_1、name_2 …，保证缓存命中始终正确。
+    """
+    candidate = name
+    salt = 0
+    while _NAME_INDEX.setdefault(candidate, identity) != identity:
+        salt += 1
+        candidate = f"{name}_{salt}"
+    return candidate
+
+
+def get_eviction_tracker() -> EvictionTracker:
+    """返回全局淘汰簿记对象；对象在进程内始终是同一个。"""
+    return _EVICTION
+
+
+def get_eviction_policy() -> Optional[EvictionPolicy]:
+    return _EVICTION.policy
+
+
+def set_eviction_policy(policy: Optional[EvictionPolicy]) -> None:
+    """
+    设置全局协议缓存的淘汰策略，None 表示关闭淘汰（默认）。
+    开启时接管缓存中已有的组合类，并立即按新策略淘汰超出部分。
+    """
+    if policy is not None:
+        if policy.max_entries is not None and policy.max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {policy.max_entries}")
+        if policy.ttl is not None and policy.ttl < 0:
+            raise ValueError(f"ttl must be >= 0, got {policy.ttl}")
+        if policy.strategy not in ("lru", "lfu"):
+            raise ValueError(f"unknown eviction strategy {policy.strategy!r}")
+    with _REGISTRY_LOCK:
+        _EVICTION.policy = policy
+        if policy is None:
+            # 丢弃被淘汰者保留的配方及其反向索引；存活组合的索引不变
+            namespace = get_protocol_cache()
+            for name, recipe in _RECIPES.items():
+                if name not in namespace:
+                    _unindex_dependents(name, recipe)
+            _EVICTION.clear()
+            _RECIPES.clear()
+            return
+        for key, cls in list(_COMPOSED.items()):
+            admit_protocol(name=cls.__name__, key=key)
+
+
+def admit_protocol(*, name: str, key: Hashable) -> None:
+    """
+    登记一个刚进入缓存的组合类及其重建配方，并执行淘汰。
+    未设置淘汰策略时不做任何事。
+    """
+    if _EVICTION.policy is None:
+        return
+    with _REGISTRY_LOCK:
+        _RECIPES[name] = key
+        _EVICTION.admit(name)
+        _evict_protocols(_EVICTION.select_victims(protect=name))
+
+
+def expire_protocols() -> None:
+    """
+    按淘汰策略立即清扫（闲置超时、超出上限的组合类）。
+    缓存命中时发现有条目可能已闲置超时会自动调用，也可由宿主程序定期调用。
+    """
+    if _EVICTION.policy is None:
+        return
+    with _REGISTRY_LOCK:
+        _evict_protocols(_EVICTION.select_victims())
+
+
+def _evict_protocols(victims: list[str]) -> None:
+    for victim in victims:
+        _evict_protocol(victim)
+    # 被淘汰者的配方按同一策略保留，超出上限或过期的连同反向索引一并丢弃
+    for name in _EVICTION.retire(victims):
+        recipe = _RECIPES.pop(name, None)
+        if recipe is not None:
+            _unindex_dependents(name, recipe)
+
+
+def _evict_protocol(name: str) -> None:
+    """淘汰组合类：移出一级缓存与虚拟模块，但保留配方以便按需重建。"""
+    get_cache_counters().evictions += 1
+    get_protocol_cache().pop(name, None)
+    _NAME_INDEX.pop(name, None)
+    recipe = _RECIPES.get(name)
+    cls = _COMPOSED.pop(recipe, None) if recipe is not None else None
+    if cls is not None:
+        _notify_removed(cls)
+
+
+def pin_protocol(*, name: str) -> None:
+    """固定组合类，使其永不被淘汰；可在组合发生之前预先固定。"""
+    _EVICTION.pin(name)
+
+
+def unpin_protocol(*, name: str) -> None:
+    """取消固定，下一次淘汰时重新参与。"""
+    _EVICTION.unpin(name)
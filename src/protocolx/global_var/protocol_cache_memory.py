@@ -0,0 +1,140 @@
+import gc
+import sys
+from typing import Any, NamedTuple, Optional
+
+from protocolx.checker.compiled_checker import INSTANCECHECK_ATTR, SUBCLASSCHECK_ATTR
+from protocolx.checker.conformance_cache import CONFORMANCE_ATTR
+from protocolx.checker.member_index import peek_member_index
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_cache import (
+    get_cached_compositions,
+    get_registry_memory,
+)
+
+# 类字典中归入检查设施而非命名空间的属性
+_CHECKER_ATTRS = (CONFORMANCE_ATTR, INSTANCECHECK_ATTR, SUBCLASSCHECK_ATTR)
+
+
+class CompositionMemory(NamedTuple):
+    """
+    单个组合类的内存占用（字节，sys.getsizeof 口径，不含共享的协议类与字符串）。
+    - class_size：类型对象本身；
+    - mro：__mro__ 与 __bases__ 元组；
+    - namespace：类 __dict__ 及其中该类独有的容器（typing 生成的成员集合、配方等）；
+    - checkers：一致性缓存（含按类型结果表）、编译检查函数与成员索引。
+    """
+
+    name: str
+    class_size: int
+    mro: int
+    namespace: int
+    checkers: int
+
+    @property
+    def total(self) -> int:
+        return self.class_size + self.mro + self.namespace + self.checkers
+
+
+class ProtocolCacheMemory(NamedTuple):
+    """
+    协议缓存内存占用快照（字节）。
+    - compositions：每个缓存中组合类的明细，按占用从大到小排列；
+    - registry：注册表簿记结构（名称索引、一级缓存、配方、反向索引等）；
+    - sequences / sequence_count：存活 ProtocolSequence 实例的总占用与数量，
+      未要求统计时为 None。
+    """
+
+    compositions: tuple[CompositionMemory, ...]
+    registry: int
+    sequences: Optional[int] = None
+    sequence_count: Optional[int] = None
+
+    @property
+    def class_total(self) -> int:
+        return sum(c.class_size for c in self.compositions)
+
+    @property
+    def mro_total(self) -> int:
+        return sum(c.mro for c in self.compositions)
+
+    @property
+    def namespace_total(self) -> int:
+        return sum(c.namespace for c in self.compositions)
+
+    @property
+    def checkers_total(self) -> int:
+        return sum(c.checkers for c in self.compositions)
+
+    @property
+    def total(self) -> int:
+        return (
+            sum(c.total for c in self.compositions)
+            + self.registry
+            + (self.sequences or 0)
+        )
+
+
+def _function_size(func: Any) -> int:
+    return sys.getsizeof(func) + sys.getsizeof(func.__code__)
+
+
+def _composition_memory(cls: type) -> CompositionMemory:
+    # mappingproxy 的唯一引用对象即类的命名空间 dict
+    namespace_dict = gc.get_referents(cls.__dict__)[0]
+    namespace = sys.getsizeof(namespace_dict)
+    checkers = 0
+    for key, value in namespace_dict.items():
+        if key in _CHECKER_ATTRS:
+            checkers += (
+                _function_size(value) if callable(value) else sys.getsizeof(value)
+            )
+        elif isinstance(value, (set, frozenset, dict, tuple, list)):
+            namespace += sys.getsizeof(value)
+    index = peek_member_index(cls)
+    if index is not None:
+        checkers += sum(map(sys.getsizeof, (index, *index)))
+    return CompositionMemory(
+        name=cls.__name__,
+        class_size=sys.getsizeof(cls),
+        mro=sys.getsizeof(cls.__mro__) + sys.getsizeof(cls.__bases__),
+        namespace=namespace,
+        checkers=checkers,
+    )
+
+
+def _sequence_size(seq: ProtocolSequence) -> int:
+    # 计入实例本身及其独有的元组与位掩码；协议类与驻留的名称字符串是共享的
+    size = sys.getsizeof(seq)
+    parts = {
+        id(part): part
+        for part in (seq._original_items, seq._items, seq._names, seq._mask)
+        if part is not None
+    }
+    return size + sum(map(sys.getsizeof, parts.values()))
+
+
+def get_protocol_cache_memory(
+    *, include_sequences: bool = False
+) -> ProtocolCacheMemory:
+    """
+    统计协议缓存的内存占用：每个组合类的类型对象、MRO、命名空间与检查设施，
+    以及注册表簿记结构；结果可用于设定淘汰上限或监控缓存膨胀。
+    include_sequences=True 时额外遍历 gc 跟踪的对象，统计全部存活 ProtocolSequence 实例，
+    耗时与进程中的对象总数成正比，适合按需诊断而非高频采集。
+    """
+    compositions = sorted(
+        (_composition_memory(cls) for _, cls in get_cached_compositions()),
+        key=lambda c: c.total,
+        reverse=True,
+    )
+    sequences = sequence_count = None
+    if include_sequences:
+        live = [o for o in gc.get_objects() if type(o) is ProtocolSequence]
+        sequences = sum(map(_sequence_size, live))
+        sequence_count = len(live)
+    return ProtocolCacheMemory(
+        compositions=tuple(compositions),
+        registry=get_registry_memory(),
+        sequences=sequences,
+        sequence_count=sequence_count,
+    )
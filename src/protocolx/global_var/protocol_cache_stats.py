@@ -0,0 +1,106 @@
+import threading
+from collections import deque
+from typing import NamedTuple
+
+# 创建耗时样本窗口：只保留最近若干次，分位数在读取快照时计算
+_CREATION_SAMPLE_SIZE = 4096
+
+
+class ProtocolCacheStats(NamedTuple):
+    """
+    协议缓存统计快照（时间单位：秒）。
+    - hits / misses：一级组合缓存的命中与未命中次数；
+    - creations：实际创建的组合类数量（misses - creations 即虚拟模块命中次数）；
+    - evictions：被淘汰策略移除的组合类数量；
+    - validations：ProtocolSequence 执行类型校验的次数；
+    - creation_time_*：_create_anon_protocol_class 的累计耗时与最近样本的 p50 / p99。
+    """
+
+    hits: int
+    misses: int
+    creations: int
+    evictions: int
+    validations: int
+    creation_time_total: float
+    creation_time_p50: float
+    creation_time_p99: float
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _Counters:
+    """
+    可常开的轻量计数器：命中路径只做一次整数自增，不加锁；
+    高并发下计数可能有极少量丢失，适合作为指标采集而非精确审计。
+    """
+
+    __slots__ = (
+        "hits",
+        "misses",
+        "creations",
+        "evictions",
+        "validations",
+        "creation_time_total",
+        "creation_samples",
+        "lock",
+    )
+
+    def __init__(self) -> None:
+        self.creation_samples: deque[float] = deque(maxlen=_CREATION_SAMPLE_SIZE)
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.creations = 0
+        self.evictions = 0
+        self.validations = 0
+        self.creation_time_total = 0.0
+        self.creation_samples.clear()
+
+    def record_creation(self, elapsed: float) -> None:
+        with self.lock:
+            self.creations += 1
+            self.creation_time_total += elapsed
+            self.creation_samples.append(elapsed)
+
+
+_COUNTERS = _Counters()
+
+
+def get_cache_counters() -> _Counters:
+    """返回全局计数器对象（供内部埋点直接自增）；对象在进程内始终是同一个。"""
+    return _COUNTERS
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(fraction * len(ordered)))
+    return ordered[index]
+
+
+def get_protocol_cache_stats() -> ProtocolCacheStats:
+    """读取协议缓存统计快照。"""
+    with _COUNTERS.lock:
+        ordered = sorted(_COUNTERS.creation_samples)
+        return ProtocolCacheStats(
+            hits=_COUNTERS.hits,
+            misses=_COUNTERS.misses,
+            creations=_COUNTERS.creations,
+            evictions=_COUNTERS.evictions,
+            validations=_COUNTERS.validations,
+            creation_time_total=_COUNTERS.creation_time_total,
+            creation_time_p50=_percentile(ordered, 0.50),
+            creation_time_p99=_percentile(ordered, 0.99),
+        )
+
+
+def reset_protocol_cache_stats() -> None:
+    """将所有统计清零，便于按采集周期抓取增量。"""
+    with _COUNTERS.lock:
+        _COUNTERS.reset()
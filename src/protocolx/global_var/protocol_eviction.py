@@ -0,0 +1,191 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+from itertools import islice
+from operator import itemgetter
+from typing import Iterable, Optional
+
+from protocolx.definition.type.eviction_policy import EvictionPolicy
+
+
+class EvictionTracker:
+    """
+    协议缓存淘汰簿记：记录每个组合类（按类名）的访问时间与次数，
+    并依据策略选出应淘汰的类名。本身不操作缓存，由 protocol_cache 执行删除。
+    缓存命中路径上的 touch 不取锁，只写入待合并的访问记录；
+    其余簿记操作持有内部锁，并先合并待处理的访问记录。
+    被淘汰者的重建配方同样按策略保留（retire），超出上限或过期后交由调用方丢弃。
+    """
+
+    __slots__ = (
+        "policy",
+        "_last_access",
+        "_frequency",
+        "_pinned",
+        "_recent",
+        "_hits",
+        "_retired",
+        "_next_expiry",
+        "_lock",
+    )
+
+    def __init__(self) -> None:
+        self.policy: Optional[EvictionPolicy] = None
+        # 按最近访问时间升序排列：类名 → 最后访问时刻（time.monotonic）
+        self._last_access: OrderedDict[str, float] = OrderedDict()
+        self._frequency: dict[str, int] = {}
+        self._pinned: set[str] = set()
+        # 命中路径写入、尚未合并的访问记录：类名 → 最后访问时刻 / 访问次数
+        self._recent: dict[str, float] = {}
+        self._hits: dict[str, int] = {}
+        # 已淘汰但保留配方的类名 → 淘汰时刻，按淘汰先后排列
+        self._retired: OrderedDict[str, float] = OrderedDict()
+        # 最早可能有条目闲置超时的时刻；命中路径据此判断是否需要清扫
+        self._next_expiry = math.inf
+        self._lock = threading.Lock()
+
+    def _touch(self, name: str) -> None:
+        self._last_access.move_to_end(name)
+        self._last_access[name] = time.monotonic()
+        self._frequency[name] += 1
+
+    def touch(self, name: str) -> bool:
+        """
+        记录一次访问，不取锁；返回 True 表示已有条目可能闲置超时，调用方应触发清扫。
+        与缓存统计计数器相同，并发下偶尔丢失一次访问计数可以容忍。
+        """
+        now = time.monotonic()
+        self._recent[name] = now
+        hits = self._hits
+        hits[name] = hits.get(name, 0) + 1
+        return now >= self._next_expiry
+
+    def _merge_recent(self) -> None:
+        # 换出待合并的记录；换出后才写入旧字典的访问被丢弃（可容忍）
+        recent, self._recent = self._recent, {}
+        hits, self._hits = self._hits, {}
+        for name, last_access in sorted(list(recent.items()), key=itemgetter(1)):
+            if name in self._last_access:
+                self._last_access.move_to_end(name)
+                self._last_access[name] = last_access
+        for name, count in list(hits.items()):
+            if name in self._frequency:
+                self._frequency[name] += count
+
+    def admit(self, name: str) -> None:
+        """开始跟踪一个组合类，已跟踪时等同一次访问。"""
+        with self._lock:
+            self._retired.pop(name, None)
+            if name in self._last_access:
+                self._touch(name)
+                return
+            self._last_access[name] = time.monotonic()
+            self._frequency[name] = 1
+            self._schedule_expiry()
+
+    def _forget(self, name: str) -> None:
+        self._last_access.pop(name, None)
+        self._frequency.pop(name, None)
+        self._retired.pop(name, None)
+
+    def forget(self, name: str) -> None:
+        with self._lock:
+            self._forget(name)
+
+    def pin(self, name: str) -> None:
+        with self._lock:
+            self._pinned.add(name)
+
+    def unpin(self, name: str) -> None:
+        with self._lock:
+            self._pinned.discard(name)
+            self._schedule_expiry()
+
+    def is_pinned(self, name: str) -> bool:
+        return name in self._pinned
+
+    def select_victims(self, protect: Optional[str] = None) -> list[str]:
+        """
+        选出应淘汰的类名并停止跟踪它们：先淘汰闲置超时者，
+        仍超出上限时再按策略淘汰；固定的类名与 protect（刚入缓存者）不参与。
+        """
+        policy = self.policy
+        if policy is None:
+            return []
+        with self._lock:
+            self._merge_recent()
+            victims = self._select_victims(policy, protect)
+            self._schedule_expiry()
+            return victims
+
+    def _schedule_expiry(self) -> None:
+        policy = self.policy
+        self._next_expiry = math.inf
+        if policy is None or policy.ttl is None:
+            return
+        for name, last_access in self._last_access.items():
+            if name not in self._pinned:
+                self._next_expiry = last_access + policy.ttl
+                return
+
+    def retire(self, names: Iterable[str]) -> list[str]:
+        """
+        记录刚被淘汰、保留重建配方的类名，返回配方应被丢弃的类名：
+        保留数量同样受 max_entries 限制（先淘汰者先丢弃），超过 ttl 的也被丢弃。
+        """
+        policy = self.policy
+        with self._lock:
+            now = time.monotonic()
+            for name in names:
+                self._retired[name] = now
+            if policy is None:
+                return []
+            dropped: list[str] = []
+            if policy.max_entries is not None:
+                while len(self._retired) > policy.max_entries:
+                    dropped.append(self._retired.popitem(last=False)[0])
+            if policy.ttl is not None:
+                deadline = now - policy.ttl
+                while self._retired and next(iter(self._retired.values())) <= deadline:
+                    dropped.append(self._retired.popitem(last=False)[0])
+            return dropped
+
+    def _select_victims(
+        self, policy: EvictionPolicy, protect: Optional[str]
+    ) -> list[str]:
+        victims: list[str] = []
+        if policy.ttl is not None:
+            deadline = time.monotonic() - policy.ttl
+            for name, last_access in self._last_access.items():
+                if last_access > deadline:
+                    break
+                if name not in self._pinned:
+                    victims.append(name)
+        if policy.max_entries is not None:
+            excess = len(self._last_access) - len(victims) - policy.max_entries
+            if excess > 0:
+                skip = self._pinned.union(victims)
+                if protect is not None:
+                    skip.add(protect)
+                candidates = [name for name in self._last_access if name not in skip]
+                if policy.strategy == "lfu":
+                    # sorted 稳定：频次相同时按最近访问先后淘汰
+                    candidates.sort(key=self._frequency.__getitem__)
+                victims.extend(islice(candidates, excess))
+        for name in victims:
+            self._forget(name)
+        return victims
+
+    def clear(self) -> None:
+        """停止跟踪所有组合类（固定设置保留）。"""
+        with self._lock:
+            self._last_access.clear()
+            self._frequency.clear()
+            self._retired.clear()
+            self._recent = {}
+            self._hits = {}
+            self._next_expiry = math.inf
+
+    def __len__(self) -> int:
+        return len(self._last_access)
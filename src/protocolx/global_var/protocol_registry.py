@@ -0,0 +1,84 @@
+import heapq
+import threading
+import weakref
+from typing import Iterator, Optional
+
+# id(协议类) → 编号。不挂在协议类上：读类的 __dict__ 每次都要构造 mappingproxy；
+# 以 id 而非类为键，注册表不延长协议类的生命周期。协议类被回收时弱引用回调移除条目，
+# 回调先于内存释放执行，id 不会在条目移除前被新对象复用。
+# 子协议是不同的类对象，不会继承父协议的编号。
+_IDS: dict[int, int] = {}
+
+# 编号 → 协议类弱引用；协议类被回收后对应位失效，编号回收到空闲堆。
+# ProtocolSequence 强引用其协议类，因此存活的位掩码不会含已回收的编号，复用是安全的；
+# 优先复用最小的空闲编号，反复创建临时协议时位掩码宽度保持稳定。
+_CLASSES: list[weakref.ref[type]] = []
+_FREE: list[int] = []
+
+_LOCK = threading.Lock()
+
+
+def peek_protocol_id(proto: object) -> Optional[int]:
+    """返回已注册协议的编号；非类型或尚未注册时返回 None，不做注册。"""
+    return _IDS.get(id(proto))
+
+
+def get_protocol_id(proto: object) -> int:
+    """
+    返回协议类的整数编号，首次遇到时校验并注册。
+    非类型或非 Protocol 子类抛出 TypeError；校验每个协议类只做一次。
+    """
+    pid = _IDS.get(id(proto))
+    if pid is None:
+        pid = _register_protocol(proto)
+    return pid
+
+
+def _register_protocol(proto: object) -> int:
+    if not isinstance(proto, type):
+        raise TypeError(f"{proto} is not a type")
+    if not getattr(proto, "_is_protocol", False):
+        raise TypeError(f"{proto} is not a subclass of Protocol")
+    key = id(proto)
+    with _LOCK:
+        pid = _IDS.get(key)
+        if pid is None:
+            if _FREE:
+                pid = heapq.heappop(_FREE)
+                _CLASSES[pid] = weakref.ref(proto, _release_id(pid, key))
+            else:
+                pid = len(_CLASSES)
+                _CLASSES.append(weakref.ref(proto, _release_id(pid, key)))
+            _IDS[key] = pid
+    return pid
+
+
+def _release_id(pid: int, key: int) -> "weakref.CallbackType[type]":
+    def release(ref: "weakref.ref[type]") -> None:
+        # 回调可能在持有 _LOCK 的线程中由 gc 触发，不取锁；dict.pop 与 heappush 在 GIL 下原子执行
+        if _CLASSES[pid] is ref:
+            _IDS.pop(key, None)
+            heapq.heappush(_FREE, pid)
+
+    return release
+
+
+def get_protocol_by_id(pid: int) -> type:
+    """按编号取回协议类；编号未分配或协议类已被回收时抛出 LookupError。"""
+    proto = _CLASSES[pid]() if 0 <= pid < len(_CLASSES) else None
+    if proto is None:
+        raise LookupError(f"no live protocol with id {pid}")
+    return proto
+
+
+def iter_mask_protocols(mask: int) -> Iterator[type]:
+    """按编号升序遍历位掩码中的协议类。"""
+    while mask:
+        low = mask & -mask
+        yield get_protocol_by_id(low.bit_length() - 1)
+        mask ^= low
+
+
+def get_registered_protocol_count() -> int:
+    """已分配过的编号数量（含空闲待复用的编号）。"""
+    return len(_CLASSES)
@@ -0,0 +1,194 @@
+import sys
+from os import PathLike
+from typing import Callable, Iterable, Optional, Union
+
+from protocolx.checker.compiled_checker import (
+    INSTANCECHECK_ATTR,
+    SUBCLASSCHECK_ATTR,
+    instance_check_source,
+    subclass_check_source,
+)
+from protocolx.checker.conformance_cache import install_conformance_cache
+from protocolx.checker.member_index import (
+    MemberIndex,
+    register_member_index,
+    union_member_index,
+)
+from protocolx.compose_protocol import (
+    RECIPE_ATTR,
+    get_composition_name,
+    get_import_path,
+)
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.definition.type.runtime_mode import RuntimeMode
+from protocolx.global_var.composition_lock import single_flight
+from protocolx.global_var.protocol_cache import (
+    get_anon_protocol_module,
+    peek_protocol,
+    publish_protocol,
+    register_precomposed,
+)
+
+Declaration = Union[ProtocolSequence, tuple[ProtocolSequence, RuntimeMode]]
+
+_HEADER = '''"""由 protocolx.precompose 生成的预组合协议模块，请勿手工修改。"""
+
+'''
+
+
+def install_precomposed(
+    cls: type,
+    bases: tuple[type, ...],
+    runtime: RuntimeMode,
+    *,
+    callables: frozenset[str],
+    data: frozenset[str],
+    instance_check: Optional[Callable[[object], bool]] = None,
+    subclass_check: Optional[Callable[[type], bool]] = None,
+) -> type:
+    """
+    由生成的模块在导入时调用：为类挂载与 compose_protocol 动态创建时相同的设施，
+    成员集合与检查函数直接取生成时的结果，不再重新计算。
+    类名与当前进程中该组合的类名一致时登记为预组合类并发布到缓存，
+    此后 compose_protocol 直接命中；否则（协议类已移动或改名）只作为普通协议类保留。
+    """
+    seq = ProtocolSequence(bases)
+    if runtime:
+        from typing import runtime_checkable
+
+        cls = runtime_checkable(cls)
+        members = MemberIndex(callables, data)
+        register_member_index(cls, members)
+        install_conformance_cache(cls, members)
+    if instance_check is not None:
+        setattr(cls, INSTANCECHECK_ATTR, instance_check)
+    if subclass_check is not None:
+        setattr(cls, SUBCLASSCHECK_ATTR, subclass_check)
+    setattr(cls, RECIPE_ATTR, (seq, runtime))
+    get_anon_protocol_module()
+    name = cls.__name__
+    if get_composition_name(seq, runtime) != name:
+        return cls
+    cls.__module__ = "__anon_protocol__"
+    register_precomposed(name=name, cls=cls)
+    with single_flight(name):
+        # 导入之前已动态创建的同名组合保持原样，避免同一组合出现两个类对象
+        if peek_protocol(name=name) is None:
+            publish_protocol(name=name, key=(seq, runtime), cls=cls)
+    return cls
+
+
+def _import_path(proto: type) -> tuple[str, str]:
+    """返回协议类的 (模块名, 限定名)；无法按该路径导入回同一对象时抛出 ValueError。"""
+    path = get_import_path(proto)
+    # __main__ 随入口脚本而变，__anon_protocol__ 由组合过程填充：生成的模块都无法从中导入
+    if path is None or path[0] in ("__main__", "__anon_protocol__"):
+        raise ValueError(
+            f"{proto!r} cannot be precomposed: it is not importable "
+            f"as {proto.__module__}.{proto.__qualname__}"
+        )
+    return path
+
+
+def _names_literal(names: frozenset[str]) -> str:
+    if not names:
+        return "frozenset()"
+    return "frozenset({" + ", ".join(map(repr, sorted(names))) + "})"
+
+
+def _normalize(
+    declarations: Iterable[Declaration], runtime: RuntimeMode
+) -> list[tuple[ProtocolSequence, RuntimeMode]]:
+    result: dict[tuple[ProtocolSequence, RuntimeMode], None] = {}
+    for declaration in declarations:
+        if isinstance(declaration, ProtocolSequence):
+            declaration = (declaration, runtime)
+        seq, mode = declaration
+        if not isinstance(seq, ProtocolSequence):
+            raise TypeError(f"{seq!r} is not a ProtocolSequence")
+        result[(seq, mode)] = None
+    return list(result)
+
+
+def generate_precomposed_source(
+    declarations: Iterable[Declaration], *, runtime: RuntimeMode = True
+) -> str:
+    """
+    生成预组合协议模块的源码。
+    declarations 的元素为 ProtocolSequence（使用参数 runtime）或 (ProtocolSequence, runtime)。
+    每个组合生成一个真实的 class 语句，类名即 compose_protocol 使用的稳定摘要名；
+    runtime 为真时写入预先算好的成员集合，runtime="compiled" 时检查函数也以源码形式写入。
+    导入该模块即完成登记，之后这些组合的 compose_protocol 直接命中。
+    组合中的协议类必须能按 module.qualname 导入（不能定义在函数内或 __main__ 中）。
+    """
+    entries = _normalize(declarations, runtime)
+    aliases: dict[str, str] = {}
+    classes: list[str] = []
+    needs_meta = needs_lookup = needs_has = False
+    for seq, mode in entries:
+        refs = []
+        for proto in seq:
+            module_name, qualname = _import_path(proto)
+            alias = aliases.setdefault(module_name, f"_m{len(aliases)}")
+            refs.append(f"{alias}.{qualname}")
+        name = get_composition_name(seq, mode)
+        bases_src = ", ".join(refs)
+        meta = ", metaclass=ComposedProtocolMeta" if mode else ""
+        block = [f"class {name}({bases_src}, Protocol{meta}):\n    pass\n"]
+        if mode:
+            callables, data = union_member_index(seq)
+        else:
+            callables = data = frozenset()
+        kwargs = [
+            f"    callables={_names_literal(callables)},",
+            f"    data={_names_literal(data)},",
+        ]
+        needs_meta = needs_meta or bool(mode)
+        if mode == "compiled":
+            needs_lookup = True
+            check = f"_instance_check{name}"
+            block.append(instance_check_source(callables, data, name=check))
+            kwargs.append(f"    instance_check={check},")
+            if not data:
+                needs_has = True
+                check = f"_subclass_check{name}"
+                block.append(subclass_check_source(callables, name=check))
+                kwargs.append(f"    subclass_check={check},")
+        call = "\n".join(
+            [
+                "install_precomposed(",
+                f"    {name},",
+                f"    ({bases_src},),",
+                f"    {mode!r},",
+                *kwargs,
+                ")\n",
+            ]
+        )
+        classes.append("\n\n".join([*block, call]))
+    imports = ["from typing import Protocol", ""]
+    if needs_lookup:
+        # issubclass 检查函数只随 "compiled" 生成，与实例成员查找函数一并导入
+        names = ["class_has_member as has"] if needs_has else []
+        names += ["instance_getattr", "instance_hasattr"]
+        lines = "".join(f"    {n},\n" for n in names)
+        imports.append(f"from protocolx.checker.compiled_checker import (\n{lines})")
+    if needs_meta:
+        imports.append(
+            "from protocolx.checker.composed_protocol_meta import ComposedProtocolMeta"
+        )
+    imports.append("from protocolx.precompose import install_precomposed")
+    imports.append("")
+    imports += [f"import {module} as {alias}" for module, alias in aliases.items()]
+    return _HEADER + "\n".join(imports) + "\n\n\n" + "\n\n".join(classes)
+
+
+def write_precomposed_module(
+    path: Union[str, PathLike[str]],
+    declarations: Iterable[Declaration],
+    *,
+    runtime: RuntimeMode = True,
+) -> None:
+    """生成预组合协议模块并写入 path（构建步骤使用）。"""
+    source = generate_precomposed_source(declarations, runtime=runtime)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(source)
@@ -0,0 +1,86 @@
+import importlib
+from typing import Any, Iterable, Optional
+
+from protocolx.compose_protocol import compose_protocol, get_import_path
+from protocolx.definition.type.protocol_cache_snapshot import ProtocolCacheSnapshot
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.definition.type.runtime_mode import RuntimeMode
+from protocolx.global_var.protocol_cache import get_cached_compositions
+
+Composition = tuple[ProtocolSequence, RuntimeMode]
+
+
+def _reference(proto: type) -> Optional[str]:
+    path = get_import_path(proto)
+    # 组合类只能在已组合过的进程中按名称解析
+    if path is None or path[0] == "__anon_protocol__":
+        return None
+    return ":".join(path)
+
+
+def _resolve(reference: str) -> type:
+    module_name, _, qualname = reference.partition(":")
+    target: Any = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        target = getattr(target, part)
+    return target
+
+
+def snapshot_protocol_cache(
+    compositions: Optional[Iterable[Composition]] = None,
+) -> ProtocolCacheSnapshot:
+    """
+    导出组合缓存为紧凑的配方快照；compositions 缺省为一级缓存中的全部组合。
+    含无法按名称导入的协议（定义在函数内、动态创建、或本身是组合类）的组合被跳过。
+    """
+    if compositions is None:
+        compositions = [key for key, _ in get_cached_compositions()]  # type: ignore[misc]
+    protocols: dict[str, int] = {}
+    entries: list[tuple[tuple[int, ...], RuntimeMode]] = []
+    for bases, runtime in compositions:
+        refs = [_reference(proto) for proto in bases]
+        if None in refs:
+            continue
+        indexes = tuple(protocols.setdefault(ref, len(protocols)) for ref in refs)  # type: ignore[arg-type]
+        entries.append((indexes, runtime))
+    return ProtocolCacheSnapshot(tuple(protocols), tuple(entries))
+
+
+def restore_protocol_cache(
+    snapshot: ProtocolCacheSnapshot, *, strict: bool = False
+) -> int:
+    """
+    按快照批量组合，返回组合数；已缓存的组合直接命中。
+    协议无法导入（模块改名、协议已删除等）的组合默认跳过，strict=True 时抛出异常。
+    """
+    protocols: list[Optional[type]] = []
+    for reference in snapshot.protocols:
+        try:
+            protocols.append(_resolve(reference))
+        except (ImportError, AttributeError):
+            if strict:
+                raise
+            protocols.append(None)
+    count = 0
+    for indexes, runtime in snapshot.compositions:
+        bases = [protocols[i] for i in indexes]
+        if None in bases:
+            continue
+        try:
+            compose_protocol(ProtocolSequence(bases), runtime=runtime)  # type: ignore[arg-type]
+        except TypeError:
+            # 同名对象已不再是 Protocol 子类
+            if strict:
+                raise
+            continue
+        count += 1
+    return count
+
+
+def init_protocol_worker(snapshot: ProtocolCacheSnapshot) -> None:
+    """
+    进程池 worker 的 initializer：启动时按快照重建组合缓存。
+    用法：ProcessPoolExecutor(initializer=init_protocol_worker,
+    initargs=(snapshot_protocol_cache(),))。
+    """
+    restore_protocol_cache(snapshot)
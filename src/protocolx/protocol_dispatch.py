@@ -0,0 +1,101 @@
+from functools import update_wrapper
+from typing import Any, Callable, Generic, Mapping, Optional, TypeVar
+from weakref import WeakKeyDictionary
+
+from protocolx.checker.compiled_checker import class_namespace
+from protocolx.checker.conformance_cache import register_type_cache
+from protocolx.checker.member_index import MemberIndex, union_member_index
+from protocolx.compose_protocol import as_protocol_sequence
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+
+R = TypeVar("R")
+
+_EMPTY = ProtocolSequence([])
+
+
+def _type_conforms(
+    namespace: Mapping[str, Any], annotated: set[str], index: MemberIndex
+) -> bool:
+    if any(namespace.get(name) is None for name in index.callables):
+        return False
+    return all(name in namespace or name in annotated for name in index.data)
+
+
+class ProtocolDispatcher(Generic[R]):
+    """
+    按结构类型分派的单分派函数（类似 functools.singledispatch）。
+    处理函数登记在 ProtocolSequence 或组合协议上，调用时选择对象类型满足的
+    最具体的处理函数：在满足的协议集合中取按子集关系的唯一最大者，
+    不存在唯一最大者时抛出 RuntimeError。
+    判定在类型层面进行（同 conformance_matrix），解析结果按具体类型缓存，
+    预热后每次分派只需一次字典查找。
+    """
+
+    def __init__(self, default: Callable[..., R]) -> None:
+        self._handlers: dict[ProtocolSequence, Callable[..., R]] = {_EMPTY: default}
+        self._members: dict[ProtocolSequence, MemberIndex] = {
+            _EMPTY: union_member_index(())
+        }
+        self._cache: WeakKeyDictionary[type, Callable[..., R]] = WeakKeyDictionary()
+        register_type_cache(self)
+        update_wrapper(self, default)
+
+    def register(
+        self,
+        protocols: type | ProtocolSequence,
+        func: Optional[Callable[..., R]] = None,
+    ) -> Any:
+        """登记处理函数；不传 func 时作为装饰器使用。"""
+        if func is None:
+            return lambda f: self.register(protocols, f)
+        bases = as_protocol_sequence(protocols)
+        self._handlers[bases] = func
+        self._members[bases] = union_member_index(bases)
+        self._cache.clear()
+        return func
+
+    @property
+    def registry(self) -> Mapping[ProtocolSequence, Callable[..., R]]:
+        return dict(self._handlers)
+
+    def _resolve(self, tp: type) -> Callable[..., R]:
+        namespace, annotated = class_namespace(tp)
+        matches = [
+            bases
+            for bases, index in self._members.items()
+            if _type_conforms(namespace, annotated, index)
+        ]
+        best = [
+            bases
+            for bases in matches
+            if not any(other != bases and bases.issubset(other) for other in matches)
+        ]
+        if len(best) > 1:
+            raise RuntimeError(
+                f"Ambiguous dispatch for {tp!r}: {', '.join(map(repr, best))}"
+            )
+        return self._handlers[best[0]]
+
+    def dispatch(self, tp: type) -> Callable[..., R]:
+        """返回类型 tp 对应的处理函数，结果按类型缓存。"""
+        try:
+            return self._cache[tp]
+        except KeyError:
+            handler = self._cache[tp] = self._resolve(tp)
+            return handler
+
+    def __call__(self, obj: Any, *args: Any, **kwargs: Any) -> R:
+        return self.dispatch(type(obj))(obj, *args, **kwargs)
+
+    def discard(self, tp: type) -> None:
+        self._cache.pop(tp, None)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    cache_clear = clear
+
+
+def protocol_dispatch(func: Callable[..., R]) -> ProtocolDispatcher[R]:
+    """把 func 包装为按结构类型分派的函数，func 为兜底处理函数。"""
+    return ProtocolDispatcher(func)
@@ -0,0 +1,75 @@
+import json
+from os import PathLike
+from typing import Iterable, Optional, Union
+
+from protocolx.definition.type.protocol_cache_snapshot import ProtocolCacheSnapshot
+from protocolx.global_var.composition_recorder import get_composition_recorder
+from protocolx.global_var.protocol_cache import get_cached_compositions
+from protocolx.protocol_cache_snapshot import (
+    Composition,
+    restore_protocol_cache,
+    snapshot_protocol_cache,
+)
+
+_FORMAT = "protocolx-warmup"
+_VERSION = 1
+
+_recorder = get_composition_recorder()
+
+
+def start_composition_recording() -> None:
+    """
+    开始记录 compose_protocol 解析的不同组合（含开始时已在缓存中的组合）。
+    记录只发生在未命中路径，命中路径不受影响。
+    """
+    _recorder.start([key for key, _ in get_cached_compositions()])
+
+
+def stop_composition_recording() -> list[Composition]:
+    """停止记录并返回记录到的组合，按首次解析顺序。"""
+    return _recorder.stop()  # type: ignore[return-value]
+
+
+def write_warmup_manifest(
+    path: Union[str, PathLike[str]],
+    compositions: Optional[Iterable[Composition]] = None,
+) -> int:
+    """
+    把组合写入预热清单，返回写入的组合数。
+    compositions 缺省为记录器当前记录到的组合。
+    清单以 module:qualname 引用协议类，每个协议只写一次、组合以下标引用；
+    含无法按名称导入的协议（定义在函数内、动态创建、或本身是组合类）的组合被跳过。
+    """
+    if compositions is None:
+        compositions = _recorder.snapshot()  # type: ignore[assignment]
+    snapshot = snapshot_protocol_cache(compositions)
+    manifest = {
+        "format": _FORMAT,
+        "version": _VERSION,
+        "protocols": snapshot.protocols,
+        "compositions": snapshot.compositions,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, separators=(",", ":"))
+    return len(snapshot.compositions)
+
+
+def preload_warmup_manifest(
+    path: Union[str, PathLike[str]], *, strict: bool = False
+) -> int:
+    """
+    按预热清单预先组合，返回组合数；可在启动时或 fork 之前的父进程中调用，
+    使常用组合在处理请求之前就已创建。
+    协议无法导入（模块改名、协议已删除等）的组合默认跳过，strict=True 时抛出异常。
+    """
+    with open(path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format") != _FORMAT or manifest.get("version") != _VERSION:
+        raise ValueError(f"{path!r} is not a protocolx warm-up manifest")
+    snapshot = ProtocolCacheSnapshot(
+        tuple(manifest["protocols"]),
+        tuple(
+            (tuple(indexes), runtime) for indexes, runtime in manifest["compositions"]
+        ),
+    )
+    return restore_protocol_cache(snapshot, strict=strict)
@@ -0,0 +1,219 @@
+import importlib
+import weakref
+from abc import ABC
+from typing import Protocol, runtime_checkable
+from unittest.mock import patch
+
+import pytest
+
+from protocolx.check_conformance import check_conformance, filter_conforming
+from protocolx.checker.conformance_cache import ConformanceCache
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_cache import clear_protocol_cache
+
+check_conformance_module = importlib.import_module("protocolx.check_conformance")
+
+# ===== 示例协议与实现 =====
+
+
+class Reader(Protocol):
+    def read(self) -> bytes: ...
+
+
+class Closer(Protocol):
+    def close(self) -> None: ...
+
+
+@runtime_checkable
+class Sized(Protocol):
+    size: int
+
+
+class File:
+    def read(self) -> bytes:
+        return b""
+
+    def close(self) -> None: ...
+
+
+class ReadOnly:
+    def read(self) -> bytes:
+        return b""
+
+
+class Explicit(Reader, Closer):
+    pass
+
+
+class Sometimes:
+    def __init__(self, size: bool) -> None:
+        if size:
+            self.size = 1
+
+
+@runtime_checkable
+class Runs(Protocol):
+    def run(self) -> None: ...
+
+
+class Plugin:
+    def __init__(self, run: object = None) -> None:
+        if run is not None:
+            self.run = run
+
+
+class Registered:
+    __slots__ = ()
+
+
+Runs.register(Registered)
+
+
+class Base(ABC):
+    pass
+
+
+class Derived(Base):
+    pass
+
+
+class Unrelated:
+    pass
+
+
+@Runs.register
+class RegisteredRef:
+    __slots__ = ("__weakref__",)
+
+
+def _objects() -> list[object]:
+    return [File(), ReadOnly(), 1, File(), "x", ReadOnly(), Explicit()] * 3
+
+
+# ===== 与逐个 isinstance 一致 =====
+
+
+@pytest.mark.parametrize("runtime", [True, "compiled"])
+def test_mask_matches_isinstance(runtime: object) -> None:
+    """
+    测试：批量掩码与逐个 isinstance 一致，筛选保持输入顺序。
+    """
+    clear_protocol_cache()
+    proto = compose_protocol(ProtocolSequence([Reader, Closer]), runtime=runtime)  # type: ignore[arg-type]
+    objects = _objects()
+    expected = [isinstance(obj, proto) for obj in objects]
+    assert check_conformance(objects, proto) == expected
+    assert check_conformance(iter(objects), proto) == expected
+    assert filter_conforming(objects, proto) == [
+        obj for obj in objects if isinstance(obj, proto)
+    ]
+
+
+def test_each_type_is_judged_once() -> None:
+    """
+    测试：结果在类型层面可判定时，每个具体类型只判定一次。
+    """
+    clear_protocol_cache()
+    proto = compose_protocol(ProtocolSequence([Reader, Closer]), runtime=True)
+    objects = _objects() * 100
+    with patch.object(
+        check_conformance_module,
+        "_judge_type",
+        wraps=check_conformance_module._judge_type,
+    ) as mock_judge:
+        check_conformance(objects, proto)
+    assert mock_judge.call_count == len({type(obj) for obj in objects})
+
+
+def test_data_members_checked_per_instance() -> None:
+    """
+    测试：数据成员无法按类型判定，逐实例检查。
+    """
+    objects = [Sometimes(True), Sometimes(False), Sometimes(True)]
+    assert check_conformance(objects, Sized) == [True, False, True]
+    assert filter_conforming(objects, Sized) == [objects[0], objects[2]]
+
+
+@pytest.mark.parametrize("composed", [False, True])
+def test_mixed_instance_attributes_on_one_type(composed: bool) -> None:
+    """
+    测试：同一类型的实例是否带方法各不相同时，结果与输入顺序无关、与逐个 isinstance 一致。
+    """
+    clear_protocol_cache()
+    proto = (
+        compose_protocol(ProtocolSequence([Runs]), runtime=True) if composed else Runs
+    )
+    objects: list[object] = [Plugin(), Plugin(lambda: None)]
+    for ordered in (objects, objects[::-1]):
+        expected = [isinstance(obj, proto) for obj in ordered]
+        assert expected.count(True) == 1
+        assert check_conformance(ordered, proto) == expected
+
+
+def test_registered_type_reuses_sample() -> None:
+    """
+    测试：经 register 登记、结构上不满足的类型按类型判定一次即可。
+    """
+    objects = [Registered(), Registered(), File()]
+    assert check_conformance(objects, Runs) == [True, True, False]
+
+
+@pytest.mark.parametrize("target", [Base, Runs])
+def test_proxies_grouped_by_class(target: type) -> None:
+    """
+    测试：weakref.proxy 的 __class__ 为被代理对象的类，名义检查结果不在代理之间复用。
+    """
+    referents = [Derived(), RegisteredRef(), Unrelated()]
+    objects = [weakref.proxy(obj) for obj in referents]
+    for ordered in (objects, objects[::-1]):
+        expected = [isinstance(obj, target) for obj in ordered]
+        assert True in expected and False in expected
+        assert check_conformance(ordered, target) == expected
+
+
+@pytest.mark.parametrize("runtime", [True, "compiled"])
+def test_method_shadowed_with_none(runtime: object) -> None:
+    """
+    测试：实例把方法设为 None 时逐实例判定，结果与逐个 isinstance 一致。
+    """
+    clear_protocol_cache()
+    proto = compose_protocol(ProtocolSequence([Reader]), runtime=runtime)  # type: ignore[arg-type]
+    shadowed = File()
+    shadowed.read = None  # type: ignore[assignment, method-assign]
+    for ordered in ([File(), shadowed], [shadowed, File()]):
+        expected = [isinstance(obj, proto) for obj in ordered]
+        assert check_conformance(ordered, proto) == expected
+
+
+# ===== 非组合目标 =====
+
+
+def test_plain_runtime_protocol_and_classes() -> None:
+    """
+    测试：普通 runtime_checkable 协议、普通类与 ABC 也可批量判定。
+    """
+
+    @runtime_checkable
+    class CanRead(Protocol):
+        def read(self) -> bytes: ...
+
+    objects = _objects()
+    for target in (CanRead, File, Reader):
+        if target is Reader:
+            # 显式继承的非 runtime 协议：isinstance 抛出 TypeError
+            with pytest.raises(TypeError):
+                check_conformance(objects, target)
+            continue
+        assert check_conformance(objects, target) == [
+            isinstance(obj, target) for obj in objects
+        ]
+    assert isinstance(check_conformance_module._ADHOC[CanRead], ConformanceCache)
+
+
+def test_empty_input() -> None:
+    """
+    测试：空输入返回空结果。
+    """
+    assert check_conformance([], Sized) == []
+    assert filter_conforming((), Sized) == []
@@ -0,0 +1,144 @@
+from types import new_class
+from typing import Protocol, runtime_checkable
+from unittest.mock import patch
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import lists, sampled_from
+
+from protocolx.checker.compiled_checker import get_protocol_members
+from protocolx.checker.composed_protocol_meta import ComposedProtocolMeta
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_cache import clear_protocol_cache
+
+# ===== 示例协议 =====
+
+
+class P1(Protocol):
+    def m1(self) -> int: ...
+
+
+class P2(Protocol):
+    def m2(self, x: str) -> str: ...
+
+
+class P3(Protocol):
+    def m3(self, y: float) -> int: ...
+
+
+class HasData(Protocol):
+    value: int
+
+
+ALL_PROTOCOLS: list[type] = [P1, P2, P3]
+
+# ===== 示例实现 =====
+
+
+class Impl1:
+    def m1(self) -> int:
+        return 1
+
+
+class Impl12:
+    def m1(self) -> int:
+        return 1
+
+    def m2(self, x: str) -> str:
+        return x
+
+
+class Impl123(Impl12):
+    def m3(self, y: float) -> int:
+        return int(y)
+
+
+class ImplNone(Impl123):
+    m2 = None  # type: ignore[assignment]
+
+
+class Empty:
+    pass
+
+
+ALL_IMPLS: list[type] = [Impl1, Impl12, Impl123, ImplNone, Empty]
+
+
+@given(lists(sampled_from(ALL_PROTOCOLS), min_size=1, max_size=3))
+def test_compiled_matches_typing(protocols: list[type]) -> None:
+    """
+    测试：runtime="compiled" 的 isinstance / issubclass 结果与 typing 实现一致。
+    """
+    clear_protocol_cache()
+
+    seq = ProtocolSequence(protocols)
+    reference = runtime_checkable(new_class("Reference", tuple(seq) + (Protocol,)))
+    typed = compose_protocol(seq, runtime=True)
+    compiled = compose_protocol(seq, runtime="compiled")
+
+    assert typed is not compiled
+    assert type(compiled) is ComposedProtocolMeta
+    for impl in ALL_IMPLS:
+        expected_instance = isinstance(impl(), reference)
+        expected_subclass = issubclass(impl, reference)
+        assert isinstance(impl(), compiled) == expected_instance, impl
+        assert isinstance(impl(), typed) == expected_instance, impl
+        assert issubclass(impl, compiled) == expected_subclass, impl
+        assert issubclass(impl, typed) == expected_subclass, impl
+
+
+def test_compiled_skips_typing_machinery() -> None:
+    """
+    测试：编译检查命中后不再调用 typing 的 __instancecheck__ / __subclasscheck__。
+    """
+    clear_protocol_cache()
+
+    compiled = compose_protocol(ProtocolSequence([P1, P2]), runtime="compiled")
+    proto_meta = type(Protocol)
+
+    with (
+        patch.object(proto_meta, "__instancecheck__") as mock_instancecheck,
+        patch.object(proto_meta, "__subclasscheck__") as mock_subclasscheck,
+    ):
+        assert isinstance(Impl12(), compiled)
+        assert not isinstance(Impl1(), compiled)
+        assert issubclass(Impl123, compiled)
+        assert mock_instancecheck.call_count == 0
+        assert mock_subclasscheck.call_count == 0
+
+
+def test_compiled_data_member_keeps_typing_semantics() -> None:
+    """
+    测试：含数据成员时 isinstance 走快速路径，issubclass 仍按 typing 抛 TypeError。
+    """
+    clear_protocol_cache()
+
+    compiled = compose_protocol(ProtocolSequence([P1, HasData]), runtime="compiled")
+
+    class WithValue(Impl1):
+        value = 3
+
+    assert isinstance(WithValue(), compiled)
+    assert not isinstance(Impl1(), compiled)
+    with pytest.raises(TypeError):
+        issubclass(WithValue, compiled)
+    with pytest.raises(TypeError):
+        issubclass(WithValue(), compiled)  # type: ignore[arg-type]
+
+
+def test_checker_is_not_inherited_as_member() -> None:
+    """
+    测试：挂载的检查函数不会成为协议成员，组合结果可继续参与组合。
+    """
+    clear_protocol_cache()
+
+    compiled = compose_protocol(ProtocolSequence([P1]), runtime="compiled")
+    callables, data = get_protocol_members(compiled)
+    assert callables == frozenset({"m1"})
+    assert data == frozenset()
+
+    wider = compose_protocol(ProtocolSequence([compiled, P2]), runtime="compiled")
+    assert get_protocol_members(wider) == (frozenset({"m1", "m2"}), frozenset())
+    assert isinstance(Impl12(), wider)
+    assert not isinstance(Impl1(), wider)
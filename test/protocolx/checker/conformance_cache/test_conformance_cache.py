@@ -0,0 +1,318 @@
+import gc
+import weakref
+from typing import Any, Iterator, Protocol, runtime_checkable
+from unittest.mock import patch
+
+import pytest
+
+from protocolx.checker.conformance_cache import (
+    CONFORMANCE_ATTR,
+    ConformanceCache,
+    invalidate_conformance_cache,
+    set_conformance_cache,
+)
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_cache import clear_protocol_cache
+
+# ===== 示例协议 =====
+
+
+class P1(Protocol):
+    def m1(self) -> int: ...
+
+
+class P2(Protocol):
+    def m2(self) -> int: ...
+
+
+class HasData(Protocol):
+    value: int
+
+
+@pytest.fixture(autouse=True)
+def _enable_cache() -> Iterator[None]:
+    set_conformance_cache(True)
+    yield
+    set_conformance_cache(False)
+
+
+def _conformance(cls: type) -> ConformanceCache:
+    cache = cls.__dict__[CONFORMANCE_ATTR]
+    assert isinstance(cache, ConformanceCache)
+    return cache
+
+
+def test_positive_and_negative_results_cached_per_type() -> None:
+    """
+    测试：同一具体类型的重复检查只判定一次，肯定与否定结果都缓存。
+    """
+    clear_protocol_cache()
+    composed = compose_protocol(ProtocolSequence([P1, P2]), runtime=True)
+    cache = _conformance(composed)
+
+    class Good:
+        __slots__ = ()
+
+        def m1(self) -> int:
+            return 1
+
+        def m2(self) -> int:
+            return 2
+
+    class Bad:
+        __slots__ = ()
+
+        def m1(self) -> int:
+            return 1
+
+    classify = ConformanceCache.classify
+    with patch.object(
+        ConformanceCache, "classify", autospec=True, side_effect=classify
+    ) as mock_classify:
+        for _ in range(5):
+            assert isinstance(Good(), composed)
+            assert not isinstance(Bad(), composed)
+            assert issubclass(Good, composed)
+            assert not issubclass(Bad, composed)
+        assert mock_classify.call_count == 2
+
+    assert len(cache) == 2
+
+
+def test_cache_keys_are_weak() -> None:
+    """
+    测试：缓存弱引用具体类型，类型回收后条目自动消失。
+    """
+    clear_protocol_cache()
+    composed = compose_protocol(ProtocolSequence([P1]), runtime=True)
+    cache = _conformance(composed)
+
+    def make() -> Any:
+        class Transient:
+            def m1(self) -> int:
+                return 1
+
+        return Transient()
+
+    assert isinstance(make(), composed)
+    gc.collect()
+    assert len(cache) == 0
+
+
+def test_invalidate_after_class_mutation() -> None:
+    """
+    测试：类新增 / 删除属性后，失效该类（及其子类）即可得到新结果。
+    """
+    clear_protocol_cache()
+    composed = compose_protocol(ProtocolSequence([P1, P2]), runtime="compiled")
+
+    class Base:
+        __slots__ = ()
+
+        def m1(self) -> int:
+            return 1
+
+    class Child(Base):
+        __slots__ = ()
+
+    assert not isinstance(Child(), composed)
+
+    Base.m2 = lambda self: 2  # type: ignore[attr-defined]
+    invalidate_conformance_cache(Base)
+    assert isinstance(Child(), composed)
+    assert isinstance(Base(), composed)
+
+    del Base.m2  # type: ignore[attr-defined]
+    invalidate_conformance_cache()
+    assert not isinstance(Child(), composed)
+
+
+def test_instance_level_members_fall_back_to_instance_check() -> None:
+    """
+    测试：数据成员只能在实例上确认时不缓存结论，逐实例检查。
+    """
+    clear_protocol_cache()
+    composed = compose_protocol(ProtocolSequence([HasData]), runtime=True)
+
+    class Holder:
+        def __init__(self, has_value: bool) -> None:
+            if has_value:
+                self.value = 1
+
+    assert isinstance(Holder(True), composed)
+    assert not isinstance(Holder(False), composed)
+
+    class Dynamic:
+        def __getattr__(self, name: str) -> Any:
+            return 1
+
+    # 3.12 起 typing 按 getattr_static 查找，__getattr__ 提供的成员不算数
+    composed_methods = compose_protocol(ProtocolSequence([P1]), runtime=True)
+    expected = isinstance(Dynamic(), runtime_checkable(P1))
+    assert isinstance(Dynamic(), composed_methods) is expected
+
+
+def test_instance_attribute_methods_match_typing() -> None:
+    """
+    测试：方法由实例在 __init__ 中设置时，结果与 typing 一致（不缓存否定结论）。
+    """
+    clear_protocol_cache()
+    composed = compose_protocol(ProtocolSequence([P1]), runtime=True)
+
+    class Plugin:
+        def __init__(self, with_method: bool) -> None:
+            if with_method:
+                self.m1 = lambda: 1
+
+    assert isinstance(Plugin(True), composed)
+    assert not isinstance(Plugin(False), composed)
+    assert isinstance(Plugin(True), composed)
+    assert _conformance(composed).classify(Plugin) is None
+
+
+def test_unset_slot_is_not_a_member() -> None:
+    """
+    测试：数据成员只是槽位时逐实例检查，与 typing 一致。
+    """
+    clear_protocol_cache()
+    composed = compose_protocol(ProtocolSequence([HasData]), runtime=True)
+
+    class Slotted:
+        __slots__ = ("value",)
+
+        def __init__(self, value: Any = None) -> None:
+            if value is not None:
+                self.value = value
+
+    # 3.12 起 typing 按 getattr_static 查找，未赋值的槽位也视为存在
+    expected = isinstance(Slotted(), runtime_checkable(HasData))
+    assert isinstance(Slotted(), composed) is expected
+    assert isinstance(Slotted(1), composed)
+
+
+def test_disabled_cache_sees_class_mutation() -> None:
+    """
+    测试：默认关闭缓存，类修改后无需手动失效即得到新结果。
+    """
+    set_conformance_cache(False)
+    clear_protocol_cache()
+    composed = compose_protocol(ProtocolSequence([P1, P2]), runtime=True)
+    cache = _conformance(composed)
+
+    class Late:
+        __slots__ = ()
+
+        def m1(self) -> int:
+            return 1
+
+    assert not isinstance(Late(), composed)
+    Late.m2 = lambda self: 2  # type: ignore[attr-defined]
+    assert isinstance(Late(), composed)
+    assert len(cache) == 0
+
+
+def test_instance_can_shadow_method_with_none() -> None:
+    """
+    测试：有实例字典的类型不缓存结论，实例把方法设为 None 时与 typing 一致。
+    """
+    clear_protocol_cache()
+    composed = compose_protocol(ProtocolSequence([P1]), runtime=True)
+
+    class Impl:
+        def m1(self) -> int:
+            return 1
+
+    disabled = Impl()
+    disabled.m1 = None  # type: ignore[assignment, method-assign]
+
+    assert isinstance(Impl(), composed)
+    # 3.11 的 typing 对纯方法协议先按类判定，3.12 起逐实例判定
+    expected = isinstance(disabled, runtime_checkable(P1))
+    assert isinstance(disabled, composed) is expected
+    assert _conformance(composed).classify(Impl) is None
+
+
+@pytest.mark.parametrize("runtime", [True, "compiled"])
+@pytest.mark.parametrize("protocols", [[P1, P2], [P1, HasData]])
+def test_registered_class_is_instance(runtime: Any, protocols: list[type]) -> None:
+    """
+    测试：结构检查未通过时交给 typing 做名义检查，register 的类与 typing 一致。
+    """
+    clear_protocol_cache()
+    composed = compose_protocol(ProtocolSequence(protocols), runtime=runtime)
+
+    class Registered:
+        __slots__ = ()
+
+    class Unrelated:
+        __slots__ = ()
+
+    composed.register(Registered)
+
+    assert isinstance(Registered(), composed)
+    assert not isinstance(Unrelated(), composed)
+    if not any(p is HasData for p in protocols):
+        assert issubclass(Registered, composed)
+        assert not issubclass(Unrelated, composed)
+
+
+@pytest.mark.parametrize("runtime", [True, "compiled"])
+def test_matches_runtime_checkable(runtime: Any) -> None:
+    """
+    测试：各类实例（实例字典、槽位、__getattr__、register、弱引用代理）的结果
+    与等价的 runtime_checkable 协议逐个一致，重复检查（命中缓存）后仍一致。
+    """
+    clear_protocol_cache()
+    composed = compose_protocol(ProtocolSequence([P1, HasData]), runtime=runtime)
+
+    @runtime_checkable
+    class Reference(P1, HasData, Protocol): ...
+
+    class Full:
+        value = 1
+
+        def m1(self) -> int:
+            return 1
+
+    class ByInit:
+        def __init__(self) -> None:
+            self.m1 = lambda: 1
+            self.value = 1
+
+    class Slotted:
+        __slots__ = ("value",)
+
+        def m1(self) -> int:
+            return 1
+
+    class Dynamic:
+        def __getattr__(self, name: str) -> Any:
+            return 1
+
+    class Registered:
+        __slots__ = ()
+
+    composed.register(Registered)
+    Reference.register(Registered)
+
+    shadowed = Full()
+    shadowed.m1 = None  # type: ignore[assignment, method-assign]
+    filled = Slotted()
+    filled.value = 1
+    full = Full()
+    samples = [
+        full,
+        shadowed,
+        ByInit(),
+        Slotted(),
+        filled,
+        Dynamic(),
+        Registered(),
+        weakref.proxy(full),
+        object(),
+    ]
+    for _ in range(2):
+        assert [isinstance(o, composed) for o in samples] == [
+            isinstance(o, Reference) for o in samples
+        ]
@@ -0,0 +1,107 @@
+import gc
+import inspect
+import weakref
+from typing import Protocol
+from unittest.mock import patch
+
+from protocolx.checker import member_index
+from protocolx.checker.member_index import (
+    MemberIndex,
+    get_member_index,
+    get_member_signatures,
+    union_member_index,
+)
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_cache import clear_protocol_cache
+
+# ===== 示例协议 =====
+
+
+class Named(Protocol):
+    name: str
+
+
+class Runner(Protocol):
+    def run(self, times: int) -> None: ...
+
+
+class NamedRunner(Named, Runner, Protocol):
+    def stop(self) -> None: ...
+
+
+# ===== 单个协议 =====
+
+
+def test_index_classifies_members() -> None:
+    """
+    测试：成员按方法 / 数据分类，并包含协议基类的成员。
+    """
+    assert get_member_index(Runner) == MemberIndex(frozenset({"run"}), frozenset())
+    index = get_member_index(NamedRunner)
+    assert index.callables == {"run", "stop"}
+    assert index.data == {"name"}
+    assert index.names == {"run", "stop", "name"}
+
+
+def test_index_is_collected_once() -> None:
+    """
+    测试：同一协议类只收集一次成员。
+    """
+
+    class Fresh(Protocol):
+        def go(self) -> None: ...
+
+    with patch.object(
+        member_index,
+        "collect_member_index",
+        wraps=member_index.collect_member_index,
+    ) as mock_collect:
+        first = get_member_index(Fresh)
+        assert get_member_index(Fresh) is first
+        assert mock_collect.call_count == 1
+
+
+def test_index_is_held_weakly() -> None:
+    """
+    测试：协议类被回收后索引随之释放。
+    """
+
+    def make() -> "weakref.ref[type]":
+        class Temp(Protocol):
+            def go(self) -> None: ...
+
+        get_member_index(Temp)
+        assert Temp in member_index._INDEX
+        return weakref.ref(Temp)
+
+    ref = make()
+    gc.collect()
+    assert ref() is None
+
+
+def test_signatures_of_callables() -> None:
+    """
+    测试：方法成员签名按需计算并缓存。
+    """
+    signatures = get_member_signatures(NamedRunner)
+    assert set(signatures) == {"run", "stop"}
+    assert list(signatures["run"].parameters) == ["self", "times"]
+    assert isinstance(signatures["stop"], inspect.Signature)
+    assert get_member_signatures(NamedRunner) is signatures
+
+
+# ===== 组合 =====
+
+
+def test_union_matches_composed_protocol() -> None:
+    """
+    测试：组合协议的成员索引由基类索引合并而来，并登记到组合类上。
+    """
+    clear_protocol_cache()
+    cls = compose_protocol(ProtocolSequence([Named, Runner]), runtime=True)
+    expected = union_member_index([Named, Runner])
+    assert expected == (frozenset({"run"}), frozenset({"name"}))
+    with patch.object(member_index, "collect_member_index") as mock_collect:
+        assert get_member_index(cls) == expected
+        mock_collect.assert_not_called()
@@ -5,9 +5,9 @@ from typing import Protocol
 from hypothesis import given
 from hypothesis.strategies import lists, sampled_from
 
-from src.protocolx.compose_protocol import compose_protocol
-from src.protocolx.definition.type.protocol_sequence import ProtocolSequence
-from src.protocolx.global_var.protocol_cache import clear_protocol_cache
+from protocolx.compose_protocol import _get_protocol_digest, compose_protocol
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_cache import clear_protocol_cache
 
 # ===== 示例协议 =====
 
@@ -71,7 +71,7 @@ def test_composed_protocol_class_properties() -> None:
     - 是 type 且 Protocol 的子类
     - __name__ 符合命名规则
     - __module__ 正确
-    - 名称中的 hash 来源一致
+    - 名称中的摘要来源一致
     """
     clear_protocol_cache()
 
@@ -86,12 +86,11 @@ def test_composed_protocol_class_properties() -> None:
     # 模块名正确
     assert result.__module__ == "__anon_protocol__"
 
-    # 类名以 _AnonProtocol_ 开头 + 8位十六进制
-    assert re.fullmatch(r"_AnonProtocol_[0-9a-f]{8}", result.__name__), result.__name__
+    # 类名以 _AnonProtocol_ 开头 + 16位十六进制
+    assert re.fullmatch(r"_AnonProtocol_[0-9a-f]{16}", result.__name__), result.__name__
 
-    # 验证类名中的 hash 部分是否正确来源于 hash((hash(ps), runtime))
-    expected_key = (hash(ps), runtime_flag)
-    expected_suffix = f"{abs(hash(expected_key)) & 0xFFFF_FFFF:08x}"
+    # 验证类名中的摘要部分是否正确来源于完全限定名与 runtime 标志
+    expected_suffix = _get_protocol_digest(ps, runtime_flag)
     assert result.__name__.endswith(expected_suffix), (
-        f"{result.__name__=} 不以预期 hash 后缀结尾 {expected_suffix=}"
+        f"{result.__name__=} 不以预期摘要后缀结尾 {expected_suffix=}"
     )
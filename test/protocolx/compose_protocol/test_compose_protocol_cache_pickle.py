@@ -1,9 +1,9 @@
 import pickle
 from typing import Protocol
 
-from src.protocolx.compose_protocol import compose_protocol
-from src.protocolx.definition.type.protocol_sequence import ProtocolSequence
-from src.protocolx.global_var.protocol_cache import (
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_cache import (
     clear_protocol_cache,
     get_protocol,
     get_protocol_cache,
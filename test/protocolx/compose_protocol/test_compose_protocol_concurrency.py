@@ -0,0 +1,83 @@
+import importlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Protocol
+from unittest.mock import patch
+
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.composition_lock import get_pending_lock_count
+from protocolx.global_var.protocol_cache import clear_protocol_cache
+
+compose_protocol_module = importlib.import_module("protocolx.compose_protocol")
+
+# ===== 示例协议 =====
+
+
+class A(Protocol):
+    def a(self) -> None: ...
+
+
+class B(Protocol):
+    def b(self) -> None: ...
+
+
+class C(Protocol):
+    def c(self) -> None: ...
+
+
+THREADS = 16
+
+
+def test_concurrent_compose_creates_single_class() -> None:
+    """
+    测试：多线程同时组合同一协议，只创建一次类，所有线程拿到同一个对象。
+    """
+    clear_protocol_cache()
+    original = compose_protocol_module._create_anon_protocol_class
+
+    def slow_create(*args: Any) -> type:
+        time.sleep(0.01)  # 放大竞争窗口
+        return original(*args)
+
+    barrier = threading.Barrier(THREADS)
+
+    def worker(order: int) -> type:
+        protocols = [A, B] if order % 2 else [B, A]
+        barrier.wait()
+        return compose_protocol(ProtocolSequence(protocols), runtime=True)
+
+    with patch.object(
+        compose_protocol_module,
+        "_create_anon_protocol_class",
+        side_effect=slow_create,
+    ) as mock_create:
+        with ThreadPoolExecutor(THREADS) as pool:
+            results = list(pool.map(worker, range(THREADS)))
+
+    assert mock_create.call_count == 1
+    assert all(cls is results[0] for cls in results)
+    assert get_pending_lock_count() == 0
+
+
+def test_concurrent_distinct_compositions_do_not_block_each_other() -> None:
+    """
+    测试：不同组合并发创建互不串行，且各自结果正确。
+    """
+    clear_protocol_cache()
+    combos = [[A], [B], [C], [A, B], [A, C], [B, C], [A, B, C]]
+    barrier = threading.Barrier(len(combos))
+
+    def worker(protocols: list[type]) -> tuple[list[type], type]:
+        barrier.wait()
+        return protocols, compose_protocol(ProtocolSequence(protocols))
+
+    with ThreadPoolExecutor(len(combos)) as pool:
+        results = list(pool.map(worker, combos))
+
+    classes = {cls for _, cls in results}
+    assert len(classes) == len(combos)
+    for protocols, cls in results:
+        assert all(p in cls.__mro__ for p in protocols)
+        assert compose_protocol(ProtocolSequence(protocols)) is cls
@@ -0,0 +1,177 @@
+import importlib
+import pickle
+from types import new_class
+from typing import Protocol
+
+import pytest
+
+from protocolx.checker.member_index import collect_member_index
+from protocolx.checker.conformance_cache import CONFORMANCE_ATTR
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_cache import (
+    clear_protocol_cache,
+    del_protocol,
+    find_closest_composition,
+)
+
+compose_protocol_module = importlib.import_module("protocolx.compose_protocol")
+
+# ===== 示例协议 =====
+
+
+class A(Protocol):
+    def a(self) -> None: ...
+
+
+class B(Protocol):
+    def b(self) -> None: ...
+
+
+class C(Protocol):
+    def c(self) -> None: ...
+
+
+class D(Protocol):
+    d: int
+
+
+class Impl:
+    d = 1
+
+    def a(self) -> None: ...
+
+    def b(self) -> None: ...
+
+    def c(self) -> None: ...
+
+
+class Partial:
+    def a(self) -> None: ...
+
+    def b(self) -> None: ...
+
+    def c(self) -> None: ...
+
+
+# ===== 父组合选择 =====
+
+
+def test_builds_on_largest_cached_subset() -> None:
+    """
+    测试：以一级缓存中最大的子集组合为直接基类，只追加其余协议。
+    """
+    clear_protocol_cache()
+    compose_protocol(ProtocolSequence([A, B]), runtime=True)
+    abc = compose_protocol(ProtocolSequence([A, B, C]), runtime=True)
+    abcd = compose_protocol(
+        ProtocolSequence([A, B, C, D]), runtime=True, incremental=True
+    )
+    assert abcd.__bases__[:2] == (abc, D)
+    assert issubclass(abcd, abc)
+
+
+def test_falls_back_without_cached_subset() -> None:
+    """
+    测试：没有可复用的子集组合（或 runtime 不同）时整体创建。
+    """
+    clear_protocol_cache()
+    compose_protocol(ProtocolSequence([A, B]), runtime=False)
+    cls = compose_protocol(ProtocolSequence([A, B, C]), runtime=True, incremental=True)
+    assert cls.__bases__ == (A, B, C, Protocol)
+
+
+def test_cached_result_is_shared_with_flat_mode() -> None:
+    """
+    测试：增量组合与普通组合缓存键相同，返回同一个类对象，且可 pickle。
+    """
+    clear_protocol_cache()
+    compose_protocol(ProtocolSequence([A, B]))
+    cls = compose_protocol(ProtocolSequence([A, B, C]), incremental=True)
+    assert compose_protocol(ProtocolSequence([C, B, A])) is cls
+    assert pickle.loads(pickle.dumps(cls)) is cls
+
+
+# ===== 运行时语义 =====
+
+
+@pytest.mark.parametrize("runtime", [True, "compiled"])
+def test_incremental_members_and_checks_match_flat(runtime: object) -> None:
+    """
+    测试：增量计算的成员集合与整体收集一致，isinstance 结果不变。
+    """
+    clear_protocol_cache()
+    compose_protocol(ProtocolSequence([A, B, C]), runtime=runtime)  # type: ignore[arg-type]
+    cls = compose_protocol(
+        ProtocolSequence([A, B, C, D]),
+        runtime=runtime,  # type: ignore[arg-type]
+        incremental=True,
+    )
+    cache = cls.__dict__[CONFORMANCE_ATTR]
+    assert (cache.callables, cache.data) == collect_member_index(cls)
+    assert (cache.callables, cache.data) == (frozenset("abc"), frozenset("d"))
+    assert isinstance(Impl(), cls)
+    assert not isinstance(Partial(), cls)
+
+
+# ===== 失败回退 =====
+
+
+def test_non_mro_errors_are_not_swallowed(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    测试：以父组合创建时出现的非 MRO 冲突错误直接抛出，不退回整体创建。
+    """
+    clear_protocol_cache()
+    compose_protocol(ProtocolSequence([A, B]), runtime=True)
+    calls: list[object] = []
+
+    def broken(*args: object) -> None:
+        calls.append(args)
+        raise TypeError("broken installer")
+
+    monkeypatch.setattr(compose_protocol_module, "install_conformance_cache", broken)
+    with pytest.raises(TypeError, match="broken installer"):
+        compose_protocol(ProtocolSequence([A, B, C]), runtime=True, incremental=True)
+    assert len(calls) == 1
+
+
+def test_mro_conflict_detection() -> None:
+    """
+    测试：按 C3 线性化判断 MRO 冲突。
+    """
+
+    class BA(B, A, Protocol): ...
+
+    parent = compose_protocol(ProtocolSequence([A, B]))
+    assert compose_protocol_module._has_mro_conflict((parent, BA, Protocol))
+    assert not compose_protocol_module._has_mro_conflict((parent, C, Protocol))
+
+
+# ===== 子集查找 =====
+
+
+def test_closest_subset_ignores_unrelated_and_evicted() -> None:
+    """
+    测试：大量无关组合、编号最小的协议不同、或已删除的组合都不影响最大子集的选择。
+    """
+    clear_protocol_cache()
+    others = [new_class(f"Other{i}", (Protocol,)) for i in range(50)]
+    for i in range(0, 50, 2):
+        compose_protocol(ProtocolSequence(others[i : i + 2]), runtime=True)
+    bc = compose_protocol(ProtocolSequence([B, C]), runtime=True)
+    compose_protocol(ProtocolSequence([A, B]), runtime=False)
+
+    found = find_closest_composition(ProtocolSequence([A, B, C, D]), True)
+    assert found is not None and found[1] is bc
+
+    abc = compose_protocol(ProtocolSequence([A, B, C]), runtime=True)
+    found = find_closest_composition(ProtocolSequence([A, B, C, D]), True)
+    assert found is not None and found[1] is abc
+    assert find_closest_composition(ProtocolSequence([A, B, C]), True) == (
+        ProtocolSequence([B, C]),
+        bc,
+    )
+
+    del_protocol(name=abc.__name__)
+    found = find_closest_composition(ProtocolSequence([A, B, C, D]), True)
+    assert found is not None and found[1] is bc
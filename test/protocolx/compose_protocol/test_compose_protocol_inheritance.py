@@ -3,9 +3,9 @@ from typing import Protocol, runtime_checkable
 from hypothesis import given
 from hypothesis.strategies import lists, sampled_from
 
-from src.protocolx.compose_protocol import compose_protocol
-from src.protocolx.definition.type.protocol_sequence import ProtocolSequence
-from src.protocolx.global_var.protocol_cache import (
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_cache import (
     clear_protocol_cache,
 )
 
@@ -0,0 +1,104 @@
+import importlib
+import os
+import subprocess
+import sys
+import textwrap
+from typing import Protocol
+
+import pytest
+
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_cache import clear_protocol_cache
+
+# 包 __init__ 导出的同名函数会遮蔽子模块属性，这里直接取模块对象
+compose_protocol_module = importlib.import_module("protocolx.compose_protocol")
+
+# ===== 示例协议 =====
+
+
+class A(Protocol): ...
+
+
+class B(Protocol): ...
+
+
+class C(Protocol): ...
+
+
+_SCRIPT = textwrap.dedent(
+    """
+    from typing import Protocol
+
+    from protocolx.compose_protocol import compose_protocol
+    from protocolx.definition.type.protocol_sequence import ProtocolSequence
+
+    class A(Protocol): ...
+
+    class B(Protocol): ...
+
+    print(compose_protocol(ProtocolSequence([B, A]), runtime=True).__name__)
+    """
+)
+
+
+def _compose_name_in_subprocess(hash_seed: str) -> str:
+    src = os.path.join(os.path.dirname(compose_protocol_module.__file__), "..")
+    env = {**os.environ, "PYTHONHASHSEED": hash_seed, "PYTHONPATH": src}
+    out = subprocess.run(
+        [sys.executable, "-c", _SCRIPT],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return out.stdout.strip()
+
+
+def test_name_is_stable_across_processes() -> None:
+    """
+    测试：类名与 PYTHONHASHSEED 无关，不同进程对同一组合得到相同名称。
+    """
+    names = {_compose_name_in_subprocess(seed) for seed in ("0", "1", "12345")}
+    assert len(names) == 1
+
+
+def test_digest_collision_yields_distinct_classes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    测试：摘要碰撞时索引检测到冲突，不同组合仍得到不同的类，且各自缓存命中正确。
+    """
+    clear_protocol_cache()
+    monkeypatch.setattr(
+        compose_protocol_module, "_get_protocol_digest", lambda bases, runtime: "0"
+    )
+
+    ab = compose_protocol(ProtocolSequence([A, B]))
+    ac = compose_protocol(ProtocolSequence([A, C]))
+
+    assert ab is not ac
+    assert ab.__name__ == "_AnonProtocol_0"
+    assert ac.__name__ == "_AnonProtocol_0_1"
+    assert C in ac.__mro__ and C not in ab.__mro__
+    assert compose_protocol(ProtocolSequence([C, A])) is ac
+    assert compose_protocol(ProtocolSequence([B, A])) is ab
+
+
+def test_same_qualname_different_class_does_not_hit_cache() -> None:
+    """
+    测试：完全限定名相同但类对象不同（如模块重载）时不会误命中旧类。
+    """
+    clear_protocol_cache()
+
+    def make() -> type:
+        class Local(Protocol): ...
+
+        return Local
+
+    first, second = make(), make()
+    cls1 = compose_protocol(ProtocolSequence([first]))
+    cls2 = compose_protocol(ProtocolSequence([second]))
+
+    assert cls1 is not cls2
+    assert first in cls1.__mro__ and second in cls2.__mro__
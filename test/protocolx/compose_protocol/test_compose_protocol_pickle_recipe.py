@@ -0,0 +1,133 @@
+import os
+import pickle
+import subprocess
+import sys
+from types import new_class
+from typing import Protocol, SupportsAbs, SupportsIndex, SupportsInt
+
+import pytest
+
+from protocolx.compose_protocol import RECIPE_ATTR, compose_protocol
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_cache import clear_protocol_cache
+from protocolx.global_var.protocol_cache_stats import (
+    get_protocol_cache_stats,
+    reset_protocol_cache_stats,
+)
+
+# ===== 示例协议 =====
+
+
+class A(Protocol):
+    def a(self) -> None: ...
+
+
+class B(Protocol):
+    def b(self) -> None: ...
+
+
+class Impl:
+    def a(self) -> None: ...
+
+    def b(self) -> None: ...
+
+
+# ===== 按配方序列化 =====
+
+
+@pytest.mark.parametrize("runtime", [False, True, "compiled"])
+def test_pickle_stores_recipe_not_anon_name(runtime: bool | str) -> None:
+    """
+    测试：序列化结果只引用协议类与 runtime 标志，不引用虚拟模块中的类名。
+    """
+    clear_protocol_cache()
+    cls = compose_protocol(ProtocolSequence([A, B]), runtime=runtime)
+    payload = pickle.dumps(cls)
+    assert b"__anon_protocol__" not in payload
+    assert cls.__name__.encode() not in payload
+    assert pickle.loads(payload) is cls
+
+
+@pytest.mark.parametrize("runtime", [False, True, "compiled"])
+def test_local_protocols_pickle_by_name(runtime: bool | str) -> None:
+    """
+    测试：组合中含无法按名称导入的协议（函数内定义、new_class 创建）时，
+    退回按虚拟模块中的类名序列化，进程内往返得到同一个类。
+    """
+    clear_protocol_cache()
+
+    def make() -> type:
+        class Local(Protocol):
+            def local(self) -> None: ...
+
+        return Local
+
+    dynamic = new_class("Dynamic", (Protocol,), exec_body=lambda ns: None)
+    cls = compose_protocol(ProtocolSequence([A, make(), dynamic]), runtime=runtime)
+    payload = pickle.dumps(cls)
+    assert cls.__name__.encode() in payload
+    assert pickle.loads(payload) is cls
+
+
+def test_unpickle_rebuilds_after_cache_clear() -> None:
+    """
+    测试：目标进程未组合过该类（缓存已清空）时，反序列化按配方重建，
+    得到与原类等价的组合类，且只创建一次。
+    """
+    clear_protocol_cache()
+    cls = compose_protocol(ProtocolSequence([A, B]), runtime="compiled")
+    payload = pickle.dumps(cls)
+    clear_protocol_cache()
+    reset_protocol_cache_stats()
+    restored = pickle.loads(payload)
+    again = pickle.loads(payload)
+    assert restored is again
+    assert restored.__name__ == cls.__name__
+    assert restored.__dict__[RECIPE_ATTR] == (ProtocolSequence([A, B]), "compiled")
+    assert isinstance(Impl(), restored)
+    assert get_protocol_cache_stats().creations == 1
+
+
+def test_unpickle_in_fresh_process() -> None:
+    """
+    测试：全新进程无需预热即可反序列化组合类。
+    """
+    cls = compose_protocol(
+        ProtocolSequence([SupportsAbs, SupportsIndex, SupportsInt]), runtime=True
+    )
+    code = (
+        "import pickle, sys\n"
+        "cls = pickle.loads(sys.stdin.buffer.read())\n"
+        "print(cls.__name__, isinstance(7, cls))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        input=pickle.dumps(cls),
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    assert out.stdout.decode().split() == [cls.__name__, "True"]
+
+
+# ===== 其他协议类 =====
+
+
+def test_plain_protocols_still_pickle_by_name() -> None:
+    """
+    测试：非组合的协议类仍按全局名称序列化。
+    """
+    assert pickle.loads(pickle.dumps(A)) is A
+    assert pickle.loads(pickle.dumps(SupportsInt)) is SupportsInt
+
+    composed = compose_protocol(ProtocolSequence([A, B]), runtime=True)
+
+    class Sub(composed, Protocol):  # type: ignore[valid-type, misc]
+        pass
+
+    globals()["Sub"] = Sub
+    Sub.__qualname__ = "Sub"
+    try:
+        assert pickle.loads(pickle.dumps(Sub)) is Sub
+    finally:
+        del globals()["Sub"]
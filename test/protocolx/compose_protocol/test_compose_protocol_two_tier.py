@@ -0,0 +1,80 @@
+import importlib
+import sys
+from typing import Protocol
+from unittest.mock import patch
+
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_cache import (
+    clear_protocol_cache,
+    del_protocol,
+    get_composition_cache,
+    get_protocol_cache,
+)
+
+compose_protocol_module = importlib.import_module("protocolx.compose_protocol")
+
+# ===== 示例协议 =====
+
+
+class A(Protocol): ...
+
+
+class B(Protocol): ...
+
+
+def test_primary_hit_skips_registry() -> None:
+    """
+    测试：一级缓存命中时不再计算类名、不访问虚拟模块。
+    """
+    clear_protocol_cache()
+    ps = ProtocolSequence([A, B])
+    cls = compose_protocol(ps, runtime=True)
+    assert get_composition_cache()[(ps, True)] is cls
+
+    with patch.object(
+        compose_protocol_module, "_compose_via_registry"
+    ) as mock_registry:
+        assert compose_protocol(ps, runtime=True) is cls
+        assert compose_protocol(ProtocolSequence([B, A]), runtime=True) is cls
+        assert mock_registry.call_count == 0
+
+
+def test_registry_backs_primary_miss() -> None:
+    """
+    测试：一级缓存缺失时由虚拟模块命中，返回同一个类并回填一级缓存。
+    """
+    clear_protocol_cache()
+    ps = ProtocolSequence([A, B])
+    cls = compose_protocol(ps)
+
+    get_composition_cache().clear()
+    assert cls.__name__ in get_protocol_cache()
+    assert compose_protocol(ps) is cls
+    assert (ps, False) in get_composition_cache()
+
+
+def test_primary_follows_registry_removal() -> None:
+    """
+    测试：del_protocol / clear_protocol_cache / 重建虚拟模块都会同步清理一级缓存。
+    """
+    clear_protocol_cache()
+    ps = ProtocolSequence([A, B])
+    cls = compose_protocol(ps)
+
+    del_protocol(name=cls.__name__)
+    assert (ps, False) not in get_composition_cache()
+    recreated = compose_protocol(ps)
+    assert recreated is not cls
+    assert get_protocol_cache()[recreated.__name__] is recreated
+
+    clear_protocol_cache()
+    assert len(get_composition_cache()) == 0
+
+    # 虚拟模块被外部移除后，首次访问注册表即作废依附旧模块的一级缓存
+    compose_protocol(ps)
+    sys.modules.pop("__anon_protocol__", None)
+    assert len(get_protocol_cache()) > 0
+    assert len(get_composition_cache()) == 0
+    fresh = compose_protocol(ps)
+    assert fresh.__name__ in get_protocol_cache()
@@ -2,8 +2,8 @@ from typing import Protocol
 
 import pytest
 
-from src.protocolx.compose_protocol import compose_protocol
-from src.protocolx.global_var.protocol_cache import (
+from protocolx.compose_protocol import compose_protocol
+from protocolx.global_var.protocol_cache import (
     clear_protocol_cache,
 )
 
@@ -0,0 +1,152 @@
+import importlib
+from typing import Protocol
+
+import pytest
+
+from protocolx.compose_protocol import compose_protocol
+from protocolx.conformance_matrix import conformance_matrix
+from protocolx.definition.type.conformance_matrix import ConformanceMatrix
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_cache import clear_protocol_cache
+
+conformance_matrix_module = importlib.import_module("protocolx.conformance_matrix")
+
+# ===== 示例协议与插件类型 =====
+
+
+class Load(Protocol):
+    def load(self) -> None: ...
+
+
+class Save(Protocol):
+    def save(self) -> None: ...
+
+
+class Named(Protocol):
+    name: str
+
+
+class Loader:
+    def load(self) -> None: ...
+
+
+class Store(Loader):
+    def save(self) -> None: ...
+
+
+class NamedStore(Store):
+    name: str
+
+
+class Disabled(Store):
+    save = None  # type: ignore[assignment]
+
+
+class Nothing:
+    pass
+
+
+TYPES = [Loader, Store, NamedStore, Disabled, Nothing]
+
+
+def _backends() -> list[object]:
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return ["python", pytest.param("numpy", marks=pytest.mark.skip("no numpy"))]
+    return ["python", "numpy"]
+
+
+# ===== 结果正确性 =====
+
+
+@pytest.mark.parametrize("backend", _backends())
+def test_matrix_matches_expected_table(backend: str) -> None:
+    """
+    测试：协议可为 ProtocolSequence 或组合类；方法成员为 None 视为缺失，
+    数据成员注解即视为提供。
+    """
+    clear_protocol_cache()
+    load_save = ProtocolSequence([Load, Save])
+    composed = compose_protocol(ProtocolSequence([Load, Named]))
+    matrix = conformance_matrix(
+        TYPES,
+        [Load, load_save, composed],
+        backend=backend,  # type: ignore[arg-type]
+    )
+    assert isinstance(matrix, ConformanceMatrix)
+    assert matrix.to_lists() == [
+        [True, False, False],
+        [True, True, False],
+        [True, True, True],
+        [True, False, False],
+        [False, False, False],
+    ]
+    assert matrix.conforms(Store, load_save)
+    assert not matrix.conforms(Disabled, load_save)
+    assert matrix.protocols_for(NamedStore) == [Load, load_save, composed]
+    assert matrix.types_for(load_save) == [Store, NamedStore]
+
+
+@pytest.mark.parametrize("backend", _backends())
+def test_matrix_agrees_with_issubclass(backend: str) -> None:
+    """
+    测试：只含方法成员的组合协议，结果与 issubclass 一致。
+    """
+    clear_protocol_cache()
+    protocols = [
+        compose_protocol(ProtocolSequence(ps), runtime=True)
+        for ps in ([Load], [Save], [Load, Save])
+    ]
+    matrix = conformance_matrix(TYPES, protocols, backend=backend)  # type: ignore[arg-type]
+    assert matrix.to_lists() == [
+        [issubclass(tp, proto) for proto in protocols] for tp in TYPES
+    ]
+
+
+@pytest.mark.parametrize("backend", _backends())
+def test_empty_inputs(backend: str) -> None:
+    """
+    测试：空类型或空协议列表返回空表；无成员协议被所有类型满足。
+    """
+
+    class Empty(Protocol): ...
+
+    assert conformance_matrix([], [Load], backend=backend).rows == ()  # type: ignore[arg-type]
+    assert conformance_matrix(TYPES, [], backend=backend).rows == (0,) * len(TYPES)  # type: ignore[arg-type]
+    matrix = conformance_matrix(TYPES, [Empty], backend=backend)  # type: ignore[arg-type]
+    assert matrix.types_for(Empty) == TYPES
+
+
+def test_unknown_backend_raises() -> None:
+    """
+    测试：未知后端抛出 ValueError。
+    """
+    with pytest.raises(ValueError, match="unknown backend"):
+        conformance_matrix(TYPES, [Load], backend="gpu")  # type: ignore[arg-type]
+
+
+def test_auto_backend_uses_numpy_only_for_large_tables(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    测试：backend="auto" 对小表使用位集，表格足够大且安装了 NumPy 时才使用矩阵运算。
+    """
+    used: list[str] = []
+    for name in ("_solve_python", "_solve_numpy"):
+        solve = getattr(conformance_matrix_module, name)
+        monkeypatch.setattr(
+            conformance_matrix_module,
+            name,
+            lambda *args, _name=name, _solve=solve: used.append(_name) or _solve(*args),
+        )
+    protocols = [Load, Save, Named]
+    small = conformance_matrix(TYPES, protocols)
+    many = TYPES * (conformance_matrix_module._NUMPY_MIN_CELLS // len(protocols))
+    large = conformance_matrix(many, protocols)
+
+    expected_large = (
+        "_solve_python" if conformance_matrix_module.np is None else "_solve_numpy"
+    )
+    assert used == ["_solve_python", expected_large]
+    assert large.rows == small.rows * (len(many) // len(TYPES))
@@ -1,9 +1,10 @@
+from unittest.mock import patch
 from typing import Protocol
 
 from hypothesis import given
 from hypothesis.strategies import lists, sampled_from
 
-from src.protocolx.definition.type.protocol_sequence import (
+from protocolx.definition.type.protocol_sequence import (
     ProtocolSequence,
 )
 
@@ -92,13 +93,13 @@ def test_repr_shows_sorted_names(protocols: list[type]) -> None:
 
 
 @given(lists(sampled_from([Alpha, Beta, Gamma]), min_size=1, max_size=5))
-def test_hash_consistent_with_sorted_names(protocols: list[type]) -> None:
+def test_hash_consistent_with_mask(protocols: list[type]) -> None:
     """
-    测试：__hash__ 应等于 hash(排序后的名称元组)。
+    测试：__hash__ 应等于 hash(协议编号位掩码)，位数等于去重后的协议数。
     """
     ps = ProtocolSequence(protocols)
-    expected_hash = hash(tuple(sorted(set(cls.__name__ for cls in protocols))))
-    assert hash(ps) == expected_hash
+    assert hash(ps) == hash(ps.mask)
+    assert ps.mask.bit_count() == len(set(protocols))
 
 
 @given(lists(sampled_from([Alpha, Beta, Gamma]), min_size=1, max_size=5))
@@ -141,3 +142,46 @@ def test_names_are_sorted_class_names(protocols: list[type]) -> None:
     # 验证 names 与迭代项的 __name__ 一致
     iter_names = tuple(cls.__name__ for cls in ps)
     assert actual_names == iter_names
+
+
+def test_equality_identity_short_circuit() -> None:
+    """
+    测试：与自身比较直接返回 True，不触发校验与排序。
+    """
+    ps = ProtocolSequence([Alpha, Beta])
+    assert ps == ps
+    assert ps._items is None
+
+
+def test_equality_short_circuits_on_cached_hash() -> None:
+    """
+    测试：双方哈希都已缓存且不同时直接判不等，不再比较元素。
+    """
+    ps1 = ProtocolSequence([Alpha, Beta])
+    ps2 = ProtocolSequence([Beta, Gamma])
+    hash(ps1), hash(ps2)
+    with patch.object(ProtocolSequence, "_ensure_sorted") as mock_sorted:
+        assert ps1 != ps2
+    mock_sorted.assert_not_called()
+
+
+def test_equality_based_on_protocol_identity() -> None:
+    """
+    测试：同名但来自不同模块的协议不相等。
+    """
+    Other = type(Alpha)("Alpha", (Protocol,), {"__module__": "elsewhere"})
+    ps1 = ProtocolSequence([Alpha, Beta])
+    ps2 = ProtocolSequence([Other, Beta])
+    assert ps1.names == ps2.names
+    assert ps1 != ps2
+    assert len({ps1, ps2}) == 2
+
+
+def test_same_name_ordered_by_qualified_name() -> None:
+    """
+    测试：同名协议按模块与限定名排序，与输入顺序无关。
+    """
+    Late = type(Alpha)("Alpha", (Protocol,), {"__module__": "zz"})
+    Early = type(Alpha)("Alpha", (Protocol,), {"__module__": "aa"})
+    for ordered in ([Late, Beta, Early], [Beta, Early, Late]):
+        assert list(ProtocolSequence(ordered)) == [Early, Late, Beta]
@@ -4,7 +4,7 @@ import pytest
 from hypothesis import given
 from hypothesis.strategies import integers, lists, sampled_from
 
-from src.protocolx.definition.type.protocol_sequence import (
+from protocolx.definition.type.protocol_sequence import (
     ProtocolSequence,
 )
 
@@ -40,8 +40,9 @@ def test_empty_protocol_sequence_should_work() -> None:
     # __repr__
     assert repr(ps) == "ProtocolSequence()"
 
-    # 可哈希（等价于 hash(())）
-    assert hash(ps) == hash(())
+    # 可哈希（空位掩码）
+    assert ps.mask == 0
+    assert hash(ps) == hash(0)
     assert isinstance(hash(ps), int)
 
     # 迭代应抛出 StopIteration
@@ -63,7 +64,8 @@ def test_single_element_behavior() -> None:
     assert list(ps) == [B]
     assert ps.names == ("B",)
     assert repr(ps) == "ProtocolSequence(B)"
-    assert hash(ps) == hash(("B",))
+    assert hash(ps) == hash(ps.mask)
+    assert ps.mask.bit_count() == 1
 
 
 # === 多元素测试 ===
@@ -4,7 +4,7 @@ from typing import Protocol
 from hypothesis import given
 from hypothesis.strategies import lists, sampled_from
 
-from src.protocolx.definition.type.protocol_sequence import (
+from protocolx.definition.type.protocol_sequence import (
     ProtocolSequence,
 )
 
@@ -105,3 +105,25 @@ def test_hash_cached_after_hash(protocols: list[type]) -> None:
     hash_before = ps._hash
     _ = hash(ps)
     assert ps._hash == hash_before
+
+
+@given(lists(sampled_from([A, B, C]), min_size=1, max_size=5))
+def test_original_items_released_after_sort(protocols: list[type]) -> None:
+    """
+    测试规范化后释放原始输入，且实例不携带 __dict__。
+
+    步骤：
+    1. 实例使用 __slots__ 布局，没有 __dict__。
+    2. 第一次迭代后 _original_items 被释放为 None。
+    3. 输入已是规范形式时，_items 直接复用输入元组。
+    """
+    ps = ProtocolSequence(protocols)
+    assert not hasattr(ps, "__dict__")
+
+    list(ps)
+    assert ps._original_items is None
+
+    canonical = ps._items
+    again = ProtocolSequence(canonical)
+    list(again)
+    assert again._items is canonical
@@ -2,7 +2,7 @@ from threading import Thread
 from typing import Protocol
 from unittest.mock import MagicMock, patch
 
-from src.protocolx.definition.type.protocol_sequence import (
+from protocolx.definition.type.protocol_sequence import (
     ProtocolSequence,
 )
 
@@ -85,17 +85,19 @@ def test_expensive_operations_called_once() -> None:
         assert_set_calls(mock_set, base_set, 1)
         assert_hash_calls(mock_hash, base_hash, 0)
 
-        # __hash__ → 第一次触发 hash(names)，再被调用者 hash(ps) 包裹一次，共两次
+        # __hash__ → 第一次触发 hash(mask)，再被调用者 hash(ps) 包裹一次，共两次
         _ = hash(ps)
         assert_sorted_calls(mock_sorted, base_sorted, 1)
         assert_set_calls(mock_set, base_set, 1)
-        assert_hash_calls(mock_hash, base_hash, 2)  # hash(names) + hash(ps)
+        assert_hash_calls(mock_hash, base_hash, 2)  # hash(mask) + hash(ps)
 
-        # __eq__ → 比较新实例 ProtocolSequence([A, B, C])，会重新排序一次
-        _ = ps == ProtocolSequence([A, B, C])
-        assert_sorted_calls(mock_sorted, base_sorted, 2)  # 排序 +1 次
-        assert_set_calls(mock_set, base_set, 2)  # set + 1 次（用于新对象排序）
+        # __eq__ → 比较新实例 ProtocolSequence([A, B, C])，只计算位掩码，不排序
+        other = ProtocolSequence([A, B, C])
+        _ = ps == other
+        assert_sorted_calls(mock_sorted, base_sorted, 1)
+        assert_set_calls(mock_set, base_set, 1)
         assert_hash_calls(mock_hash, base_hash, 2)  # 仍然保持 2（新对象未触发 hash）
+        assert other._items is None
 
 
 def test_thread_safety_on_names_and_hash() -> None:
@@ -0,0 +1,57 @@
+import os
+import pickle
+import subprocess
+import sys
+from typing import Protocol, SupportsAbs, SupportsInt
+
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_registry import get_registered_protocol_count
+
+
+# 示例协议（模块级，pickle 可按引用序列化）
+class A(Protocol): ...
+
+
+class B(Protocol): ...
+
+
+# === 序列化 ===
+
+
+def test_pickle_roundtrip_keeps_identity() -> None:
+    """
+    测试：同一进程内 pickle 往返后与原集合相等，规范形式不变。
+    """
+    ps = ProtocolSequence([B, A, B])
+    restored = pickle.loads(pickle.dumps(ps))
+
+    assert restored == ps
+    assert hash(restored) == hash(ps)
+    assert list(restored) == [A, B]
+
+
+def test_pickle_does_not_carry_process_local_ids() -> None:
+    """
+    测试：另一进程中协议编号不同，反序列化后仍按本进程编号重建位掩码。
+    """
+    ps = ProtocolSequence([SupportsInt, SupportsAbs])
+    ps.mask
+    # 子进程先登记足够多的临时协议，保证两个协议的编号与本进程不同
+    code = (
+        "import pickle, sys\n"
+        "from types import new_class\n"
+        "from typing import Protocol, SupportsAbs, SupportsInt\n"
+        "from protocolx import ProtocolSequence\n"
+        f"ProtocolSequence([new_class(f'T{{i}}', (Protocol,)) for i in range({get_registered_protocol_count()})]).mask\n"
+        "seq = pickle.loads(sys.stdin.buffer.read())\n"
+        "expected = ProtocolSequence([SupportsAbs, SupportsInt])\n"
+        "print(seq.mask == expected.mask, seq == expected, SupportsInt in seq)\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        input=pickle.dumps(ps),
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    assert out.stdout.decode().split() == ["True", "True", "True"]
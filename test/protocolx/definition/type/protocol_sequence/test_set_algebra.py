@@ -0,0 +1,118 @@
+from typing import Protocol
+from unittest.mock import patch
+
+from hypothesis import given
+from hypothesis.strategies import lists, sampled_from
+
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+
+
+# ===== 示例协议 =====
+
+
+class A(Protocol): ...
+
+
+class B(Protocol): ...
+
+
+class C(Protocol): ...
+
+
+class D(Protocol): ...
+
+
+protocol_lists = lists(sampled_from([A, B, C, D]), max_size=6)
+
+
+def _warm(ps: ProtocolSequence, sort: bool) -> ProtocolSequence:
+    """按需预先排序，覆盖操作数已排序 / 未排序两种路径。"""
+    if sort:
+        list(ps)
+    else:
+        _ = ps.mask
+    return ps
+
+
+def _expected(protocols: set[type]) -> ProtocolSequence:
+    return ProtocolSequence(list(protocols))
+
+
+# ===== 与 frozenset 语义一致 =====
+
+
+@given(protocol_lists, protocol_lists, sampled_from([True, False]))
+def test_set_operations_match_frozenset(
+    left: list[type], right: list[type], sort: bool
+) -> None:
+    """
+    测试：union / intersection / difference 与 frozenset 语义一致，
+    结果的迭代顺序、名称与哈希同直接构造的规范形式一致。
+    """
+    a = _warm(ProtocolSequence(left), sort)
+    b = _warm(ProtocolSequence(right), sort)
+    cases = [
+        (a.union(b), set(left) | set(right)),
+        (a.intersection(b), set(left) & set(right)),
+        (a.difference(b), set(left) - set(right)),
+    ]
+    for result, expected in cases:
+        ref = _expected(expected)
+        assert result == ref
+        assert hash(result) == hash(ref)
+        assert list(result) == list(ref)
+        assert result.names == ref.names
+        assert len(result) == len(expected)
+
+
+@given(protocol_lists, sampled_from([A, B, C, D]), sampled_from([True, False]))
+def test_add_matches_rebuild(protocols: list[type], proto: type, sort: bool) -> None:
+    """
+    测试：add 的结果与重新构造的集合一致；已包含时返回自身。
+    """
+    ps = _warm(ProtocolSequence(protocols), sort)
+    result = ps.add(proto)
+    assert list(result) == list(ProtocolSequence(protocols + [proto]))
+    assert ps.add(proto) is ps or proto not in ps
+    assert result.add(proto) is result
+
+
+@given(protocol_lists, protocol_lists)
+def test_subset_relations(left: list[type], right: list[type]) -> None:
+    """
+    测试：issubset / issuperset 与 frozenset 语义一致。
+    """
+    a, b = ProtocolSequence(left), ProtocolSequence(right)
+    assert a.issubset(b) == (set(left) <= set(right))
+    assert a.issuperset(b) == (set(left) >= set(right))
+    assert a.intersection(b).issubset(a)
+    assert a.issubset(a.union(b))
+
+
+# ===== 复用操作数 =====
+
+
+def test_derived_sequence_does_not_resort() -> None:
+    """
+    测试：操作数已排序时，派生集合不再校验或排序，规范形式直接可用。
+    """
+    base = ProtocolSequence([D, B, A])
+    list(base)
+    with patch("builtins.sorted", wraps=sorted) as mock_sorted:
+        derived = base.add(C).difference(ProtocolSequence([A]))
+        assert list(derived) == [B, C, D]
+        assert derived.names == ("B", "C", "D")
+    mock_sorted.assert_not_called()
+
+
+def test_no_op_operations_return_operand() -> None:
+    """
+    测试：结果与某个操作数相同时直接返回该操作数，保留其缓存。
+    """
+    ab = ProtocolSequence([A, B])
+    a = ProtocolSequence([A])
+    hash(ab)
+    assert ab.union(a) is ab
+    assert a.union(ab) is ab
+    assert ab.intersection(a) is a
+    assert ab.difference(ProtocolSequence([C])) is ab
@@ -0,0 +1,182 @@
+import importlib
+from typing import Any, Protocol, runtime_checkable
+from unittest.mock import patch
+
+from protocolx.checker.conformance_cache import invalidate_conformance_cache
+from protocolx.checker.member_posting_index import MemberPostingIndex
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.find_satisfied_protocols import (
+    find_satisfied_protocols,
+    get_member_posting_index,
+)
+from protocolx.global_var.protocol_cache import clear_protocol_cache, del_protocol
+
+posting_module = importlib.import_module("protocolx.checker.member_posting_index")
+
+# ===== 示例协议与实现 =====
+
+
+class Read(Protocol):
+    def read(self) -> bytes: ...
+
+
+class Write(Protocol):
+    def write(self, data: bytes) -> None: ...
+
+
+class Named(Protocol):
+    name: str
+
+
+class Reader:
+    def read(self) -> bytes:
+        return b""
+
+
+class ReadWriter(Reader):
+    def write(self, data: bytes) -> None: ...
+
+
+class NamedReader(Reader):
+    def __init__(self, named: bool) -> None:
+        if named:
+            self.name = "r"
+
+
+class Proxy:
+    def __getattr__(self, name: str) -> Any:
+        if name == "read":
+            return lambda: b""
+        raise AttributeError(name)
+
+
+class InitWriter(Reader):
+    def __init__(self) -> None:
+        self.write = lambda data: None
+
+
+class SlotNamedReader(Reader):
+    __slots__ = ("name",)
+
+    def __init__(self, named: bool) -> None:
+        if named:
+            self.name = "r"
+
+
+class HiddenReader(Reader):
+    def __getattribute__(self, name: str) -> Any:
+        if name == "read":
+            raise AttributeError(name)
+        return object.__getattribute__(self, name)
+
+
+def _compose_all() -> tuple[type, type, type]:
+    clear_protocol_cache()
+    r = compose_protocol(ProtocolSequence([Read]))
+    rw = compose_protocol(ProtocolSequence([Read, Write]), runtime=True)
+    rn = compose_protocol(ProtocolSequence([Read, Named]))
+    return r, rw, rn
+
+
+# ===== 查找结果 =====
+
+
+def test_finds_all_satisfied_compositions() -> None:
+    """
+    测试：返回对象满足的全部组合协议，顺序同组合先后，与结构检查一致。
+    """
+    r, rw, rn = _compose_all()
+    assert find_satisfied_protocols(Reader()) == [r]
+    assert find_satisfied_protocols(ReadWriter()) == [r, rw]
+    assert find_satisfied_protocols(object()) == []
+
+
+def test_data_members_checked_per_instance() -> None:
+    """
+    测试：数据成员在类型层面缺失时逐实例确认。
+    """
+    r, _, rn = _compose_all()
+    assert find_satisfied_protocols(NamedReader(True)) == [r, rn]
+    assert find_satisfied_protocols(NamedReader(False)) == [r]
+
+
+@runtime_checkable
+class _ReadReference(Read, Protocol): ...
+
+
+def test_getattr_types_checked_per_instance() -> None:
+    """
+    测试：定义了 __getattr__ 的类型不做类型层面判定，结果与 runtime_checkable 一致。
+    """
+    r, _, _ = _compose_all()
+    expected = [r] if isinstance(Proxy(), _ReadReference) else []
+    assert find_satisfied_protocols(Proxy()) == expected
+
+
+def test_instance_members_found() -> None:
+    """
+    测试：__init__ 中赋给实例的方法同样计入。
+    """
+    r, rw, _ = _compose_all()
+    assert find_satisfied_protocols(InitWriter()) == [r, rw]
+
+
+def test_unset_slot_not_counted() -> None:
+    """
+    测试：未赋值的 __slots__ 数据成员视为缺失。
+    """
+    r, _, rn = _compose_all()
+    assert find_satisfied_protocols(SlotNamedReader(True)) == [r, rn]
+    assert find_satisfied_protocols(SlotNamedReader(False)) == [r]
+
+
+def test_getattribute_override_checked_per_instance() -> None:
+    """
+    测试：重写 __getattribute__ 隐藏的成员不计入。
+    """
+    _compose_all()
+    assert find_satisfied_protocols(HiddenReader()) == []
+
+
+# ===== 缓存与重建 =====
+
+
+def test_results_cached_per_type() -> None:
+    """
+    测试：同一类型只做一次倒排表匹配；invalidate_conformance_cache 使其失效。
+    """
+    _compose_all()
+    with patch.object(
+        MemberPostingIndex,
+        "_match_type",
+        autospec=True,
+        side_effect=posting_module.MemberPostingIndex._match_type,
+    ) as mock_match:
+        for _ in range(3):
+            find_satisfied_protocols(ReadWriter())
+        assert mock_match.call_count == 1
+        invalidate_conformance_cache(ReadWriter)
+        find_satisfied_protocols(ReadWriter())
+        assert mock_match.call_count == 2
+
+
+def test_index_updated_in_place() -> None:
+    """
+    测试：组合加入或移出缓存后，同一个倒排索引增量更新，不重建。
+    """
+    r, rw, rn = _compose_all()
+    index = get_member_posting_index()
+    assert set(index.protocols) == {r, rw, rn}
+
+    del_protocol(name=rw.__name__)
+    assert find_satisfied_protocols(ReadWriter()) == [r]
+    with patch.object(
+        posting_module, "get_member_index", wraps=posting_module.get_member_index
+    ) as mock_index:
+        wide = compose_protocol(ProtocolSequence([Read, Write]))
+        assert mock_index.call_count == 0
+        assert find_satisfied_protocols(ReadWriter()) == [r, wide]
+        # 只为新组合计算成员索引
+        mock_index.assert_called_once_with(wide)
+    assert get_member_posting_index() is index
@@ -0,0 +1,138 @@
+import gc
+import pickle
+import weakref
+from types import new_class
+from typing import Iterator, Protocol
+
+import pytest
+
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.find_satisfied_protocols import find_satisfied_protocols
+from protocolx.global_var.protocol_cache import (
+    clear_protocol_cache,
+    get_cache_mode,
+    get_cached_compositions,
+    get_composition_cache,
+    get_protocol,
+    get_protocol_cache,
+    invalidate_protocol,
+    set_cache_mode,
+)
+from protocolx.global_var.protocol_cache_stats import (
+    get_protocol_cache_stats,
+    reset_protocol_cache_stats,
+)
+
+# ===== 示例协议 =====
+
+
+class A(Protocol):
+    def a(self) -> None: ...
+
+
+class B(Protocol):
+    def b(self) -> None: ...
+
+
+def _transient(i: int) -> type:
+    """每批请求临时生成的协议。"""
+    return new_class(
+        f"Transient{i}",
+        (Protocol,),
+        exec_body=lambda ns: ns.update({f"t{i}": lambda self: None}),
+    )
+
+
+@pytest.fixture
+def weak_mode() -> Iterator[None]:
+    clear_protocol_cache()
+    set_cache_mode("weak")
+    yield
+    set_cache_mode("strong")
+    clear_protocol_cache()
+
+
+# ===== 弱引用模式 =====
+
+
+def test_weak_mode_keeps_identity_while_referenced(weak_mode: None) -> None:
+    """
+    测试：组合类被外部引用期间，再次组合命中同一个类对象，按名称与 pickle 均可解析。
+    """
+    reset_protocol_cache_stats()
+    cls = compose_protocol(ProtocolSequence([A, B]), runtime=True)
+    assert compose_protocol(ProtocolSequence([B, A]), runtime=True) is cls
+    assert get_protocol_cache_stats().creations == 1
+    assert get_protocol_cache_stats().hits == 1
+    assert cls.__name__ not in get_protocol_cache()
+    assert get_protocol(name=cls.__name__) is cls
+    assert pickle.loads(pickle.dumps(cls)) is cls
+    assert not get_composition_cache()
+
+
+def test_weak_mode_releases_transient_protocols(weak_mode: None) -> None:
+    """
+    测试：不再被引用的组合类连同临时协议一起被回收，缓存条目随之移除。
+    """
+    refs = []
+    for i in range(20):
+        transient = _transient(i)
+        cls = compose_protocol(ProtocolSequence([A, transient]), runtime="compiled")
+        find_satisfied_protocols(object())
+        refs.append((weakref.ref(transient), weakref.ref(cls)))
+    del transient, cls
+    # 第一轮回收组合类并由回调移除缓存条目，协议类在下一轮回收
+    gc.collect()
+    gc.collect()
+    assert all(p() is None and c() is None for p, c in refs)
+    assert get_cached_compositions() == []
+
+
+def test_weak_mode_recreates_after_release(weak_mode: None) -> None:
+    """
+    测试：组合类被回收后再次组合时重新创建，类名不变。
+    """
+    name = compose_protocol(ProtocolSequence([A, B])).__name__
+    gc.collect()
+    assert get_cached_compositions() == []
+    assert compose_protocol(ProtocolSequence([A, B])).__name__ == name
+
+
+def test_weak_mode_invalidate_and_clear(weak_mode: None) -> None:
+    """
+    测试：选择性失效与清空同样作用于弱引用持有的组合。
+    """
+    ab = compose_protocol(ProtocolSequence([A, B]))
+    assert invalidate_protocol(A) == 1
+    assert compose_protocol(ProtocolSequence([A, B])) is not ab
+    clear_protocol_cache()
+    assert get_cached_compositions() == []
+
+
+# ===== 模式切换 =====
+
+
+def test_switching_modes_migrates_entries() -> None:
+    """
+    测试：切换模式时迁移已有组合，类对象身份保持不变。
+    """
+    clear_protocol_cache()
+    cls = compose_protocol(ProtocolSequence([A, B]))
+    set_cache_mode("weak")
+    try:
+        assert get_cache_mode() == "weak"
+        assert not get_composition_cache()
+        assert compose_protocol(ProtocolSequence([A, B])) is cls
+    finally:
+        set_cache_mode("strong")
+    assert get_composition_cache()[(ProtocolSequence([A, B]), False)] is cls
+    assert get_protocol_cache()[cls.__name__] is cls
+
+
+def test_rejects_unknown_mode() -> None:
+    """
+    测试：未知模式抛出 ValueError。
+    """
+    with pytest.raises(ValueError):
+        set_cache_mode("soft")  # type: ignore[arg-type]
@@ -0,0 +1,217 @@
+import pickle
+import threading
+import time
+from types import new_class
+from typing import Iterator, Protocol
+
+import pytest
+
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.eviction_policy import EvictionPolicy
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var import protocol_cache, protocol_eviction
+from protocolx.global_var.protocol_cache import (
+    clear_protocol_cache,
+    get_composition_cache,
+    get_protocol,
+    get_protocol_cache,
+    pin_protocol,
+    set_eviction_policy,
+    unpin_protocol,
+)
+
+
+class A(Protocol): ...
+
+
+class B(Protocol): ...
+
+
+# 模块级协议，保证 pickle 可按引用序列化基类
+PROTOCOLS: list[type] = [new_class(f"E{i}", (Protocol,)) for i in range(6)]
+for _proto in PROTOCOLS:
+    _proto.__module__ = __name__
+    globals()[_proto.__name__] = _proto
+
+
+def _compose(index: int) -> type:
+    return compose_protocol(ProtocolSequence([PROTOCOLS[index]]))
+
+
+def _live(*indexes: int) -> set[str]:
+    cache = get_protocol_cache()
+    return {
+        name
+        for name in cache
+        if name.startswith("_AnonProtocol_")
+        and any(PROTOCOLS[i] in cache[name].__mro__ for i in indexes)
+    }
+
+
+@pytest.fixture(autouse=True)
+def _reset_policy() -> Iterator[None]:
+    clear_protocol_cache()
+    yield
+    set_eviction_policy(None)
+    clear_protocol_cache()
+
+
+def test_lru_keeps_most_recently_used() -> None:
+    """
+    测试：LRU 超出上限时淘汰最近最少使用的组合类。
+    """
+    set_eviction_policy(EvictionPolicy(max_entries=2, strategy="lru"))
+    c0, c1 = _compose(0), _compose(1)
+    assert _compose(0) is c0  # 访问 0，1 成为最久未使用
+    _compose(2)
+
+    assert c0.__name__ in get_protocol_cache()
+    assert c1.__name__ not in get_protocol_cache()
+    assert len(_live(0, 1, 2)) == 2
+
+
+def test_lfu_keeps_most_frequently_used() -> None:
+    """
+    测试：LFU 超出上限时淘汰访问次数最少的组合类。
+    """
+    set_eviction_policy(EvictionPolicy(max_entries=2, strategy="lfu"))
+    c0, c1 = _compose(0), _compose(1)
+    for _ in range(3):
+        _compose(1)
+    _compose(0)
+    _compose(2)
+
+    assert c1.__name__ in get_protocol_cache()
+    assert c0.__name__ not in get_protocol_cache()
+
+
+def test_ttl_evicts_idle_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    测试：闲置超过 ttl 的组合类在下一次入缓存时被淘汰。
+    """
+    now = [1000.0]
+    monkeypatch.setattr(protocol_eviction.time, "monotonic", lambda: now[0])
+    set_eviction_policy(EvictionPolicy(ttl=10.0))
+
+    c0 = _compose(0)
+    now[0] += 5
+    c1 = _compose(1)
+    now[0] += 6
+    _compose(2)
+
+    assert c0.__name__ not in get_protocol_cache()
+    assert c1.__name__ in get_protocol_cache()
+
+
+def test_ttl_checked_on_cache_hits(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    测试：没有新组合进入缓存时，命中路径也会淘汰闲置超时的组合类。
+    """
+    now = [1000.0]
+    monkeypatch.setattr(protocol_eviction.time, "monotonic", lambda: now[0])
+    set_eviction_policy(EvictionPolicy(ttl=10.0))
+
+    c0, c1 = _compose(0), _compose(1)
+    now[0] += 5
+    _compose(1)
+    now[0] += 6
+    assert c0.__name__ in get_protocol_cache()
+    assert _compose(1) is c1
+
+    assert c0.__name__ not in get_protocol_cache()
+    assert c1.__name__ in get_protocol_cache()
+
+
+def test_retained_recipes_are_bounded() -> None:
+    """
+    测试：被淘汰者保留的配方与反向索引同样受 max_entries 限制，不随组合数增长。
+    """
+    set_eviction_policy(EvictionPolicy(max_entries=2))
+    protocols = [new_class(f"T{i}", (Protocol,)) for i in range(40)]
+    for i in range(0, 40, 2):
+        compose_protocol(ProtocolSequence(protocols[i : i + 2]))
+
+    assert len(get_composition_cache()) == 2
+    assert len(protocol_cache._RECIPES) <= 4
+    assert sum(map(len, protocol_cache._DEPENDENTS.values())) <= 8
+
+    set_eviction_policy(None)
+    assert not protocol_cache._RECIPES
+    assert sum(map(len, protocol_cache._DEPENDENTS.values())) == 4
+
+
+def test_cache_hits_do_not_take_the_eviction_lock() -> None:
+    """
+    测试：开启淘汰策略后，缓存命中不取簿记锁。
+    """
+    set_eviction_policy(EvictionPolicy(max_entries=4))
+    c0 = _compose(0)
+    tracker = protocol_cache.get_eviction_tracker()
+    results: list[type] = []
+    with tracker._lock:
+        worker = threading.Thread(target=lambda: results.append(_compose(0)))
+        worker.start()
+        worker.join(timeout=5)
+    assert results == [c0]
+
+
+def test_pinned_entries_are_never_evicted() -> None:
+    """
+    测试：固定的组合类不参与淘汰，取消固定后重新参与。
+    """
+    set_eviction_policy(EvictionPolicy(max_entries=1))
+    c0 = _compose(0)
+    pin_protocol(name=c0.__name__)
+    _compose(1)
+    _compose(2)
+    assert c0.__name__ in get_protocol_cache()
+
+    unpin_protocol(name=c0.__name__)
+    _compose(3)
+    assert c0.__name__ not in get_protocol_cache()
+
+
+def test_evicted_class_is_recreated_on_demand() -> None:
+    """
+    测试：被淘汰的组合类按名称访问或 unpickle 时按配方重建，查找不会失败。
+    """
+    set_eviction_policy(EvictionPolicy(max_entries=1))
+    c0 = _compose(0)
+    payload = pickle.dumps(c0)
+    _compose(1)
+    assert c0.__name__ not in get_protocol_cache()
+
+    restored = pickle.loads(payload)
+    assert restored.__name__ == c0.__name__
+    assert PROTOCOLS[0] in restored.__mro__
+    assert get_protocol_cache()[c0.__name__] is restored
+    assert _compose(0) is restored
+
+    _compose(2)
+    again = get_protocol(name=restored.__name__)
+    assert again is not None and PROTOCOLS[0] in again.__mro__
+
+
+def test_enabling_policy_adopts_existing_entries() -> None:
+    """
+    测试：开启策略时接管已有组合类并立即淘汰超出部分；关闭后不再淘汰。
+    """
+    for i in range(4):
+        _compose(i)
+    set_eviction_policy(EvictionPolicy(max_entries=2))
+    assert len(_live(0, 1, 2, 3)) == 2
+    assert len(get_composition_cache()) == 2
+
+    set_eviction_policy(None)
+    for i in range(6):
+        _compose(i)
+    assert len(_live(0, 1, 2, 3, 4, 5)) == 6
+
+
+def test_invalid_policy_rejected() -> None:
+    with pytest.raises(ValueError):
+        set_eviction_policy(EvictionPolicy(max_entries=0))
+    with pytest.raises(ValueError):
+        set_eviction_policy(EvictionPolicy(strategy="mru"))  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        set_eviction_policy(EvictionPolicy(ttl=-time.monotonic()))
@@ -0,0 +1,102 @@
+from types import new_class
+from typing import Protocol
+
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.eviction_policy import EvictionPolicy
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_cache import (
+    clear_protocol_cache,
+    get_composition_cache,
+    get_protocol,
+    get_protocol_cache,
+    invalidate_protocol,
+    set_eviction_policy,
+)
+
+# ===== 示例协议 =====
+
+
+class A(Protocol):
+    def a(self) -> None: ...
+
+
+class B(Protocol):
+    def b(self) -> None: ...
+
+
+class C(Protocol):
+    def c(self) -> None: ...
+
+
+def _reload(proto: type) -> type:
+    """模拟重新加载：同模块、同限定名的新协议类对象。"""
+    fresh = new_class(proto.__name__, (Protocol,))
+    fresh.__module__ = proto.__module__
+    fresh.__qualname__ = proto.__qualname__
+    return fresh
+
+
+# ===== 选择性失效 =====
+
+
+def test_invalidates_only_dependents() -> None:
+    """
+    测试：只移除包含该协议的组合，其余组合保持缓存与类对象身份。
+    """
+    clear_protocol_cache()
+    ab = compose_protocol(ProtocolSequence([A, B]))
+    ac = compose_protocol(ProtocolSequence([A, C]), runtime=True)
+    bc = compose_protocol(ProtocolSequence([B, C]))
+
+    assert invalidate_protocol(A) == 2
+
+    cache = get_protocol_cache()
+    assert ab.__name__ not in cache and ac.__name__ not in cache
+    assert cache[bc.__name__] is bc
+    assert set(get_composition_cache().values()) == {bc}
+    assert compose_protocol(ProtocolSequence([B, C])) is bc
+    assert compose_protocol(ProtocolSequence([A, B])) is not ab
+
+
+def test_unknown_protocol_is_noop() -> None:
+    """
+    测试：没有依赖组合的协议返回 0，缓存不变。
+    """
+    clear_protocol_cache()
+    ab = compose_protocol(ProtocolSequence([A, B]))
+    assert invalidate_protocol(C) == 0
+    assert compose_protocol(ProtocolSequence([A, B])) is ab
+
+
+def test_reloaded_protocol_invalidates_old_compositions() -> None:
+    """
+    测试：传入重新加载后的同名协议即可清除由旧协议类组成的组合，
+    再组合时使用新的协议类，且类名不带碰撞后缀。
+    """
+    clear_protocol_cache()
+    old = compose_protocol(ProtocolSequence([A, B]), runtime=True)
+    fresh_a = _reload(A)
+
+    assert invalidate_protocol(fresh_a) == 1
+
+    new = compose_protocol(ProtocolSequence([fresh_a, B]), runtime=True)
+    assert new is not old
+    assert new.__name__ == old.__name__
+    assert fresh_a in new.__mro__ and A not in new.__mro__
+
+
+def test_invalidated_recipes_are_not_rebuilt() -> None:
+    """
+    测试：被淘汰但保留配方的组合同样失效，按名称访问不再重建。
+    """
+    clear_protocol_cache()
+    set_eviction_policy(EvictionPolicy(max_entries=1))
+    try:
+        ab = compose_protocol(ProtocolSequence([A, B]))
+        compose_protocol(ProtocolSequence([B, C]))
+        assert ab.__name__ not in get_protocol_cache()
+
+        assert invalidate_protocol(A) == 1
+        assert get_protocol(name=ab.__name__) is None
+    finally:
+        set_eviction_policy(None)
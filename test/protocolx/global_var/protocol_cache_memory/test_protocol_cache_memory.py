@@ -0,0 +1,103 @@
+import sys
+from typing import Protocol
+
+from protocolx.checker.conformance_cache import set_conformance_cache
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_cache import clear_protocol_cache
+from protocolx.global_var.protocol_cache_memory import (
+    ProtocolCacheMemory,
+    get_protocol_cache_memory,
+)
+
+# ===== 示例协议 =====
+
+
+class A(Protocol):
+    def a(self) -> None: ...
+
+
+class B(Protocol):
+    def b(self) -> None: ...
+
+
+class C(Protocol):
+    value: int
+
+
+class Impl:
+    value = 1
+
+    def a(self) -> None: ...
+
+    def b(self) -> None: ...
+
+
+def test_reports_each_cached_composition() -> None:
+    """
+    测试：每个缓存中的组合类各有一条明细且合计一致；非运行时组合没有检查设施。
+    """
+    clear_protocol_cache()
+    ab = compose_protocol(ProtocolSequence([A, B]), runtime="compiled")
+    bc = compose_protocol(ProtocolSequence([B, C]), runtime=False)
+
+    report = get_protocol_cache_memory()
+
+    assert isinstance(report, ProtocolCacheMemory)
+    entries = {c.name: c for c in report.compositions}
+    assert entries.keys() == {ab.__name__, bc.__name__}
+    for c in report.compositions:
+        assert c.class_size > 0 and c.mro > 0 and c.namespace > 0
+        assert c.total == c.class_size + c.mro + c.namespace + c.checkers
+    assert entries[ab.__name__].checkers > 0
+    assert entries[bc.__name__].checkers == 0
+    assert report.registry > 0
+    assert report.total == sum(c.total for c in report.compositions) + report.registry
+    assert report.sequences is None and report.sequence_count is None
+
+
+def test_checker_memory_grows_with_conformance_results() -> None:
+    """
+    测试：一致性缓存记录的类型越多，检查设施的占用越大。
+    """
+    clear_protocol_cache()
+    ab = compose_protocol(ProtocolSequence([A, B]), runtime=True)
+
+    def checkers() -> int:
+        (entry,) = get_protocol_cache_memory().compositions
+        return entry.checkers
+
+    set_conformance_cache(True)
+    try:
+        before = checkers()
+        for i in range(32):
+            isinstance(type(f"Impl{i}", (Impl,), {})(), ab)
+        assert checkers() > before
+    finally:
+        set_conformance_cache(False)
+
+
+def test_clear_drops_compositions() -> None:
+    """
+    测试：清空缓存后不再报告组合类。
+    """
+    compose_protocol(ProtocolSequence([A, C]))
+    clear_protocol_cache()
+    assert get_protocol_cache_memory().compositions == ()
+
+
+def test_live_sequences_counted_on_request() -> None:
+    """
+    测试：include_sequences=True 时统计存活的 ProtocolSequence 实例。
+    """
+    clear_protocol_cache()
+    before = get_protocol_cache_memory(include_sequences=True)
+    held = [ProtocolSequence([A, B, C]) for _ in range(10)]
+    for seq in held:
+        hash(seq)
+    after = get_protocol_cache_memory(include_sequences=True)
+
+    assert after.sequence_count is not None and before.sequence_count is not None
+    assert after.sequence_count - before.sequence_count == len(held)
+    assert after.sequences is not None and before.sequences is not None
+    assert after.sequences - before.sequences >= len(held) * sys.getsizeof(held[0])
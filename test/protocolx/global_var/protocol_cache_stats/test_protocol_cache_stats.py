@@ -0,0 +1,86 @@
+from typing import Protocol
+
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.eviction_policy import EvictionPolicy
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_cache import (
+    clear_protocol_cache,
+    get_composition_cache,
+    set_eviction_policy,
+)
+from protocolx.global_var.protocol_cache_stats import (
+    ProtocolCacheStats,
+    get_protocol_cache_stats,
+    reset_protocol_cache_stats,
+)
+
+
+class A(Protocol): ...
+
+
+class B(Protocol): ...
+
+
+class C(Protocol): ...
+
+
+def test_hits_misses_and_creations() -> None:
+    """
+    测试：一级缓存命中 / 未命中、实际创建次数与虚拟模块命中分别计数。
+    """
+    clear_protocol_cache()
+    reset_protocol_cache_stats()
+
+    ps = ProtocolSequence([A, B])
+    compose_protocol(ps)
+    compose_protocol(ps)
+    compose_protocol(ps)
+    get_composition_cache().clear()
+    compose_protocol(ps)  # 虚拟模块命中：未命中一级缓存但不创建
+
+    stats = get_protocol_cache_stats()
+    assert stats.hits == 2
+    assert stats.misses == 2
+    assert stats.creations == 1
+    assert stats.hit_ratio == 0.5
+    assert stats.creation_time_total > 0
+    assert 0 < stats.creation_time_p50 <= stats.creation_time_p99
+
+
+def test_validations_counted_once_per_sequence() -> None:
+    """
+    测试：每个 ProtocolSequence 只校验一次，重复访问不重复计数。
+    """
+    reset_protocol_cache_stats()
+
+    ps = ProtocolSequence([C, A])
+    list(ps)
+    len(ps)
+    hash(ps)
+    ProtocolSequence([B]).names
+
+    assert get_protocol_cache_stats().validations == 2
+
+
+def test_evictions_counted() -> None:
+    clear_protocol_cache()
+    reset_protocol_cache_stats()
+    set_eviction_policy(EvictionPolicy(max_entries=1))
+    try:
+        compose_protocol(ProtocolSequence([A]))
+        compose_protocol(ProtocolSequence([B]))
+        compose_protocol(ProtocolSequence([C]))
+    finally:
+        set_eviction_policy(None)
+
+    assert get_protocol_cache_stats().evictions == 2
+
+
+def test_reset_clears_everything() -> None:
+    clear_protocol_cache()
+    compose_protocol(ProtocolSequence([A, C]))
+    reset_protocol_cache_stats()
+
+    stats = get_protocol_cache_stats()
+    assert stats == ProtocolCacheStats(0, 0, 0, 0, 0, 0.0, 0.0, 0.0)
+    assert stats._asdict()["hits"] == 0
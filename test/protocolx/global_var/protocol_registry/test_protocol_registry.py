@@ -0,0 +1,114 @@
+import gc
+from typing import Protocol
+
+import pytest
+
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_registry import (
+    get_protocol_by_id,
+    get_protocol_id,
+    get_registered_protocol_count,
+    iter_mask_protocols,
+    peek_protocol_id,
+)
+
+
+class A(Protocol):
+    def a(self) -> None: ...
+
+
+class B(Protocol):
+    def b(self) -> None: ...
+
+
+class C(Protocol):
+    def c(self) -> None: ...
+
+
+# ===== 编号分配 =====
+
+
+def test_protocol_id_is_stable_and_unique() -> None:
+    """
+    测试：同一协议类编号稳定，不同协议类编号不同，可按编号取回。
+    """
+    ids = [get_protocol_id(p) for p in (A, B, C)]
+    assert ids == [get_protocol_id(p) for p in (A, B, C)]
+    assert len(set(ids)) == 3
+    assert [get_protocol_by_id(i) for i in ids] == [A, B, C]
+
+
+def test_sub_protocol_does_not_inherit_id() -> None:
+    """
+    测试：子协议拥有自己的编号，编号属性不被视为协议成员。
+    """
+
+    class SubA(A, Protocol):
+        def sub(self) -> None: ...
+
+    assert get_protocol_id(SubA) != get_protocol_id(A)
+    assert "_abc_protocolx_id" not in getattr(SubA, "__protocol_attrs__", ())
+
+
+def test_invalid_items_raise_type_error() -> None:
+    """
+    测试：非类型与非 Protocol 类型抛出 TypeError，且不会被注册。
+    """
+
+    class Plain:
+        pass
+
+    with pytest.raises(TypeError, match="not a type"):
+        get_protocol_id("A")
+    with pytest.raises(TypeError, match="not a subclass of Protocol"):
+        get_protocol_id(Plain)
+    assert peek_protocol_id(Plain) is None
+    assert peek_protocol_id("A") is None
+
+
+def test_dead_protocol_id_is_recycled() -> None:
+    """
+    测试：协议类被回收后编号失效，并被之后注册的协议复用，编号总数不增长。
+    """
+
+    def make() -> int:
+        class Temp(Protocol): ...
+
+        return get_protocol_id(Temp)
+
+    dead = make()
+    gc.collect()
+    with pytest.raises(LookupError):
+        get_protocol_by_id(dead)
+    before = get_registered_protocol_count()
+    for _ in range(10):
+        make()
+        gc.collect()
+    assert get_registered_protocol_count() == before
+
+
+# ===== 位掩码 =====
+
+
+def test_mask_round_trip() -> None:
+    """
+    测试：ProtocolSequence 的位掩码按编号升序还原出去重后的协议集合。
+    """
+    ps = ProtocolSequence([C, A, C, B])
+    protocols = list(iter_mask_protocols(ps.mask))
+    assert set(protocols) == {A, B, C}
+    assert protocols == sorted(protocols, key=get_protocol_id)
+
+
+def test_subset_superset_and_contains() -> None:
+    """
+    测试：子集 / 超集判断与成员判断基于位掩码，不触发排序。
+    """
+    small = ProtocolSequence([A])
+    big = ProtocolSequence([B, A])
+    assert small.issubset(big)
+    assert big.issuperset(small)
+    assert not big.issubset(small)
+    assert A in big and C not in big
+    assert "A" not in big
+    assert small._items is None and big._items is None
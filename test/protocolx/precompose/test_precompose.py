@@ -0,0 +1,174 @@
+import importlib
+import pickle
+import sys
+from types import ModuleType
+from typing import Protocol
+
+import pytest
+
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_cache import clear_protocol_cache
+from protocolx.global_var.protocol_cache_stats import (
+    get_protocol_cache_stats,
+    reset_protocol_cache_stats,
+)
+from protocolx.precompose import (
+    generate_precomposed_source,
+    write_precomposed_module,
+)
+
+# ===== 示例协议 =====
+
+
+class A(Protocol):
+    def a(self) -> None: ...
+
+
+class B(Protocol):
+    def b(self) -> None: ...
+
+
+class C(Protocol):
+    c: int
+
+
+class Impl:
+    c = 1
+
+    def a(self) -> None: ...
+
+    def b(self) -> None: ...
+
+
+class OnlyA:
+    def a(self) -> None: ...
+
+
+DECLARATIONS = [
+    ProtocolSequence([A, B]),
+    (ProtocolSequence([A, B]), "compiled"),
+    (ProtocolSequence([A, C]), "compiled"),
+    (ProtocolSequence([B, C]), False),
+]
+
+
+@pytest.fixture(scope="module")
+def generated(tmp_path_factory: pytest.TempPathFactory) -> ModuleType:
+    directory = tmp_path_factory.mktemp("precomposed")
+    write_precomposed_module(directory / "precomposed_demo.py", DECLARATIONS)
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.syspath_prepend(str(directory))
+    clear_protocol_cache()
+    module = importlib.import_module("precomposed_demo")
+    yield module
+    monkeypatch.undo()
+
+
+# ===== 生成与命中 =====
+
+
+def test_compose_hits_precomposed_classes(generated: ModuleType) -> None:
+    """
+    测试：导入生成的模块后，声明过的组合直接命中，不再动态创建，
+    返回的正是模块中的类对象。
+    """
+    reset_protocol_cache_stats()
+    for declaration in DECLARATIONS:
+        bases, runtime = (
+            declaration if isinstance(declaration, tuple) else (declaration, True)
+        )
+        cls = compose_protocol(bases, runtime=runtime)
+        assert getattr(generated, cls.__name__) is cls
+        assert cls.__module__ == "__anon_protocol__"
+    assert get_protocol_cache_stats().creations == 0
+
+
+def test_precomposed_survives_cache_clear(generated: ModuleType) -> None:
+    """
+    测试：清空缓存后再次组合，仍解析到模块中的同一个类对象。
+    """
+    before = compose_protocol(ProtocolSequence([A, B]), runtime="compiled")
+    clear_protocol_cache()
+    reset_protocol_cache_stats()
+    after = compose_protocol(ProtocolSequence([B, A]), runtime="compiled")
+    assert after is before
+    assert get_protocol_cache_stats().creations == 0
+
+
+def test_unknown_combination_falls_back(generated: ModuleType) -> None:
+    """
+    测试：未声明的组合照常动态创建。
+    """
+    reset_protocol_cache_stats()
+    cls = compose_protocol(ProtocolSequence([A, B, C]), runtime=True)
+    assert not hasattr(generated, cls.__name__)
+    assert get_protocol_cache_stats().creations == 1
+
+
+# ===== 行为一致 =====
+
+
+def test_precomposed_checks_match_dynamic(generated: ModuleType) -> None:
+    """
+    测试：预组合类的 isinstance / issubclass 结果与动态创建的类一致，
+    且可以 pickle 往返。
+    """
+    ab = compose_protocol(ProtocolSequence([A, B]), runtime="compiled")
+    ac = compose_protocol(ProtocolSequence([A, C]), runtime="compiled")
+    assert isinstance(Impl(), ab) and not isinstance(OnlyA(), ab)
+    assert issubclass(Impl, ab) and not issubclass(OnlyA, ab)
+    assert isinstance(Impl(), ac) and not isinstance(OnlyA(), ac)
+    with pytest.raises(TypeError):
+        issubclass(Impl, ac)
+    for cls in (ab, ac):
+        assert pickle.loads(pickle.dumps(cls)) is cls
+
+
+def test_static_precomposed_is_not_runtime(generated: ModuleType) -> None:
+    """
+    测试：runtime=False 的预组合类与动态创建时一样不支持 isinstance。
+    """
+    cls = compose_protocol(ProtocolSequence([B, C]))
+    with pytest.raises(TypeError):
+        isinstance(Impl(), cls)
+
+
+# ===== 输入校验 =====
+
+
+def test_rejects_unimportable_protocols() -> None:
+    """
+    测试：函数内定义的协议无法从生成的模块导入，生成时抛出 ValueError。
+    """
+
+    class Local(Protocol):
+        def local(self) -> None: ...
+
+    with pytest.raises(ValueError):
+        generate_precomposed_source([ProtocolSequence([A, Local])])
+
+
+def test_rejects_process_local_modules(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    测试：__main__ 中的协议与组合类（__anon_protocol__）即使在本进程可解析，也拒绝生成。
+    """
+
+    class Script(Protocol):
+        def script(self) -> None: ...
+
+    Script.__qualname__ = "Script"
+    Script.__module__ = "__main__"
+    monkeypatch.setattr(sys.modules["__main__"], "Script", Script, raising=False)
+    composed = compose_protocol(ProtocolSequence([A, B]))
+    for proto in (Script, composed):
+        with pytest.raises(ValueError):
+            generate_precomposed_source([ProtocolSequence([C, proto])])
+
+
+def test_rejects_non_sequence_declarations() -> None:
+    """
+    测试：声明必须是 ProtocolSequence。
+    """
+    with pytest.raises(TypeError):
+        generate_precomposed_source([((A, B), True)])  # type: ignore[list-item]
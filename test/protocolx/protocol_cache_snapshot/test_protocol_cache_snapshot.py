@@ -0,0 +1,145 @@
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from types import new_class
+from typing import Protocol
+
+import pytest
+
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.protocol_cache_snapshot import ProtocolCacheSnapshot
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_cache import (
+    clear_protocol_cache,
+    get_composition_cache,
+)
+from protocolx.global_var.protocol_cache_stats import (
+    get_protocol_cache_stats,
+    reset_protocol_cache_stats,
+)
+from protocolx.protocol_cache_snapshot import (
+    init_protocol_worker,
+    restore_protocol_cache,
+    snapshot_protocol_cache,
+)
+
+# ===== 示例协议 =====
+
+
+class A(Protocol):
+    def a(self) -> None: ...
+
+
+class B(Protocol):
+    def b(self) -> None: ...
+
+
+class C(Protocol):
+    c: int
+
+
+class Impl:
+    c = 1
+
+    def a(self) -> None: ...
+
+    def b(self) -> None: ...
+
+
+def _worker_state(cls: type) -> tuple[int, int, bool]:
+    """返回 worker 中 (已缓存组合数, 创建次数, isinstance 结果)。"""
+    cached = len(get_composition_cache())
+    result = isinstance(Impl(), cls)
+    return cached, get_protocol_cache_stats().creations, result
+
+
+# ===== 快照与恢复 =====
+
+
+def test_snapshot_is_compact() -> None:
+    """
+    测试：快照中每个协议只出现一次，组合以下标引用。
+    """
+    clear_protocol_cache()
+    compose_protocol(ProtocolSequence([A, B]))
+    compose_protocol(ProtocolSequence([A, C]), runtime="compiled")
+    snapshot = snapshot_protocol_cache()
+    assert isinstance(snapshot, ProtocolCacheSnapshot)
+    assert sorted(snapshot.protocols) == sorted(
+        f"{__name__}:{p.__qualname__}" for p in (A, B, C)
+    )
+    assert len(snapshot.compositions) == 2
+    assert pickle.loads(pickle.dumps(snapshot)) == snapshot
+
+
+def test_restore_rebuilds_in_bulk() -> None:
+    """
+    测试：清空缓存后按快照恢复，组合全部重建，之后组合全部命中。
+    """
+    clear_protocol_cache()
+    compose_protocol(ProtocolSequence([A, B]))
+    compose_protocol(ProtocolSequence([B, C]), runtime=True)
+    snapshot = snapshot_protocol_cache()
+    keys = set(get_composition_cache())
+
+    clear_protocol_cache()
+    assert restore_protocol_cache(snapshot) == 2
+    assert set(get_composition_cache()) == keys
+    reset_protocol_cache_stats()
+    compose_protocol(ProtocolSequence([C, B]), runtime=True)
+    assert get_protocol_cache_stats().misses == 0
+
+
+def test_restore_skips_missing_protocols() -> None:
+    """
+    测试：无法导入的协议对应的组合默认跳过，strict=True 时抛出异常。
+    """
+    snapshot = ProtocolCacheSnapshot(
+        (f"{__name__}:A", f"{__name__}:Missing"), (((0,), True), ((0, 1), True))
+    )
+    clear_protocol_cache()
+    assert restore_protocol_cache(snapshot) == 1
+    with pytest.raises(AttributeError):
+        restore_protocol_cache(snapshot, strict=True)
+
+
+def test_snapshot_skips_unimportable_protocols() -> None:
+    """
+    测试：按 module.qualname 找不回的协议（new_class 创建、组合类）所在的组合不写入快照。
+    """
+    clear_protocol_cache()
+    dynamic = new_class("Dynamic", (Protocol,))
+    composed = compose_protocol(ProtocolSequence([A, B]))
+    snapshot = snapshot_protocol_cache(
+        [
+            (ProtocolSequence([A, dynamic]), False),
+            (ProtocolSequence([C, composed]), False),
+            (ProtocolSequence([A, C]), True),
+        ]
+    )
+    assert sorted(snapshot.protocols) == [f"{__name__}:A", f"{__name__}:C"]
+    assert len(snapshot.compositions) == 1
+
+
+# ===== 进程池 =====
+
+
+def test_spawned_workers_are_rehydrated() -> None:
+    """
+    测试：spawn 进程池以 init_protocol_worker 初始化后，
+    worker 启动即持有全部组合，收到的组合类无需再创建。
+    """
+    clear_protocol_cache()
+    ab = compose_protocol(ProtocolSequence([A, B]), runtime="compiled")
+    compose_protocol(ProtocolSequence([A, C]), runtime=True)
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=context,
+        initializer=init_protocol_worker,
+        initargs=(snapshot_protocol_cache(),),
+    ) as pool:
+        cached, creations, result = pool.submit(_worker_state, ab).result()
+    assert cached == 2
+    assert creations == 2  # 只在 initializer 中创建
+    assert result is True
@@ -0,0 +1,126 @@
+from typing import Protocol
+from unittest.mock import patch
+
+import pytest
+
+from protocolx.checker.conformance_cache import invalidate_conformance_cache
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.protocol_dispatch import ProtocolDispatcher, protocol_dispatch
+
+# ===== 示例协议与实现 =====
+
+
+class Read(Protocol):
+    def read(self) -> bytes: ...
+
+
+class Write(Protocol):
+    def write(self, data: bytes) -> None: ...
+
+
+class Seek(Protocol):
+    def seek(self, pos: int) -> None: ...
+
+
+class Reader:
+    def read(self) -> bytes:
+        return b""
+
+
+class ReadWriter(Reader):
+    def write(self, data: bytes) -> None: ...
+
+
+class ReadSeeker(Reader):
+    def seek(self, pos: int) -> None: ...
+
+
+class Everything(ReadWriter, ReadSeeker):
+    pass
+
+
+def _describe() -> ProtocolDispatcher[str]:
+    @protocol_dispatch
+    def describe(obj: object) -> str:
+        """描述对象能力。"""
+        return "unknown"
+
+    @describe.register(ProtocolSequence([Read]))
+    def _(obj: object) -> str:
+        return "read"
+
+    describe.register(
+        compose_protocol(ProtocolSequence([Read, Write])), lambda obj: "read-write"
+    )
+    return describe
+
+
+# ===== 分派 =====
+
+
+def test_most_specific_handler_wins() -> None:
+    """
+    测试：按子集关系选择最大的满足集合；都不满足时使用兜底函数。
+    """
+    describe = _describe()
+    assert describe(Reader()) == "read"
+    assert describe(ReadWriter()) == "read-write"
+    assert describe(ReadSeeker()) == "read"
+    assert describe(object()) == "unknown"
+    assert describe.__doc__ == "描述对象能力。"
+
+
+def test_ambiguous_dispatch_raises() -> None:
+    """
+    测试：满足的集合中没有唯一最大者时抛出 RuntimeError。
+    """
+    describe = _describe()
+    describe.register(ProtocolSequence([Read, Seek]), lambda obj: "read-seek")
+    assert describe(ReadSeeker()) == "read-seek"
+    with pytest.raises(RuntimeError, match="Ambiguous dispatch"):
+        describe(Everything())
+    describe.register(ProtocolSequence([Read, Write, Seek]), lambda obj: "all")
+    assert describe(Everything()) == "all"
+
+
+def test_extra_arguments_are_forwarded() -> None:
+    """
+    测试：额外参数原样传给处理函数。
+    """
+
+    @protocol_dispatch
+    def size(obj: object, scale: int = 1) -> int:
+        return 0
+
+    @size.register(ProtocolSequence([Read]))
+    def _(obj: Reader, scale: int = 1) -> int:
+        return len(obj.read()) + scale
+
+    assert size(Reader(), scale=3) == 3
+    assert size(1, 5) == 0
+
+
+# ===== 缓存 =====
+
+
+def test_resolution_cached_per_type() -> None:
+    """
+    测试：同一类型只解析一次；登记新处理函数或 invalidate_conformance_cache 后重新解析。
+    """
+    describe = _describe()
+    with patch.object(
+        ProtocolDispatcher,
+        "_resolve",
+        autospec=True,
+        side_effect=ProtocolDispatcher._resolve,
+    ) as mock_resolve:
+        for _ in range(3):
+            describe(ReadWriter())
+        assert mock_resolve.call_count == 1
+        invalidate_conformance_cache(ReadWriter)
+        describe(ReadWriter())
+        assert mock_resolve.call_count == 2
+        describe.register(ProtocolSequence([Write]), lambda obj: "write")
+        describe(ReadWriter())
+        assert mock_resolve.call_count == 3
@@ -0,0 +1,143 @@
+import json
+from pathlib import Path
+from types import new_class
+from typing import Protocol
+
+import pytest
+
+from protocolx.compose_protocol import compose_protocol
+from protocolx.definition.type.protocol_sequence import ProtocolSequence
+from protocolx.global_var.protocol_cache import (
+    clear_protocol_cache,
+    get_composition_cache,
+)
+from protocolx.global_var.protocol_cache_stats import (
+    get_protocol_cache_stats,
+    reset_protocol_cache_stats,
+)
+from protocolx.warmup_manifest import (
+    preload_warmup_manifest,
+    start_composition_recording,
+    stop_composition_recording,
+    write_warmup_manifest,
+)
+
+# ===== 示例协议 =====
+
+
+class A(Protocol):
+    def a(self) -> None: ...
+
+
+class B(Protocol):
+    def b(self) -> None: ...
+
+
+class C(Protocol):
+    c: int
+
+
+# ===== 记录 =====
+
+
+def test_records_distinct_compositions_in_order() -> None:
+    """
+    测试：按首次解析顺序记录不同组合，含开始记录时已缓存的组合；重复命中不重复记录。
+    """
+    clear_protocol_cache()
+    compose_protocol(ProtocolSequence([A, B]))
+    start_composition_recording()
+    compose_protocol(ProtocolSequence([B, C]), runtime=True)
+    compose_protocol(ProtocolSequence([A, B]))
+    compose_protocol(ProtocolSequence([C, B]), runtime=True)
+    compose_protocol(ProtocolSequence([A, C]), runtime="compiled")
+    recorded = stop_composition_recording()
+    assert recorded == [
+        (ProtocolSequence([A, B]), False),
+        (ProtocolSequence([B, C]), True),
+        (ProtocolSequence([A, C]), "compiled"),
+    ]
+
+
+def test_nothing_recorded_when_inactive() -> None:
+    """
+    测试：停止记录后的组合不再被记录。
+    """
+    clear_protocol_cache()
+    start_composition_recording()
+    stop_composition_recording()
+    compose_protocol(ProtocolSequence([A, B]))
+    assert stop_composition_recording() == []
+
+
+# ===== 清单写入与预热 =====
+
+
+def test_manifest_round_trip(tmp_path: Path) -> None:
+    """
+    测试：写入清单后清空缓存，预热按清单重新组合全部组合，之后组合全部命中。
+    """
+    clear_protocol_cache()
+    start_composition_recording()
+    compose_protocol(ProtocolSequence([A, B]))
+    compose_protocol(ProtocolSequence([A, C]), runtime="compiled")
+    path = tmp_path / "warmup.json"
+    assert write_warmup_manifest(path) == 2
+    stop_composition_recording()
+
+    manifest = json.loads(path.read_text())
+    assert len(manifest["protocols"]) == 3
+
+    clear_protocol_cache()
+    assert preload_warmup_manifest(path) == 2
+    assert set(get_composition_cache()) == {
+        (ProtocolSequence([A, B]), False),
+        (ProtocolSequence([A, C]), "compiled"),
+    }
+    reset_protocol_cache_stats()
+    compose_protocol(ProtocolSequence([A, C]), runtime="compiled")
+    assert get_protocol_cache_stats().misses == 0
+
+
+def test_skips_unimportable_protocols(tmp_path: Path) -> None:
+    """
+    测试：含函数内定义或动态创建的协议的组合不写入清单。
+    """
+
+    class Local(Protocol):
+        def local(self) -> None: ...
+
+    path = tmp_path / "warmup.json"
+    compositions = [
+        (ProtocolSequence([A, Local]), False),
+        (ProtocolSequence([B, new_class("Dynamic", (Protocol,))]), False),
+        (ProtocolSequence([A, B]), True),
+    ]
+    assert write_warmup_manifest(path, compositions) == 1
+
+
+def test_missing_protocols_are_skipped_or_raise(tmp_path: Path) -> None:
+    """
+    测试：清单中无法导入的协议默认跳过对应组合，strict=True 时抛出异常。
+    """
+    path = tmp_path / "warmup.json"
+    write_warmup_manifest(path, [(ProtocolSequence([A, B]), True)])
+    manifest = json.loads(path.read_text())
+    manifest["protocols"].append(f"{__name__}:Missing")
+    manifest["compositions"].append([[0, 2], True])
+    path.write_text(json.dumps(manifest))
+
+    clear_protocol_cache()
+    assert preload_warmup_manifest(path) == 1
+    with pytest.raises(AttributeError):
+        preload_warmup_manifest(path, strict=True)
+
+
+def test_rejects_foreign_files(tmp_path: Path) -> None:
+    """
+    测试：非预热清单文件抛出 ValueError。
+    """
+    path = tmp_path / "other.json"
+    path.write_text(json.dumps({"compositions": []}))
+    with pytest.raises(ValueError):
+        preload_warmup_manifest(path)